@@ -35,6 +35,10 @@ class BasePairsTradingAlphaModel(AlphaModel):
         self.pairs = dict()
         self.securities = set()
 
+        # pair keys by symbol and the price indicators shared by the pairs of each symbol
+        self._pair_keys_by_symbol = dict()
+        self._price_indicators = dict()
+
         self.name = f'{self.__class__.__name__}({self.lookback},{resolution},{Extensions.normalize_to_str(threshold)})'
 
 
@@ -66,34 +70,111 @@ class BasePairsTradingAlphaModel(AlphaModel):
             if security in self.securities:
                 self.securities.remove(security)
 
-        self.update_pairs(algorithm)
+        self.update_pairs(algorithm, [x.symbol for x in changes.added_securities])
 
         for security in changes.removed_securities:
-            keys = [k for k in self.pairs.keys() if security.symbol in k]
-            for key in keys:
-                self.pairs.pop(key).dispose()
+            for key in self._pair_keys_by_symbol.pop(security.symbol, []):
+                self.remove_pair(algorithm, key)
+
+    def update_pairs(self, algorithm, added_symbols = None):
+        '''Creates the pairs that pass the pairs trading test
+        Args:
+            algorithm: The algorithm instance that experienced the change in securities
+            added_symbols: The symbols of the added securities. If None, every pair combination is tested'''
+        symbols = set(x.symbol for x in self.securities)
 
-    def update_pairs(self, algorithm):
+        for asset_i, asset_j in self.get_candidate_pairs(symbols, added_symbols):
+            pair_symbol = (asset_i, asset_j)
+            invert = (asset_j, asset_i)
 
-        symbols = sorted([x.symbol for x in self.securities])
+            if pair_symbol in self.pairs or invert in self.pairs:
+                continue
+
+            if not self.has_passed_test(algorithm, asset_i, asset_j):
+                continue
+
+            pair = self.Pair(algorithm, asset_i, asset_j, self.prediction_interval, self.threshold,
+                self.get_price_indicator(algorithm, asset_i), self.get_price_indicator(algorithm, asset_j))
+            self.pairs[pair_symbol] = pair
+            self._pair_keys_by_symbol.setdefault(asset_i, []).append(pair_symbol)
+            self._pair_keys_by_symbol.setdefault(asset_j, []).append(pair_symbol)
+
+    def get_candidate_pairs(self, symbols, added_symbols = None):
+        '''Gets the pairs to test, sorted, with the first asset lower than the second one.
+        Only the pairs with an added security are candidates since the others were already tested
+        Args:
+            symbols: The symbols of the securities in the universe
+            added_symbols: The symbols of the added securities. If None, every pair combination is a candidate
+        Returns:
+            The sorted list of candidate pairs'''
+        if added_symbols is None:
+            symbols = sorted(symbols)
+            return [(symbols[i], symbols[j]) for i in range(0, len(symbols)) for j in range(1 + i, len(symbols))]
+
+        candidates = set()
+        for asset in added_symbols:
+            if asset not in symbols:
+                continue
+            for other in symbols:
+                if other != asset:
+                    candidates.add(tuple(sorted((asset, other))))
+        return sorted(candidates)
+
+    def remove_pair(self, algorithm, key):
+        '''Removes the pair and releases the price indicators that are no longer used by any other pair
+        Args:
+            algorithm: The algorithm instance
+            key: The key of the pair'''
+        pair = self.pairs.pop(key, None)
+        if pair is None:
+            return
+
+        pair.dispose()
+        for symbol in key:
+            keys = self._pair_keys_by_symbol.get(symbol)
+            if keys is not None and key in keys:
+                keys.remove(key)
+            self.release_price_indicator(algorithm, symbol)
+
+    def get_price_indicator(self, algorithm, symbol):
+        '''Gets the Identity indicator of the symbol shared by all its pairs, creating it and
+        the consolidator it is registered to on first use
+        Args:
+            algorithm: The algorithm instance
+            symbol: The symbol of the asset
+        Returns:
+            The price indicator'''
+        entry = self._price_indicators.get(symbol)
+        if entry is None:
+            resolution = min([x.resolution for x in algorithm.subscription_manager.subscription_data_config_service.get_subscription_data_configs(symbol)])
 
-        for i in range(0, len(symbols)):
-            asset_i = symbols[i]
+            name = algorithm.create_indicator_name(symbol, "close", resolution)
+            identity = Identity(name)
 
-            for j in range(1 + i, len(symbols)):
-                asset_j = symbols[j]
+            consolidator = algorithm.resolve_consolidator(symbol, resolution)
+            algorithm.register_indicator(symbol, identity, consolidator)
 
-                pair_symbol = (asset_i, asset_j)
-                invert = (asset_j, asset_i)
+            # [indicator, consolidator, reference count]
+            entry = [identity, consolidator, 0]
+            self._price_indicators[symbol] = entry
 
-                if pair_symbol in self.pairs or invert in self.pairs:
-                    continue
+        entry[2] += 1
+        return entry[0]
 
-                if not self.has_passed_test(algorithm, asset_i, asset_j):
-                    continue
+    def release_price_indicator(self, algorithm, symbol):
+        '''Releases a reference to the price indicator of the symbol, the consolidator is
+        removed from the SubscriptionManager when no pair uses it anymore
+        Args:
+            algorithm: The algorithm instance
+            symbol: The symbol of the asset'''
+        entry = self._price_indicators.get(symbol)
+        if entry is None:
+            return
 
-                pair = self.Pair(algorithm, asset_i, asset_j, self.prediction_interval, self.threshold)
-                self.pairs[pair_symbol] = pair
+        entry[2] -= 1
+        if entry[2] <= 0:
+            self._price_indicators.pop(symbol)
+            algorithm.subscription_manager.remove_consolidator(symbol, entry[1])
 
     def has_passed_test(self, algorithm, asset1, asset2):
         '''Check whether the assets pass a pairs trading test
@@ -112,19 +193,23 @@ class BasePairsTradingAlphaModel(AlphaModel):
             FLAT_RATIO = 0
             LONG_RATIO = 1
 
-        def __init__(self, algorithm, asset1, asset2, prediction_interval, threshold):
+        def __init__(self, algorithm, asset1, asset2, prediction_interval, threshold, asset1_price = None, asset2_price = None):
             '''Create a new pair
             Args:
                 algorithm: The algorithm instance that experienced the change in securities
                 asset1: The first asset's symbol in the pair
                 asset2: The second asset's symbol in the pair
                 prediction_interval: Period over which this insight is expected to come to fruition
-                threshold: The percent [0, 100] deviation of the ratio from the mean before emitting an insight'''
+                threshold: The percent [0, 100] deviation of the ratio from the mean before emitting an insight
+                asset1_price: The price indicator of the first asset shared with other pairs. If None, the pair creates its own
+                asset2_price: The price indicator of the second asset shared with other pairs. If None, the pair creates its own'''
             self.state = self.State.FLAT_RATIO
 
             self.algorithm = algorithm
             self.asset1 = asset1
             self.asset2 = asset2
+            self.identity_consolidator1 = None
+            self.identity_consolidator2 = None
 
             # Created the Identity indicator for a given Symbol and
             # the consolidator it is registered to. The consolidator reference
@@ -140,8 +225,12 @@ class BasePairsTradingAlphaModel(AlphaModel):
 
                 return identity, consolidator
 
-            self.asset1_price, self.identity_consolidator1 = create_identity_indicator(asset1);
-            self.asset2_price, self.identity_consolidator2 = create_identity_indicator(asset2);
+            if asset1_price is None:
+                asset1_price, self.identity_consolidator1 = create_identity_indicator(asset1)
+            if asset2_price is None:
+                asset2_price, self.identity_consolidator2 = create_identity_indicator(asset2)
+            self.asset1_price = asset1_price
+            self.asset2_price = asset2_price
 
             self.ratio = IndicatorExtensions.over(self.asset1_price, self.asset2_price)
             self.mean = IndicatorExtensions.of(ExponentialMovingAverage(500), self.ratio)
@@ -156,10 +245,14 @@ class BasePairsTradingAlphaModel(AlphaModel):
 
         def dispose(self):
             '''
-            On disposal, remove the consolidators from the subscription manager
+            On disposal, remove the consolidators created by this pair from the subscription manager
+            and detach the ratio from the price indicators, which other pairs may still use
             '''
-            self.algorithm.subscription_manager.remove_consolidator(self.asset1, self.identity_consolidator1)
-            self.algorithm.subscription_manager.remove_consolidator(self.asset2, self.identity_consolidator2)
+            self.ratio.detach()
+            if self.identity_consolidator1 is not None:
+                self.algorithm.subscription_manager.remove_consolidator(self.asset1, self.identity_consolidator1)
+            if self.identity_consolidator2 is not None:
+                self.algorithm.subscription_manager.remove_consolidator(self.asset2, self.identity_consolidator2)
 
         def get_insight_group(self):
             '''Gets the insights group for the pair
@@ -20,13 +20,24 @@ class HistoricalReturnsAlphaModel(AlphaModel):
         '''Initializes a new default instance of the HistoricalReturnsAlphaModel class.
         Args:
             lookback(int): Historical return lookback period
-            resolution: The resolution of historical data'''
+            resolution: The resolution of historical data
+            batched(bool): If True, the returns are kept in arrays updated by the indicators and only the
+                           symbols that were updated since the last call are evaluated, in a single vectorized pass'''
         self.lookback = kwargs['lookback'] if 'lookback' in kwargs else 1
         self.resolution = kwargs['resolution'] if 'resolution' in kwargs else Resolution.DAILY
+        self.batched = kwargs['batched'] if 'batched' in kwargs else False
         self.prediction_interval = Time.multiply(Extensions.to_time_span(self.resolution), self.lookback)
         self._symbol_data_by_symbol = {}
         self.insight_collection = InsightCollection()
 
+        # state of the batched mode, indexed by the slot of each symbol
+        self._slot_by_symbol = {}
+        self._symbol_by_slot = []
+        self._free_slots = []
+        self._returns = np.zeros(0)
+        self._is_ready = np.zeros(0, dtype=bool)
+        self._updated_slots = set()
+
     def update(self, algorithm, data):
         '''Updates this alpha model with the latest data from the algorithm.
         This is called each time the algorithm receives data for subscribed securities
@@ -35,6 +46,9 @@ class HistoricalReturnsAlphaModel(AlphaModel):
             data: The new data available
         Returns:
             The new insights generated'''
+        if self.batched:
+            return self.update_batch(algorithm)
+
         insights = []
 
         for symbol, symbol_data in self._symbol_data_by_symbol.items():
@@ -54,6 +68,35 @@ class HistoricalReturnsAlphaModel(AlphaModel):
         self.insight_collection.add_range(insights)
         return insights
 
+    def update_batch(self, algorithm):
+        '''Creates the insights of the symbols whose returns were updated since the last call
+        Args:
+            algorithm: The algorithm instance
+        Returns:
+            The new insights generated'''
+        insights = []
+        if len(self._updated_slots) == 0:
+            return insights
+
+        slots = np.fromiter(self._updated_slots, dtype=np.int64, count=len(self._updated_slots))
+        slots.sort()
+        self._updated_slots.clear()
+
+        slots = slots[self._is_ready[slots]]
+        magnitudes = self._returns[slots]
+        up = magnitudes > 0
+        down = magnitudes < 0
+
+        for slot in slots[~(up | down)]:
+            self.cancel_insights(algorithm, self._symbol_by_slot[slot])
+
+        for slot, magnitude, is_up in zip(slots[up | down], magnitudes[up | down], up[up | down]):
+            direction = InsightDirection.UP if is_up else InsightDirection.DOWN
+            insights.append(Insight.price(self._symbol_by_slot[slot], self.prediction_interval, direction, float(magnitude), None))
+
+        self.insight_collection.add_range(insights)
+        return insights
+
     def on_securities_changed(self, algorithm, changes):
         '''Event fired each time the we add/remove securities from the data feed
         Args:
@@ -65,6 +108,7 @@ class HistoricalReturnsAlphaModel(AlphaModel):
             symbol_data = self._symbol_data_by_symbol.pop(removed.symbol, None)
             if symbol_data is not None:
                 symbol_data.remove_consolidators(algorithm)
+            self.remove_from_batch(removed.symbol)
             self.cancel_insights(algorithm, removed.symbol)
 
         # initialize data for added securities
@@ -79,9 +123,43 @@ class HistoricalReturnsAlphaModel(AlphaModel):
             if symbol not in self._symbol_data_by_symbol:
                 symbol_data = SymbolData(symbol, self.lookback)
                 self._symbol_data_by_symbol[symbol] = symbol_data
+                if self.batched:
+                    self.add_to_batch(symbol, symbol_data)
                 symbol_data.register_indicators(algorithm, self.resolution)
                 symbol_data.warm_up_indicators(history.loc[ticker])
 
+    def add_to_batch(self, symbol, symbol_data):
+        '''Assigns a slot of the batch arrays to the symbol, the rate of change indicator updates it'''
+        if len(self._free_slots) == 0:
+            size = len(self._returns)
+            capacity = max(16, 2 * size)
+            self._returns = np.concatenate([self._returns, np.zeros(capacity - size)])
+            self._is_ready = np.concatenate([self._is_ready, np.zeros(capacity - size, dtype=bool)])
+            self._symbol_by_slot.extend([None] * (capacity - size))
+            self._free_slots.extend(range(capacity - 1, size - 1, -1))
+
+        slot = self._free_slots.pop()
+        self._slot_by_symbol[symbol] = slot
+        self._symbol_by_slot[slot] = symbol
+        symbol_data.set_updated_handler(lambda roc, updated: self.on_return_updated(slot, roc, updated))
+
+    def remove_from_batch(self, symbol):
+        '''Releases the slot of the symbol in the batch arrays'''
+        slot = self._slot_by_symbol.pop(symbol, None)
+        if slot is None:
+            return
+        self._returns[slot] = 0
+        self._is_ready[slot] = False
+        self._symbol_by_slot[slot] = None
+        self._updated_slots.discard(slot)
+        self._free_slots.append(slot)
+
+    def on_return_updated(self, slot, roc, updated):
+        '''Event handler for the rate of change of the symbol in the given slot'''
+        self._returns[slot] = updated.value
+        self._is_ready[slot] = roc.is_ready
+        self._updated_slots.add(slot)
+
     def cancel_insights(self, algorithm, symbol):
         if not self.insight_collection.contains_key(symbol):
             return
@@ -97,18 +175,25 @@ class SymbolData:
         self.roc = RateOfChange('{}.roc({})'.format(symbol, lookback), lookback)
         self.consolidator = None
         self.previous = 0
+        self.updated_handler = None
 
     def register_indicators(self, algorithm, resolution):
         self.consolidator = algorithm.resolve_consolidator(self.symbol, resolution)
         algorithm.register_indicator(self.symbol, self.roc, self.consolidator)
 
+    def set_updated_handler(self, handler):
+        self.updated_handler = handler
+        self.roc.updated += handler
+
     def remove_consolidators(self, algorithm):
         if self.consolidator is not None:
             algorithm.subscription_manager.remove_consolidator(self.symbol, self.consolidator)
+        if self.updated_handler is not None:
+            self.roc.updated -= self.updated_handler
+            self.updated_handler = None
 
     def warm_up_indicators(self, history):
-        for tuple in history.itertuples():
-            self.roc.update(tuple.Index, tuple.close)
+        IndicatorExtensions.warm_up(self.roc, history.index, history.close.values)
 
     @property
     def return_(self):
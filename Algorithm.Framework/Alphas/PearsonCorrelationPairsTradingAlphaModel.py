@@ -13,7 +13,6 @@
 
 from AlgorithmImports import *
 from Alphas.BasePairsTradingAlphaModel import BasePairsTradingAlphaModel
-from scipy.stats import pearsonr
 
 class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
     ''' This alpha model is designed to rank every pair combination by its pearson correlation
@@ -23,19 +22,26 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
     def __init__(self, lookback = 15,
             resolution = Resolution.MINUTE,
             threshold = 1,
-            minimum_correlation = .5):
+            minimum_correlation = .5,
+            cache_history = False):
         '''Initializes a new instance of the PearsonCorrelationPairsTradingAlphaModel class
         Args:
             lookback: lookback period of the analysis
             resolution: analysis resolution
             threshold: The percent [0, 100] deviation of the ratio from the mean before emitting an insight
-            minimum_correlation: The minimum correlation to consider a tradable pair'''
+            minimum_correlation: The minimum correlation to consider a tradable pair
+            cache_history: If True, keeps the prices between security changes and only requests the history of the new
+                           securities and the bars that were not seen by previous requests'''
         super().__init__(lookback, resolution, threshold)
         self.lookback = lookback
         self.resolution = resolution
         self.minimum_correlation = minimum_correlation
+        self.cache_history = cache_history
         self.best_pair = ()
 
+        self._prices_by_symbol = {}
+        self._prices_time = None
+
     def on_securities_changed(self, algorithm, changes):
         '''Event fired each time the we add/remove securities from the data feed.
         Args:
@@ -51,27 +57,99 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
 
         symbols = sorted([ x.symbol for x in self.securities ])
 
-        history = algorithm.history(symbols, self.lookback, self.resolution)
+        history = self.get_close_prices(algorithm, symbols)
 
         if not history.empty:
-            history = history.close.unstack(level=0)
-
             df = self.get_price_dataframe(history)
-            stop = len(df.columns)
-
-            corr = dict()
 
-            for i in range(0, stop):
-                for j in range(i+1, stop):
-                    if (j, i) not in corr:
-                        corr[(i, j)] = pearsonr(df.iloc[:,i], df.iloc[:,j])[0]
-
-            corr = sorted(corr.items(), key = lambda kv: kv[1])
-            if corr[-1][1] >= self.minimum_correlation:
-                self.best_pair = (symbols[corr[-1][0][0]], symbols[corr[-1][0][1]])
+            pairs = self.rank_pairs(df, 1)
+            if len(pairs) > 0 and pairs[0][1] >= self.minimum_correlation:
+                (i, j), _ = pairs[0]
+                self.best_pair = (symbols[i], symbols[j])
 
         super().on_securities_changed(algorithm, changes)
 
+    def rank_pairs(self, returns, count = 1):
+        '''Ranks every pair of columns by the pearson correlation of their returns
+        Args:
+            returns: Matrix of returns where each column represents a security and each row returns for the given date/time (size: K x N)
+            count: The number of pairs to return
+        Returns:
+            List of ((i, j), correlation) with the column indexes of the most correlated pairs, sorted by descending correlation'''
+        size = returns.shape[1]
+        if size < 2:
+            return []
+
+        # a single call computes the full correlation matrix, constant columns have undefined (NaN) correlation
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation = np.corrcoef(np.asarray(returns, dtype=float), rowvar=False)
+
+        rows, columns = np.triu_indices(size, 1)
+        values = correlation[rows, columns]
+        values = np.where(np.isnan(values), -np.inf, values)
+
+        candidates = np.arange(len(values))
+        count = min(count, len(values))
+        if count < len(values):
+            threshold = values[np.argpartition(-values, count - 1)[count - 1]]
+            candidates = np.flatnonzero(values >= threshold)
+
+        # ties are broken in favor of the last pair in (i, j) order
+        order = candidates[np.lexsort((candidates, values[candidates]))[::-1]][:count]
+        return [((rows[k], columns[k]), values[k]) for k in order]
+
+    def get_close_prices(self, algorithm, symbols):
+        '''Gets the close prices of the lookback period
+        Args:
+            algorithm: The algorithm instance
+            symbols: The symbols of the securities, sorted
+        Returns:
+            Data frame of close prices with a column per symbol'''
+        if not self.cache_history:
+            history = algorithm.history(symbols, self.lookback, self.resolution)
+            return history if history.empty else history.close.unstack(level=0)
+
+        for symbol in set(self._prices_by_symbol).difference(symbols):
+            self._prices_by_symbol.pop(symbol)
+
+        # bring the cached prices up to date, then request the full lookback for the symbols without prices
+        cached = [x for x in symbols if x in self._prices_by_symbol]
+        if len(cached) > 0 and algorithm.time > self._prices_time:
+            self.add_close_prices(algorithm.history(cached, self._prices_time, algorithm.time, self.resolution))
+        missing = [x for x in symbols if x not in self._prices_by_symbol]
+        if len(missing) > 0:
+            self.add_close_prices(algorithm.history(missing, self.lookback, self.resolution))
+        self._prices_time = algorithm.time
+
+        prices = [self._prices_by_symbol[x] for x in symbols if x in self._prices_by_symbol]
+        return pd.DataFrame({ column: series for column, series in prices })
+
+    def add_close_prices(self, history):
+        '''Appends the close prices of a history request to the cached prices, keeping the lookback period'''
+        if history.empty:
+            return
+
+        history = history.close.unstack(level=0)
+        for column in history:
+            symbol = SymbolCache.get_symbol(column)
+            series = history[column].dropna()
+            cached = self._prices_by_symbol.get(symbol)
+            if cached is not None and not cached[1].empty:
+                series = pd.concat([cached[1], series[series.index > cached[1].index[-1]]])
+            self._prices_by_symbol[symbol] = (column, series.iloc[-self.lookback:])
+
+    def get_candidate_pairs(self, symbols, added_symbols = None):
+        '''Gets the pairs to test. The best pair is the only candidate since it is the only one
+        that passes the test, and it can be formed by securities that were added before
+        Args:
+            symbols: The symbols of the securities in the universe
+            added_symbols: The symbols of the added securities
+        Returns:
+            The list of candidate pairs'''
+        if len(self.best_pair) == 2 and all(x in symbols for x in self.best_pair):
+            return [self.best_pair]
+        return []
+
     def has_passed_test(self, algorithm, asset1, asset2):
         '''Check whether the assets pass a pairs trading test
         Args:
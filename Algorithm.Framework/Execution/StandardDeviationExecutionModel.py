@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from SharedIndicatorPool import SharedIndicatorPool
 
 class StandardDeviationExecutionModel(ExecutionModel):
     '''Execution model that submits orders while the current market prices is at least the configured number of standard
@@ -77,9 +78,15 @@ class StandardDeviationExecutionModel(ExecutionModel):
         Args:
             algorithm: The algorithm instance that experienced the change in securities
             changes: The security additions and removals from the algorithm'''
+        pool = SharedIndicatorPool.get(algorithm)
+        added_data = []
         for added in changes.added_securities:
             if added.symbol not in self._symbol_data:
-                self._symbol_data[added.symbol] = SymbolData(algorithm, added, self.period, self.resolution)
+                data = SymbolData(algorithm, added, self.period, self.resolution, pool)
+                self._symbol_data[added.symbol] = data
+                added_data.append(data)
+
+        self.warm_up(algorithm, added_data)
 
         for removed in changes.removed_securities:
             # clean up data from removed securities
@@ -87,8 +94,27 @@ class StandardDeviationExecutionModel(ExecutionModel):
             if symbol in self._symbol_data:
                 if self.is_safe_to_remove(algorithm, symbol):
                     data = self._symbol_data.pop(symbol)
-                    algorithm.subscription_manager.remove_consolidator(symbol, data.consolidator)
+                    data.dispose()
+
 
+    def warm_up(self, algorithm, symbol_data):
+        '''Warms up the new indicators of the added securities with a single history request
+        Args:
+            algorithm: The algorithm instance
+            symbol_data: The symbol data of the added securities'''
+        symbol_data = [data for data in symbol_data if data.needs_warm_up]
+        if len(symbol_data) == 0:
+            return
+
+        history = algorithm.history([data.security.symbol for data in symbol_data], self.period, self.resolution)
+        if history.empty or 'close' not in history.columns:
+            return
+
+        data_by_symbol = {data.security.symbol: data for data in symbol_data}
+        for symbol, close in history['close'].groupby(level='symbol'):
+            data = data_by_symbol.get(symbol)
+            if data is not None:
+                data.warm_up(close.index.get_level_values('time'), close.values)
 
     def price_is_favorable(self, data, unordered_quantity):
         '''Determines if the current price is more than the configured
@@ -104,24 +130,41 @@ class StandardDeviationExecutionModel(ExecutionModel):
     def is_safe_to_remove(self, algorithm, symbol):
         '''Determines if it's safe to remove the associated symbol data'''
         # confirm the security isn't currently a member of any universe
-        return not any([kvp.value.contains_member(symbol) for kvp in algorithm.universe_manager])
+        return not algorithm.universe_manager.contains_member(symbol)
 
 class SymbolData:
-    def __init__(self, algorithm, security, period, resolution):
+    def __init__(self, algorithm, security, period, resolution, pool = None):
         symbol = security.symbol
         self.security = security
-        self.consolidator = algorithm.resolve_consolidator(symbol, resolution)
+        self.resolution = resolution
+        self._pool = pool if pool is not None else SharedIndicatorPool.get(algorithm)
 
-        sma_name = algorithm.create_indicator_name(symbol, f"SMA{period}", resolution)
-        self.sma = SimpleMovingAverage(sma_name, period)
-        algorithm.register_indicator(symbol, self.sma, self.consolidator)
+        # the SMA and STD are shared with the other models using the same indicators of the symbol
+        self.sma_name = f"SMA{period}"
+        self.sma, new_sma = self._pool.acquire(symbol, resolution, self.sma_name, lambda name: SimpleMovingAverage(name, period))
 
-        std_name = algorithm.create_indicator_name(symbol, f"STD{period}", resolution)
-        self.std = StandardDeviation(std_name, period)
-        algorithm.register_indicator(symbol, self.std, self.consolidator)
+        self.std_name = f"STD{period}"
+        self.std, new_std = self._pool.acquire(symbol, resolution, self.std_name, lambda name: StandardDeviation(name, period))
 
-        # warmup our indicators by pushing history through the indicators
-        bars = algorithm.history[self.consolidator.input_type](symbol, period, resolution)
-        for bar in bars:
-            self.sma.update(bar.end_time, bar.close)
-            self.std.update(bar.end_time, bar.close)
+        self.consolidator = self._pool.consolidator(symbol, resolution)
+        self._indicators_to_warm_up = [indicator for indicator, new in [(self.sma, new_sma), (self.std, new_std)] if new]
+
+    @property
+    def needs_warm_up(self):
+        '''True if this symbol data created any of its indicators'''
+        return len(self._indicators_to_warm_up) > 0
+
+    def warm_up(self, times, closes):
+        '''Pushes the history through the indicators created by this symbol data
+        Args:
+            times: The end times of the bars
+            closes: The close prices of the bars'''
+        for indicator in self._indicators_to_warm_up:
+            IndicatorExtensions.warm_up(indicator, times, closes)
+        self._indicators_to_warm_up = []
+
+    def dispose(self):
+        '''Releases the shared indicators, the consolidator is removed when no other model uses them'''
+        symbol = self.security.symbol
+        self._pool.release(symbol, self.resolution, self.sma_name)
+        self._pool.release(symbol, self.resolution, self.std_name)
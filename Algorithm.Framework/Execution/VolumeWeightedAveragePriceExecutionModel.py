@@ -47,7 +47,7 @@ class VolumeWeightedAveragePriceExecutionModel(ExecutionModel):
 
                 # fetch our symbol data containing our VWAP indicator
                 data = self.symbol_data.get(symbol, None)
-                if data is None: return
+                if data is None: continue
 
                 # check order entry conditions
                 if self.price_is_favorable(data, unordered_quantity):
@@ -92,7 +92,7 @@ class VolumeWeightedAveragePriceExecutionModel(ExecutionModel):
     def is_safe_to_remove(self, algorithm, symbol):
         '''Determines if it's safe to remove the associated symbol data'''
         # confirm the security isn't currently a member of any universe
-        return not any([kvp.value.contains_member(symbol) for kvp in algorithm.universe_manager])
+        return not algorithm.universe_manager.contains_member(symbol)
 
 class SymbolData:
     def __init__(self, algorithm, security):
@@ -111,7 +111,7 @@ class IntradayVwap:
     def __init__(self, name):
         self.name = name
         self.value = 0.0
-        self.last_date = datetime.min
+        self.last_date = date.min
         self.sum_of_volume = 0.0
         self.sum_of_price_times_volume = 0.0
 
@@ -12,6 +12,9 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from bisect import bisect_right
+from heapq import heappop, heappush
+from itertools import count
 from EqualWeightingPortfolioConstructionModel import EqualWeightingPortfolioConstructionModel
 
 class AccumulativeInsightPortfolioConstructionModel(EqualWeightingPortfolioConstructionModel):
@@ -40,36 +43,110 @@ class AccumulativeInsightPortfolioConstructionModel(EqualWeightingPortfolioConst
         self.portfolio_bias = portfolio_bias
         self.percent = abs(percent)
         self.sign = lambda x: -1 if x < 0 else (1 if x > 0 else 0)
+        # running state of the active insights, sorted by generated time, and their accumulated percent by symbol
+        self.insights_by_symbol = {}
+        self.percent_by_symbol = {}
+        # the insights of a symbol from this index on were added since its percent was accumulated
+        self.first_new_index_by_symbol = {}
+        self.symbols_to_update = set()
+        self.expirations = []
+        self.sequence = count()
+        # version of the algorithm insights the running state matches, None until the first rebalance
+        self.insights_version = None
 
     def determine_target_percent(self, active_insights):
         '''Will determine the target percent for each insight
         Args:
             active_insights: The active insights to generate a target for'''
-        percent_per_symbol = {}
+        self.expire_insights(self.current_utc_time)
 
-        insights = sorted(self.algorithm.insights.get_active_insights(self.current_utc_time), key=lambda insight: insight.generated_time_utc)
+        for symbol in self.symbols_to_update:
+            self.update_percent(symbol)
+        self.symbols_to_update.clear()
 
-        for insight in insights:
+        return dict((insight, self.percent_by_symbol[insight.symbol]) for insight in active_insights)
+
+    def accumulate(self, target_percent, direction):
+        '''Applies an insight direction to the accumulated target percent of its symbol
+        Args:
+            target_percent: The accumulated target percent of the previous insights of the symbol, None if there are none
+            direction: The direction of the insight
+        Returns:
+            The new accumulated target percent'''
+        if target_percent is None:
             target_percent = 0
-            if insight.symbol in percent_per_symbol:
-                target_percent = percent_per_symbol[insight.symbol]
-                if insight.direction == InsightDirection.FLAT:
-                    # We received a Flat
-                    # if adding or subtracting will push past 0, then make it 0
-                    if abs(target_percent) < self.percent:
-                        target_percent = 0
-                    else:
-                        # otherwise, we flatten by percent
-                        target_percent += (-self.percent if target_percent > 0 else self.percent)
-            target_percent += self.percent * insight.direction
-
-            # adjust to respect portfolio bias
-            if self.portfolio_bias != PortfolioBias.LONG_SHORT and self.sign(target_percent) != self.portfolio_bias:
+        elif direction == InsightDirection.FLAT:
+            # We received a Flat
+            # if adding or subtracting will push past 0, then make it 0
+            if abs(target_percent) < self.percent:
                 target_percent = 0
+            else:
+                # otherwise, we flatten by percent
+                target_percent += (-self.percent if target_percent > 0 else self.percent)
+        target_percent += self.percent * direction
+
+        # adjust to respect portfolio bias
+        if self.portfolio_bias != PortfolioBias.LONG_SHORT and self.sign(target_percent) != self.portfolio_bias:
+            target_percent = 0
+
+        return target_percent
+
+    def add_insights(self, insights):
+        '''Adds new insights to the running state, only their symbols are accumulated again
+        Args:
+            insights: The new insights'''
+        for insight in insights:
+            symbol = insight.symbol
+            entry = (insight.generated_time_utc, insight.direction, insight)
+            entries = self.insights_by_symbol.setdefault(symbol, [])
 
-            percent_per_symbol[insight.symbol] = target_percent
+            if len(entries) == 0 or entries[-1][0] <= entry[0]:
+                entries.append(entry)
+                # insights generated in order continue from the accumulated percent
+                self.first_new_index_by_symbol.setdefault(symbol, len(entries) - 1)
+            else:
+                index = bisect_right([x[0] for x in entries], entry[0])
+                entries.insert(index, entry)
+                self.first_new_index_by_symbol[symbol] = 0
 
-        return dict((insight, percent_per_symbol[insight.symbol]) for insight in active_insights)
+            heappush(self.expirations, (insight.close_time_utc, next(self.sequence), symbol, insight))
+            self.symbols_to_update.add(symbol)
+
+    def expire_insights(self, utc_time):
+        '''Removes the expired insights from the running state, their symbols are accumulated again from zero
+        Args:
+            utc_time: The current UTC time'''
+        while len(self.expirations) > 0 and self.expirations[0][0] < utc_time:
+            _, _, symbol, insight = heappop(self.expirations)
+            entries = self.insights_by_symbol[symbol]
+            entries[:] = [x for x in entries if x[2] is not insight]
+            self.first_new_index_by_symbol[symbol] = 0
+            self.symbols_to_update.add(symbol)
+
+    def reset_insights(self, active_insights):
+        '''Rebuilds the running state from the active insights of the algorithm
+        Args:
+            active_insights: All the active insights of the algorithm'''
+        self.insights_by_symbol.clear()
+        self.percent_by_symbol.clear()
+        self.first_new_index_by_symbol.clear()
+        self.expirations.clear()
+        self.add_insights(sorted(active_insights, key=lambda insight: insight.generated_time_utc))
+
+    def update_percent(self, symbol):
+        '''Accumulates the insights of the symbol that changed since the last update'''
+        entries = self.insights_by_symbol.get(symbol, [])
+        start = self.first_new_index_by_symbol.pop(symbol, 0)
+        target_percent = self.percent_by_symbol.get(symbol) if start > 0 else None
+
+        for _, direction, _ in entries[start:]:
+            target_percent = self.accumulate(target_percent, direction)
+
+        if len(entries) == 0:
+            self.insights_by_symbol.pop(symbol, None)
+            self.percent_by_symbol.pop(symbol, None)
+        else:
+            self.percent_by_symbol[symbol] = target_percent
 
     def create_targets(self, algorithm, insights):
         '''Create portfolio targets from the specified insights
@@ -79,4 +156,15 @@ class AccumulativeInsightPortfolioConstructionModel(EqualWeightingPortfolioConst
         Returns:
             An enumerable of portfolio targets to be sent to the execution model'''
         self.current_utc_time = algorithm.utc_time
-        return super().create_targets(algorithm, insights)
+
+        # the insights were added to the algorithm insights right before this call. Any other change, like insights
+        # cancelled, cleared or added without going through create_targets, invalidates the running state
+        if self.insights_version is None or algorithm.insights.version != self.insights_version + len(insights):
+            self.reset_insights(algorithm.insights.get_active_insights(self.current_utc_time))
+        else:
+            self.add_insights(insights)
+
+        targets = super().create_targets(algorithm, insights)
+        # the rebalance removes the insights the running state already expired from the algorithm insights
+        self.insights_version = algorithm.insights.version
+        return targets
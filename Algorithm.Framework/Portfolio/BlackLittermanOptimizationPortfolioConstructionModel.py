@@ -13,6 +13,8 @@
 
 from AlgorithmImports import *
 from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
+from Portfolio.ReturnsWindow import ReturnsWindow
+from Portfolio.RollingReturnsMatrix import RollingReturnsMatrix
 from itertools import groupby
 from numpy import dot, transpose
 from numpy.linalg import inv
@@ -66,6 +68,7 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         self.sign = lambda x: -1 if x < 0 else (1 if x > 0 else 0)
         self.symbol_data_by_symbol = {}
+        self._returns = RollingReturnsMatrix(period)
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancing_func
@@ -86,22 +89,24 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         # Get view vectors
         p, q = self.get_views(last_active_insights)
         if p is not None:
-            returns = dict()
             # Updates the BlackLittermanSymbolData with insights
-            # Create a dictionary keyed by the symbols in the insights with an pandas.Series as value to create a data frame
             for insight in last_active_insights:
                 symbol = insight.symbol
-                symbol_data = self.symbol_data_by_symbol.get(symbol, self.BlackLittermanSymbolData(symbol, self.lookback, self.period))
+                symbol_data = self.symbol_data_by_symbol.get(symbol)
+                if symbol_data is None:
+                    symbol_data = self.BlackLittermanSymbolData(symbol, self.lookback, self.period, self._returns)
+                    self.symbol_data_by_symbol[symbol] = symbol_data
                 if insight.magnitude is None:
                     self.algorithm.set_run_time_error(ArgumentNullException('BlackLittermanOptimizationPortfolioConstructionModel does not accept \'None\' as Insight.magnitude. Please make sure your Alpha Model is generating Insights with the Magnitude property set.'))
                     return targets
                 symbol_data.add(insight.generated_time_utc, insight.magnitude)
-                returns[symbol] = symbol_data.return_
 
-            returns = pd.DataFrame(returns)
+            # The rolling returns matrix keeps the mean and covariance of the returns up to date
+            symbols = list(dict.fromkeys(insight.symbol for insight in last_active_insights))
+            returns = self._returns.returns(symbols)
 
             # Calculate prior estimate of the mean and covariance
-            pi, sigma = self.get_equilibrium_return(returns)
+            pi, sigma = self.get_equilibrium_return(returns, self._returns.mean(symbols), self._returns.covariance(symbols))
 
             # Calculate posterior estimate of the mean and covariance
             pi, sigma = self.apply_blacklitterman_master_formula(pi, sigma, p, q)
@@ -162,10 +167,10 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             if str(symbol) not in symbols:
                 continue
 
-            symbol_data = self.symbol_data_by_symbol.get(symbol, self.BlackLittermanSymbolData(symbol, self.lookback, self.period))
-            for time, close in history[symbol].items():
-                utc_time = Extensions.convert_to_utc(time, timezone)
-                symbol_data.update(utc_time, close)
+            symbol_data = self.symbol_data_by_symbol.get(symbol)
+            if symbol_data is None:
+                symbol_data = self.BlackLittermanSymbolData(symbol, self.lookback, self.period, self._returns)
+            symbol_data.warm_up(history[symbol], timezone)
 
             self.symbol_data_by_symbol[symbol] = symbol_data
 
@@ -196,10 +201,12 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         return Pi, Sigma
 
-    def get_equilibrium_return(self, returns):
+    def get_equilibrium_return(self, returns, mean = None, covariance = None):
         '''Calculate equilibrium returns and covariance
         Args:
             returns: Matrix of returns where each column represents a security and each row returns for the given date/time (size: K x N)
+            mean: Array of double with the mean of the returns (size: K x 1). If None, it is computed from the returns
+            covariance: Multi-dimensional array of double with the covariance of the returns (size: K x K). If None, it is computed from the returns
         Returns:
             equilibrium_return: Array of double of equilibrium returns
             cov: Multi-dimensional array of double with the portfolio covariance of returns (size: K x K)'''
@@ -208,9 +215,14 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         # equal weighting scheme
         W = np.array([1/size]*size)
         # the covariance matrix of excess returns (N x N matrix)
-        cov = returns.cov()*252
+        if covariance is None:
+            cov = returns.cov()*252
+        else:
+            cov = pd.DataFrame(covariance*252, index = returns.columns, columns = returns.columns)
+        if mean is None:
+            mean = returns.mean()
         # annualized return
-        annual_return = np.sum(((1 + returns.mean())**252 -1) * W)
+        annual_return = np.sum(((1 + mean)**252 -1) * W)
         # annualized variance of return
         annual_variance = dot(W.T, dot(cov, W))
         # the risk aversion coefficient
@@ -271,36 +283,44 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
     class BlackLittermanSymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, period, returns = None):
             self._symbol = symbol
             self.roc = RateOfChange(f'{symbol}.roc({lookback})', lookback)
             self.roc.updated += self.on_rate_of_change_updated
-            self.window = RollingWindow(period)
+            self.window = ReturnsWindow(period)
+            self._returns = returns
 
         def reset(self):
             self.roc.updated -= self.on_rate_of_change_updated
             self.roc.reset()
             self.window.reset()
+            if self._returns is not None:
+                self._returns.remove(self._symbol)
 
         def update(self, utc_time, close):
             self.roc.update(utc_time, close)
 
+        def warm_up(self, history, timezone):
+            IndicatorExtensions.warm_up(self.roc, history.index, history.values, timezone)
+
         def on_rate_of_change_updated(self, roc, value):
             if roc.is_ready:
-                self.window.add(value)
+                time = value.end_time
+                self.window.add(time, value.value)
+                if self._returns is not None:
+                    self._returns.add(self._symbol, time, value.value)
 
         def add(self, time, value):
-            if self.window.samples > 0 and self.window[0].end_time == time:
+            if self.window.last_time == ReturnsWindow.to_nanoseconds(time):
                 return
 
-            item = IndicatorDataPoint(self._symbol, time, value)
-            self.window.add(item)
+            self.window.add(time, value)
+            if self._returns is not None:
+                self._returns.add(self._symbol, time, value)
 
         @property
         def return_(self):
-            return pd.Series(
-                data = [x.value for x in self.window],
-                index = [x.end_time for x in self.window])
+            return self.window.to_series()
 
         @property
         def is_ready(self):
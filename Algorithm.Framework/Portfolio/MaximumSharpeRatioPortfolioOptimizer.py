@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from scipy.optimize import minimize
+from Portfolio.MinimumVarianceSolver import MinimumVarianceSolver
 
 ### <summary>
 ### Provides an implementation of a portfolio optimizer that maximizes the portfolio Sharpe Ratio.
@@ -26,16 +27,21 @@ class MaximumSharpeRatioPortfolioOptimizer:
     def __init__(self,
                  minimum_weight = -1,
                  maximum_weight = 1,
-                 risk_free_rate = 0):
+                 risk_free_rate = 0,
+                 use_fast_solver = False):
         '''Initialize the MaximumSharpeRatioPortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
             maximum_weight(float): The upper bounds on portfolio weights
-            risk_free_rate(float): The risk free rate'''
+            risk_free_rate(float): The risk free rate
+            use_fast_solver(bool): If True, solves in closed form when the bounds are not binding, otherwise uses analytic
+                                   jacobians and warm-starts from the weights of the previous optimization'''
         self.minimum_weight = minimum_weight
         self.maximum_weight = maximum_weight
         self.risk_free_rate = risk_free_rate
         self.expected_returns = []
+        self.use_fast_solver = use_fast_solver
+        self._solver = MinimumVarianceSolver(minimum_weight, maximum_weight) if use_fast_solver else None
 
     def optimize(self, historical_returns, expected_returns = None, covariance = None):
         '''
@@ -53,10 +59,18 @@ class MaximumSharpeRatioPortfolioOptimizer:
             expected_returns = historical_returns.mean()
         expected_returns = expected_returns - self.risk_free_rate
 
-        size = covariance.columns.size   # K x 1
+        size = covariance.shape[0]   # K x 1
         x0 = np.array(size * [1. / size])
         k = expected_returns.dot(x0)
 
+        if self.use_fast_solver:
+            weights = self._solver.solve(covariance,
+                np.vstack([np.asarray(expected_returns, dtype=float), np.ones(size)]),   # (µ − r_f)^T w = k and Σw = 1
+                [k, 1],
+                getattr(covariance, 'columns', None),
+                lambda weights: self.portfolio_variance(weights, covariance))
+            return x0 if weights is None else weights
+
         # Sharpe Maximization under Quadratic Constraints
         # https://quant.stackexchange.com/questions/18521/sharpe-maximization-under-quadratic-constraints
         # (µ − r_f)^T w = k
@@ -13,6 +13,9 @@
 
 from AlgorithmImports import *
 from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.ReturnsWindow import ReturnsWindow
+from Portfolio.PortfolioOptimizerMoments import optimize_with_moments
+from Portfolio.RollingReturnsMatrix import RollingReturnsMatrix
 
 ### <summary>
 ### Provides an implementation of Mean-Variance portfolio optimization based on modern portfolio theory.
@@ -51,6 +54,7 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         self.optimizer = MinimumVariancePortfolioOptimizer(lower, upper, target_return) if optimizer is None else optimizer
 
         self.symbol_data_by_symbol = {}
+        self._returns = RollingReturnsMatrix(period)
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancing_func
@@ -86,14 +90,16 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         if len(active_insights) == 0:
             return targets
 
-        symbols = [insight.symbol for insight in active_insights]
+        symbols = set(insight.symbol for insight in active_insights)
+        symbols = [symbol for symbol in self.symbol_data_by_symbol if symbol in symbols]
 
-        # Create a dictionary keyed by the symbols in the insights with an pandas.series as value to create a data frame
-        returns = { str(symbol.id) : data.return_ for symbol, data in self.symbol_data_by_symbol.items() if symbol in symbols }
-        returns = pd.DataFrame(returns)
+        # The rolling returns matrix keeps the mean and covariance of the returns up to date
+        returns = self._returns.returns(symbols, [str(symbol.id) for symbol in symbols])
+        expected_returns = self._returns.mean(symbols)
+        covariance = self._returns.covariance(symbols)
 
         # The portfolio optimizer finds the optional weights for the given data
-        weights = self.optimizer.optimize(returns)
+        weights = optimize_with_moments(self.optimizer, returns, expected_returns, covariance)
         weights = pd.Series(weights, index = returns.columns)
 
         # Create portfolio targets from the specified insights
@@ -122,7 +128,7 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         # initialize data for added securities
         symbols = [x.symbol for x in changes.added_securities]
         for symbol in [x for x in symbols if x not in self.symbol_data_by_symbol]:
-            self.symbol_data_by_symbol[symbol] = self.MeanVarianceSymbolData(symbol, self.lookback, self.period)
+            self.symbol_data_by_symbol[symbol] = self.MeanVarianceSymbolData(symbol, self.lookback, self.period, self._returns)
 
         history = algorithm.history[TradeBar](symbols, self.lookback * self.period, self.resolution)
         for bars in history:
@@ -131,36 +137,38 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
 
     class MeanVarianceSymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, period, returns = None):
             self._symbol = symbol
             self.roc = RateOfChange(f'{symbol}.roc({lookback})', lookback)
             self.roc.updated += self.on_rate_of_change_updated
-            self.window = RollingWindow(period)
+            self.window = ReturnsWindow(period)
+            self._returns = returns
 
         def reset(self):
             self.roc.updated -= self.on_rate_of_change_updated
             self.roc.reset()
             self.window.reset()
+            if self._returns is not None:
+                self._returns.remove(self._symbol)
 
         def update(self, time, value):
             return self.roc.update(time, value)
 
         def on_rate_of_change_updated(self, roc, value):
             if roc.is_ready:
-                self.window.add(value)
+                self.add(value.end_time, value.value)
 
         def add(self, time, value):
-            item = IndicatorDataPoint(self._symbol, time, value)
-            self.window.add(item)
+            self.window.add(time, value)
+            if self._returns is not None:
+                self._returns.add(self._symbol, time, value)
 
         # Get symbols' returns, we use simple return according to
         # Meucci, Attilio, Quant Nugget 2: Linear vs. Compounded Returns – Common Pitfalls in Portfolio Management (May 1, 2010).
         # GARP Risk Professional, pp. 49-51, April 2010 , Available at SSRN: https://ssrn.com/abstract=1586656
         @property
         def return_(self):
-            return pd.Series(
-                data = [x.value for x in self.window],
-                index = [x.end_time for x in self.window])
+            return self.window.to_series()
 
         @property
         def is_ready(self):
@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from scipy.optimize import minimize
+from Portfolio.MinimumVarianceSolver import MinimumVarianceSolver
 
 ### <summary>
 ### Provides an implementation of a portfolio optimizer that calculate the optimal weights
@@ -25,15 +26,20 @@ class MinimumVariancePortfolioOptimizer:
     def __init__(self,
                  minimum_weight = -1,
                  maximum_weight = 1,
-                 target_return = 0.02):
+                 target_return = 0.02,
+                 use_fast_solver = False):
         '''Initialize the MinimumVariancePortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
             maximum_weight(float): The upper bounds on portfolio weights
-            target_return(float): The target portfolio return'''
+            target_return(float): The target portfolio return
+            use_fast_solver(bool): If True, solves in closed form when the bounds are not binding, otherwise uses analytic
+                                   jacobians and warm-starts from the weights of the previous optimization'''
         self.minimum_weight = minimum_weight
         self.maximum_weight = maximum_weight
         self.target_return = target_return
+        self.use_fast_solver = use_fast_solver
+        self._solver = MinimumVarianceSolver(minimum_weight, maximum_weight) if use_fast_solver else None
 
     def optimize(self, historical_returns, expected_returns = None, covariance = None):
         '''
@@ -53,6 +59,17 @@ class MinimumVariancePortfolioOptimizer:
         size = historical_returns.columns.size   # K x 1
         x0 = np.array(size * [1. / size])
 
+        if self.use_fast_solver:
+            weights = self._solver.solve(covariance,
+                np.vstack([np.ones(size), np.asarray(expected_returns, dtype=float)]),   # Σw = 1 and µ^T w = target return
+                [1, self.target_return],
+                historical_returns.columns,
+                lambda weights: self.portfolio_variance(weights, covariance))
+            if weights is None: return x0
+
+            # Scale the solution to ensure that the sum of the absolute weights is 1
+            return weights / np.sum(np.abs(weights))
+
         constraints = [
             {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights)},
             {'type': 'eq', 'fun': lambda weights: self.get_target_constraint(weights, expected_returns)}]
@@ -91,4 +108,4 @@ class MinimumVariancePortfolioOptimizer:
 
     def get_target_constraint(self, weights, expected_returns):
         '''Ensure that the portfolio return target a given return'''
-        return np.dot(np.matrix(expected_returns), np.matrix(weights).T).item() - self.target_return
+        return np.dot(np.asarray(expected_returns, dtype=float), weights) - self.target_return
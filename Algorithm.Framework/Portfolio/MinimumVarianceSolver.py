@@ -0,0 +1,128 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from scipy.optimize import minimize
+
+### <summary>
+### Solves the minimum variance problem shared by the portfolio optimizers:
+### minimize w^T.S.w subject to A.w = b and lower <= w <= upper.
+### The closed-form solution of the KKT system is used when the bounds are not binding, otherwise
+### SLSQP is called with analytic jacobians and warm-started from the weights of the previous call.
+### </summary>
+class MinimumVarianceSolver:
+    '''Solves the minimum variance problem with linear equality constraints and bounds'''
+    def __init__(self,
+                 minimum_weight = -1,
+                 maximum_weight = 1,
+                 tolerance = 1e-9):
+        '''Initialize the MinimumVarianceSolver
+        Args:
+            minimum_weight(float): The lower bounds on portfolio weights
+            maximum_weight(float): The upper bounds on portfolio weights
+            tolerance(float): The tolerance used to decide if the closed-form solution is within the bounds'''
+        self.minimum_weight = minimum_weight
+        self.maximum_weight = maximum_weight
+        self.tolerance = tolerance
+        self._previous_weights = None
+        self._previous_weights_by_label = {}
+
+    def solve(self, covariance, constraints_matrix, constraints_vector, labels = None, objective = None):
+        '''Solves the problem
+        Args:
+            covariance: Multi-dimensional array of double with the covariance of returns (size: K x K)
+            constraints_matrix: Multi-dimensional array of double with the left-hand side of the equality constraints (size: M x K)
+            constraints_vector: Array of double with the right-hand side of the equality constraints (size: M x 1)
+            labels: The labels of the assets, used to warm-start from the previous solution. If None, the previous solution is used when the size matches
+            objective: The objective function. If None, the portfolio variance w^T.S.w is used
+        Returns:
+            Array of double with the portfolio weights (size: K x 1) or None if no solution was found'''
+        covariance = np.asarray(covariance, dtype=float)
+        constraints_matrix = np.atleast_2d(np.asarray(constraints_matrix, dtype=float))
+        constraints_vector = np.asarray(constraints_vector, dtype=float).ravel()
+
+        weights = self.solve_closed_form(covariance, constraints_matrix, constraints_vector)
+        if weights is None:
+            weights = self.solve_numerically(covariance, constraints_matrix, constraints_vector, labels, objective)
+
+        if weights is not None:
+            self._previous_weights = weights
+            if labels is not None:
+                self._previous_weights_by_label = dict(zip(labels, weights))
+        return weights
+
+    def solve_closed_form(self, covariance, constraints_matrix, constraints_vector):
+        '''Solves the KKT system of the problem without bounds:
+            | 2S  A^T | | w |   | 0 |
+            | A   0   | | l | = | b |
+        Returns:
+            The weights if the system has a unique solution within the bounds, None otherwise'''
+        size = covariance.shape[0]
+        count = constraints_matrix.shape[0]
+
+        kkt = np.zeros((size + count, size + count))
+        kkt[:size, :size] = 2 * covariance
+        kkt[:size, size:] = constraints_matrix.T
+        kkt[size:, :size] = constraints_matrix
+        rhs = np.concatenate([np.zeros(size), constraints_vector])
+
+        if not np.all(np.isfinite(kkt)):
+            return None
+        try:
+            solution = np.linalg.solve(kkt, rhs)
+        except np.linalg.LinAlgError:
+            return None
+
+        # near singular systems return a solution that doesn't satisfy the constraints
+        if not np.all(np.isfinite(solution)) or not np.allclose(kkt @ solution, rhs):
+            return None
+
+        weights = solution[:size]
+        if np.any(weights < self.minimum_weight - self.tolerance) or np.any(weights > self.maximum_weight + self.tolerance):
+            return None
+
+        return np.clip(weights, self.minimum_weight, self.maximum_weight)
+
+    def solve_numerically(self, covariance, constraints_matrix, constraints_vector, labels = None, objective = None):
+        '''Solves the problem with SLSQP using analytic jacobians for the objective and the constraints
+        Returns:
+            The weights if the optimization succeeded, None otherwise'''
+        size = covariance.shape[0]
+        if objective is None:
+            objective = lambda weights: weights @ covariance @ weights
+
+        constraints = {
+            'type': 'eq',
+            'fun': lambda weights: constraints_matrix @ weights - constraints_vector,
+            'jac': lambda weights: constraints_matrix }
+
+        # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
+        opt = minimize(objective,                                                 # Objective function
+                       self.get_initial_guess(size, labels),                      # Initial guess
+                       jac = lambda weights: 2 * covariance @ weights,            # Gradient of the objective function
+                       bounds = tuple((self.minimum_weight, self.maximum_weight) for x in range(size)),
+                       constraints = constraints,                                 # Constraints definition
+                       method='SLSQP')     # Optimization method:  Sequential Least Squares Programming (SLSQP)
+
+        return opt['x'] if opt['success'] else None
+
+    def get_initial_guess(self, size, labels = None):
+        '''Gets the weights of the previous solution for the assets that are still in the portfolio
+        and equal weights for the others'''
+        x0 = np.array(size * [1. / size])
+        if labels is not None and self._previous_weights_by_label:
+            for i, label in enumerate(labels):
+                x0[i] = self._previous_weights_by_label.get(label, x0[i])
+        elif labels is None and self._previous_weights is not None and len(self._previous_weights) == size:
+            x0 = self._previous_weights.copy()
+        return np.clip(x0, self.minimum_weight, self.maximum_weight)
@@ -0,0 +1,41 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+from Portfolio.UnconstrainedMeanVariancePortfolioOptimizer import UnconstrainedMeanVariancePortfolioOptimizer
+
+def optimize_with_moments(optimizer, historical_returns, expected_returns = None, covariance = None):
+    '''Calls the optimizer with the precomputed moments when it is one of the Python portfolio optimizers of the framework.
+    Any other optimizer, like a user defined one, is called with the historical returns alone
+    Args:
+        optimizer: The portfolio optimizer
+        historical_returns: Matrix of annualized historical returns where each column represents a security and each row returns for the given date/time (size: K x N)
+        expected_returns: Array of double with the mean of the historical returns, computed with the available observations (size: K x 1)
+        covariance: Multi-dimensional array of double with the covariance of the historical returns, computed with pairwise complete observations (size: K x K)
+    Returns:
+        The weights computed by the optimizer'''
+    optimizer_type = type(optimizer)
+
+    # These optimizers default to pandas mean and cov, which skip the missing returns like the precomputed moments
+    if optimizer_type in (MinimumVariancePortfolioOptimizer, MaximumSharpeRatioPortfolioOptimizer, UnconstrainedMeanVariancePortfolioOptimizer):
+        return optimizer.optimize(historical_returns, expected_returns = expected_returns, covariance = covariance)
+
+    # RiskParityPortfolioOptimizer defaults to np.cov, which doesn't skip the missing returns.
+    # Both covariances are the same when the returns are complete
+    if optimizer_type is RiskParityPortfolioOptimizer and covariance is not None and not historical_returns.isna().values.any():
+        return optimizer.optimize(historical_returns, covariance = covariance)
+
+    return optimizer.optimize(historical_returns)
@@ -0,0 +1,97 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+
+### <summary>
+### Fixed size window of returns backed by preallocated arrays of float64 values and int64 timestamps (nanoseconds).
+### Every item is written twice, at i and i + size, so the items in time order are always a contiguous slice
+### of the arrays and can be exposed as read-only views without copying or allocating.
+### The views change when returns are added, to_series copies them for the callers that keep the returns.
+### </summary>
+class ReturnsWindow:
+    '''Ring buffer of returns with zero-copy ordered views'''
+    def __init__(self, size):
+        '''Initialize the ReturnsWindow
+        Args:
+            size(int): The number of returns kept in the window'''
+        self.size = size
+        self._values = np.full(2 * size, np.nan)
+        self._times = np.zeros(2 * size, dtype=np.int64)
+        self.reset()
+
+    def reset(self):
+        '''Removes all the returns of the window'''
+        self._values.fill(np.nan)
+        self._times.fill(0)
+        self._head = 0
+        self.count = 0
+        self.samples = 0
+
+    def add(self, time, value):
+        '''Adds a return to the window, dropping the oldest return if the window is full
+        Args:
+            time: The time associated with the return
+            value(float): The return'''
+        time = self.to_nanoseconds(time)
+        head = self._head
+        self._values[head] = self._values[head + self.size] = value
+        self._times[head] = self._times[head + self.size] = time
+        self._head = (head + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+        self.samples += 1
+
+    @property
+    def is_ready(self):
+        '''True when the window is full'''
+        return self.count == self.size
+
+    @property
+    def values(self):
+        '''Read-only view of the returns, oldest first. The next add can overwrite the values of the view'''
+        return self._view(self._values)
+
+    @property
+    def times(self):
+        '''Read-only view of the timestamps in nanoseconds, oldest first. The next add can overwrite the values of the view'''
+        return self._view(self._times)
+
+    @property
+    def last_time(self):
+        '''The timestamp in nanoseconds of the most recent return or None if the window is empty'''
+        return None if self.count == 0 else int(self._times[self._head + self.size - 1])
+
+    def to_series(self):
+        '''Gets a copy of the returns as a series indexed by time, oldest first, that later adds don't change'''
+        return pd.Series(self.values.copy(), index=pd.DatetimeIndex(self.times.view('datetime64[ns]').copy()), copy=False)
+
+    def __getitem__(self, index):
+        '''Gets the return at the given index, where 0 is the most recent, as in RollingWindow'''
+        if not 0 <= index < self.count:
+            raise IndexError(f'ReturnsWindow index {index} out of range, the window has {self.count} returns')
+        return self._values[self._head + self.size - 1 - index]
+
+    def __len__(self):
+        return self.count
+
+    def _view(self, array):
+        end = self._head + self.size
+        view = array[end - self.count:end]
+        view.flags.writeable = False
+        return view
+
+    @staticmethod
+    def to_nanoseconds(time):
+        '''Converts a datetime, pandas Timestamp or numpy datetime64 to a timestamp in nanoseconds'''
+        return pd.Timestamp(time).value
@@ -13,6 +13,9 @@
 
 from AlgorithmImports import *
 from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+from Portfolio.ReturnsWindow import ReturnsWindow
+from Portfolio.PortfolioOptimizerMoments import optimize_with_moments
+from Portfolio.RollingReturnsMatrix import RollingReturnsMatrix
 
 ### <summary>
 ### Risk Parity Portfolio Construction Model
@@ -51,6 +54,7 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
         self.optimizer = RiskParityPortfolioOptimizer() if optimizer is None else optimizer
 
         self._symbol_data_by_symbol = {}
+        self._returns = RollingReturnsMatrix(period)
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancing_func
@@ -75,14 +79,15 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
         if len(active_insights) == 0:
             return targets
 
-        symbols = [insight.symbol for insight in active_insights]
+        symbols = set(insight.symbol for insight in active_insights)
+        symbols = [symbol for symbol in self._symbol_data_by_symbol if symbol in symbols]
 
-        # Create a dictionary keyed by the symbols in the insights with an pandas.series as value to create a data frame
-        returns = { str(symbol) : data.return_ for symbol, data in self._symbol_data_by_symbol.items() if symbol in symbols }
-        returns = pd.DataFrame(returns)
+        # The rolling returns matrix keeps the covariance of the returns up to date
+        returns = self._returns.returns(symbols, [str(symbol) for symbol in symbols])
+        covariance = self._returns.covariance(symbols)
 
         # The portfolio optimizer finds the optional weights for the given data
-        weights = self.optimizer.optimize(returns)
+        weights = optimize_with_moments(self.optimizer, returns, covariance = covariance)
         weights = pd.Series(weights, index = returns.columns)
 
         # Create portfolio targets from the specified insights
@@ -114,41 +119,42 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
             symbol = SymbolCache.get_symbol(ticker)
 
             if symbol not in self._symbol_data_by_symbol:
-                symbol_data = self.RiskParitySymbolData(symbol, self.lookback, self.period)
+                symbol_data = self.RiskParitySymbolData(symbol, self.lookback, self.period, self._returns)
                 symbol_data.warm_up_indicators(history.loc[ticker])
                 self._symbol_data_by_symbol[symbol] = symbol_data
                 algorithm.register_indicator(symbol, symbol_data.roc, self.resolution)
 
     class RiskParitySymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, period, returns = None):
             self._symbol = symbol
             self.roc = RateOfChange(f'{symbol}.roc({lookback})', lookback)
             self.roc.updated += self.on_rate_of_change_updated
-            self.window = RollingWindow(period)
+            self.window = ReturnsWindow(period)
+            self._returns = returns
 
         def reset(self):
             self.roc.updated -= self.on_rate_of_change_updated
             self.roc.reset()
             self.window.reset()
+            if self._returns is not None:
+                self._returns.remove(self._symbol)
 
         def warm_up_indicators(self, history):
-            for tuple in history.itertuples():
-                self.roc.update(tuple.Index, tuple.close)
+            IndicatorExtensions.warm_up(self.roc, history.index, history.close.values)
 
         def on_rate_of_change_updated(self, roc, value):
             if roc.is_ready:
-                self.window.add(value)
+                self.add(value.end_time, value.value)
 
         def add(self, time, value):
-            item = IndicatorDataPoint(self._symbol, time, value)
-            self.window.add(item)
+            self.window.add(time, value)
+            if self._returns is not None:
+                self._returns.add(self._symbol, time, value)
 
         @property
         def return_(self):
-            return pd.Series(
-                data = [x.value for x in self.window],
-                index = [x.end_time for x in self.window])
+            return self.window.to_series()
 
         @property
         def is_ready(self):
@@ -0,0 +1,256 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+from collections import deque
+
+### <summary>
+### Array-backed rolling matrix of returns shared by the optimization based portfolio construction models.
+### Each column keeps the last `period` returns of a symbol and each row holds the returns observed at a given time.
+### The sums of cross products are updated incrementally when a return is added or dropped from a column,
+### so the mean and covariance are available without rebuilding a data frame from every symbol's window.
+### </summary>
+### <remarks>The covariance matches pandas.DataFrame.cov: it is computed with pairwise complete observations.</remarks>
+class RollingReturnsMatrix:
+    '''Array-backed rolling matrix of returns with incremental mean and covariance'''
+    def __init__(self, period):
+        '''Initialize the RollingReturnsMatrix
+        Args:
+            period(int): The number of returns kept for each column'''
+        self.period = period
+        self.reset()
+
+    def reset(self):
+        '''Removes all the columns and returns of the matrix'''
+        self._column_by_key = {}
+        self._free_columns = []
+        self._rows_by_column = {}
+        self._row_by_time = {}
+        self._time_by_row = {}
+        self._free_rows = []
+        self._rows_since_recompute = 0
+        self._values = np.full((0, 0), np.nan)
+        self._referenced = np.zeros((0, 0), dtype=bool)
+        self._references_by_row = np.zeros(0, dtype=np.int64)
+        # running sums over the rows: x^T.x, x^T.m and m^T.m where x are the returns (zero when missing) and m the mask of valid returns
+        self._sum_of_products = np.zeros((0, 0))
+        self._sum_of_pairs = np.zeros((0, 0))
+        self._count_of_pairs = np.zeros((0, 0))
+
+    def add(self, key, time, value):
+        '''Adds a return to the column of the given key, dropping its oldest return if the column is full
+        Args:
+            key: The key of the column, usually the symbol
+            time: The time associated with the return
+            value(float): The return'''
+        column = self._column_by_key.get(key)
+        if column is None:
+            column = self._add_column(key)
+
+        row = self._row_by_time.get(time)
+        if row is None:
+            row = self._add_row(time)
+
+        self._set(row, column, float(value))
+        if self._referenced[row, column]:
+            # the column already has a return for this time, it was replaced
+            return
+
+        self._referenced[row, column] = True
+        self._references_by_row[row] += 1
+        rows = self._rows_by_column[column]
+        rows.append(row)
+        if len(rows) > self.period:
+            self._release(rows.popleft(), column)
+
+    def remove(self, key):
+        '''Removes the column of the given key and all its returns
+        Args:
+            key: The key of the column, usually the symbol'''
+        column = self._column_by_key.pop(key, None)
+        if column is None:
+            return
+
+        # the running sums of a column only live in its row and column of the sum matrices
+        for row in self._rows_by_column.pop(column):
+            self._values[row, column] = np.nan
+            self._referenced[row, column] = False
+            self._dereference(row)
+        for sums in (self._sum_of_products, self._sum_of_pairs, self._count_of_pairs):
+            sums[column, :] = 0
+            sums[:, column] = 0
+        self._free_columns.append(column)
+
+    def count(self, key):
+        '''Gets the number of returns in the column of the given key'''
+        column = self._column_by_key.get(key)
+        return 0 if column is None else len(self._rows_by_column[column])
+
+    def mean(self, keys):
+        '''Gets the mean of the returns of each of the given columns, ignoring missing values
+        Args:
+            keys: The keys of the columns
+        Returns:
+            Array of double with the mean returns (size: K x 1)'''
+        columns, found = self._get_columns(keys)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.diag(self._sum_of_pairs)[columns] / np.diag(self._count_of_pairs)[columns]
+        mean[~found] = np.nan
+        return mean
+
+    def covariance(self, keys):
+        '''Gets the covariance of the returns of the given columns computed with pairwise complete observations
+        Args:
+            keys: The keys of the columns
+        Returns:
+            Multi-dimensional array of double with the covariance of the returns (size: K x K)'''
+        columns, found = self._get_columns(keys)
+        index = np.ix_(columns, columns)
+        sums = self._sum_of_pairs[index]
+        counts = self._count_of_pairs[index]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            covariance = (self._sum_of_products[index] - sums * sums.T / counts) / (counts - 1)
+        covariance[counts < 2] = np.nan
+        covariance[~found, :] = np.nan
+        covariance[:, ~found] = np.nan
+        return covariance
+
+    def returns(self, keys, columns = None):
+        '''Gets the returns of the given columns ordered by time
+        Args:
+            keys: The keys of the columns
+            columns: The labels of the columns of the data frame. If None, the keys are used
+        Returns:
+            Matrix of returns where each column represents a security and each row returns for the given date/time (size: K x N)'''
+        keys = list(keys)
+        indexes, found = self._get_columns(keys)
+        values = self._values[:, indexes]
+        values[:, ~found] = np.nan
+        rows = list(np.flatnonzero(self._referenced[:, indexes][:, found].any(axis=1)))
+        rows.sort(key=lambda row: self._time_by_row[row])
+        return pd.DataFrame(values[rows, :],
+            index = [self._time_by_row[row] for row in rows],
+            columns = keys if columns is None else columns)
+
+    def _get_columns(self, keys):
+        '''Gets the indexes of the columns of the given keys and whether each key was found'''
+        columns = np.array([self._column_by_key.get(key, -1) for key in keys], dtype=np.int64)
+        found = columns >= 0
+        columns[~found] = 0
+        if self._values.shape[1] == 0:
+            # there are no columns yet, make room for one so that the indexes are valid
+            self._grow(self._values.shape[0], 1)
+            self._free_columns.append(0)
+        return columns, found
+
+    def _add_column(self, key):
+        if not self._free_columns:
+            size = self._values.shape[1]
+            self._grow(self._values.shape[0], max(1, 2 * size))
+            self._free_columns.extend(range(self._values.shape[1] - 1, size - 1, -1))
+        column = self._free_columns.pop()
+        self._column_by_key[key] = column
+        self._rows_by_column[column] = deque()
+        return column
+
+    def _add_row(self, time):
+        if not self._free_rows:
+            size = self._values.shape[0]
+            self._grow(max(self.period + 1, 2 * size), self._values.shape[1])
+            self._free_rows.extend(range(self._values.shape[0] - 1, size - 1, -1))
+        row = self._free_rows.pop()
+        self._row_by_time[time] = row
+        self._time_by_row[row] = time
+
+        # Refresh the running sums once in a while so that rounding errors don't build up over long backtests
+        self._rows_since_recompute += 1
+        if self._rows_since_recompute >= self.period:
+            self._recompute()
+        return row
+
+    def _release(self, row, column):
+        '''Drops the return of the given cell'''
+        self._set(row, column, np.nan)
+        self._referenced[row, column] = False
+        self._dereference(row)
+
+    def _dereference(self, row):
+        self._references_by_row[row] -= 1
+        if self._references_by_row[row] == 0:
+            self._row_by_time.pop(self._time_by_row.pop(row))
+            self._free_rows.append(row)
+
+    def _set(self, row, column, value):
+        '''Sets the value of a cell and applies the rank-one update of the running sums.
+        Only the row and the column of the cell in the sum matrices change, so this is linear in the number of columns'''
+        old = self._values[row, column]
+        old_mask = 0.0 if np.isnan(old) else 1.0
+        new_mask = 0.0 if np.isnan(value) else 1.0
+        if old_mask == 0 and new_mask == 0:
+            return
+
+        delta = (value if new_mask else 0.0) - (old if old_mask else 0.0)
+        delta_mask = new_mask - old_mask
+
+        values = self._values[row]
+        mask = ~np.isnan(values)
+        values = np.where(mask, values, 0.0)
+        mask = mask.astype(float)
+
+        # (x + d.e)(x + d.e)^T - x.x^T = d.(e.x^T + x.e^T) + d^2.e.e^T
+        self._sum_of_products[column, :] += delta * values
+        self._sum_of_products[:, column] += delta * values
+        self._sum_of_products[column, column] += delta * delta
+        # (x + d.e)(m + dm.e)^T - x.m^T = d.e.m^T + dm.x.e^T + d.dm.e.e^T
+        self._sum_of_pairs[column, :] += delta * mask
+        self._sum_of_pairs[:, column] += delta_mask * values
+        self._sum_of_pairs[column, column] += delta * delta_mask
+        # (m + dm.e)(m + dm.e)^T - m.m^T = dm.(e.m^T + m.e^T) + dm^2.e.e^T
+        self._count_of_pairs[column, :] += delta_mask * mask
+        self._count_of_pairs[:, column] += delta_mask * mask
+        self._count_of_pairs[column, column] += delta_mask * delta_mask
+
+        self._values[row, column] = value
+
+    def _recompute(self):
+        '''Computes the running sums from scratch'''
+        self._rows_since_recompute = 0
+        mask = ~np.isnan(self._values)
+        values = np.where(mask, self._values, 0.0)
+        mask = mask.astype(float)
+        self._sum_of_products = values.T @ values
+        self._sum_of_pairs = values.T @ mask
+        self._count_of_pairs = mask.T @ mask
+
+    def _grow(self, rows, columns):
+        '''Grows the storage to the given number of rows and columns'''
+        old_rows, old_columns = self._values.shape
+
+        values = np.full((rows, columns), np.nan)
+        values[:old_rows, :old_columns] = self._values
+        self._values = values
+
+        referenced = np.zeros((rows, columns), dtype=bool)
+        referenced[:old_rows, :old_columns] = self._referenced
+        self._referenced = referenced
+
+        references_by_row = np.zeros(rows, dtype=np.int64)
+        references_by_row[:old_rows] = self._references_by_row
+        self._references_by_row = references_by_row
+
+        if columns != old_columns:
+            for name in ('_sum_of_products', '_sum_of_pairs', '_count_of_pairs'):
+                sums = np.zeros((columns, columns))
+                sums[:old_columns, :old_columns] = getattr(self, name)
+                setattr(self, name, sums)
@@ -12,6 +12,8 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from heapq import heappop, heappush
+from itertools import count
 from EqualWeightingPortfolioConstructionModel import EqualWeightingPortfolioConstructionModel
 
 class SectorWeightingPortfolioConstructionModel(EqualWeightingPortfolioConstructionModel):
@@ -33,6 +35,19 @@ class SectorWeightingPortfolioConstructionModel(EqualWeightingPortfolioConstruct
                               next loop. Returning current time will trigger rebalance.'''
         super().__init__(rebalance)
         self.sector_code_by_symbol = dict()
+        # sector codes are read from the fundamentals once per symbol, also across universe changes, a missing code is read again
+        self.sector_code_cache = dict()
+        # running state of the active insights by symbol and of their last generated insight, the target insight of the symbol
+        self.insights_by_symbol = dict()
+        self.target_insight_by_symbol = dict()
+        self.symbols_to_update = set()
+        self.expirations = []
+        self.sequence = count()
+        # symbols with an UP or DOWN target insight by sector code
+        self.symbols_by_sector_code = dict()
+        self.bucket_sector_code_by_symbol = dict()
+        # version of the algorithm insights the running state matches, None until the first rebalance
+        self.insights_version = None
 
     def should_create_target_for_insight(self, insight):
         '''Method that will determine if the portfolio construction model should create a
@@ -41,37 +56,124 @@ class SectorWeightingPortfolioConstructionModel(EqualWeightingPortfolioConstruct
             insight: The insight to create a target for'''
         return insight.symbol in self.sector_code_by_symbol
 
+    def create_targets(self, algorithm, insights):
+        '''Create portfolio targets from the specified insights
+        Args:
+            algorithm: The algorithm instance
+            insights: The insights to create portfolio targets from
+        Returns:
+            An enumerable of portfolio targets to be sent to the execution model'''
+        self.current_utc_time = algorithm.utc_time
+
+        # the insights were added to the algorithm insights right before this call. Any other change, like insights
+        # cancelled, cleared or added without going through create_targets, invalidates the running state
+        if self.insights_version is None or algorithm.insights.version != self.insights_version + len(insights):
+            self.reset_insights(algorithm.insights.get_active_insights(self.current_utc_time))
+        else:
+            self.add_insights(insights)
+
+        targets = super().create_targets(algorithm, insights)
+        # the rebalance removes the insights the running state already expired from the algorithm insights
+        self.insights_version = algorithm.insights.version
+        return targets
+
+    def get_target_insights(self):
+        '''Gets the last generated active insight of each symbol with a sector code, from the running state
+        Returns:
+            The target insights to calculate a portfolio target percent for'''
+        self.expire_insights(self.current_utc_time)
+
+        for symbol in self.symbols_to_update:
+            self.update_target_insight(symbol)
+        self.symbols_to_update.clear()
+
+        return list(self.target_insight_by_symbol.values())
+
     def determine_target_percent(self, active_insights):
         '''Will determine the target percent for each insight
         Args:
-            active_insights: The active insights to generate a target for'''
-        result = dict()
+            active_insights: The active insights to generate a target for, the target insights of the running state'''
+        # give equal weighting to each sector
+        sector_percent = 0 if len(self.symbols_by_sector_code) == 0 else 1.0 / len(self.symbols_by_sector_code)
 
-        insight_by_sector_code = dict()
+        # give equal weighting to each security
+        percent_by_sector_code = {sector_code: sector_percent / len(symbols) for sector_code, symbols in self.symbols_by_sector_code.items()}
 
+        result = dict()
         for insight in active_insights:
-            if insight.direction == InsightDirection.FLAT:
+            direction = insight.direction
+            if direction == InsightDirection.FLAT:
                 result[insight] = 0
                 continue
-
-            sector_code = self.sector_code_by_symbol.get(insight.symbol)
-            insights = insight_by_sector_code.pop(sector_code, list())
-
-            insights.append(insight)
-            insight_by_sector_code[sector_code] = insights
-
-        # give equal weighting to each sector
-        sector_percent = 0 if len(insight_by_sector_code) == 0 else 1.0 / len(insight_by_sector_code)
-
-        for _, insights in insight_by_sector_code.items():
-            # give equal weighting to each security
-            count = len(insights)
-            percent = 0 if count == 0 else sector_percent / count
-            for insight in insights:
-                result[insight] = insight.direction * percent
+            result[insight] = direction * percent_by_sector_code[self.bucket_sector_code_by_symbol[insight.symbol]]
 
         return result
 
+    def add_insights(self, insights):
+        '''Adds new insights to the running state, only their symbols are updated
+        Args:
+            insights: The new insights'''
+        for insight in insights:
+            self.insights_by_symbol.setdefault(insight.symbol, []).append(insight)
+            heappush(self.expirations, (insight.close_time_utc, next(self.sequence), insight.symbol, insight))
+            self.symbols_to_update.add(insight.symbol)
+
+    def expire_insights(self, utc_time):
+        '''Removes the expired insights from the running state
+        Args:
+            utc_time: The current UTC time'''
+        while len(self.expirations) > 0 and self.expirations[0][0] < utc_time:
+            _, _, symbol, insight = heappop(self.expirations)
+            insights = self.insights_by_symbol.get(symbol)
+            if insights is not None:
+                insights[:] = [x for x in insights if x is not insight]
+                self.symbols_to_update.add(symbol)
+
+    def reset_insights(self, active_insights):
+        '''Rebuilds the running state from the active insights of the algorithm
+        Args:
+            active_insights: All the active insights of the algorithm'''
+        self.symbols_to_update.update(self.insights_by_symbol.keys())
+        self.insights_by_symbol.clear()
+        self.expirations.clear()
+        self.add_insights(active_insights)
+
+    def update_target_insight(self, symbol):
+        '''Updates the target insight of the symbol and moves the symbol to the sector bucket of its direction
+        Args:
+            symbol: The symbol whose insights or sector code changed'''
+        target = None
+        for insight in self.insights_by_symbol.get(symbol, []):
+            # the last one of the insights generated at the same time, like the ordering of PortfolioConstructionModel
+            if target is None or insight.generated_time_utc >= target.generated_time_utc:
+                target = insight
+
+        if target is None:
+            self.insights_by_symbol.pop(symbol, None)
+
+        self.remove_from_sector_bucket(symbol)
+        if target is None or not self.should_create_target_for_insight(target):
+            self.target_insight_by_symbol.pop(symbol, None)
+            return
+
+        self.target_insight_by_symbol[symbol] = target
+        if target.direction != InsightDirection.FLAT:
+            sector_code = self.sector_code_by_symbol[symbol]
+            self.bucket_sector_code_by_symbol[symbol] = sector_code
+            self.symbols_by_sector_code.setdefault(sector_code, set()).add(symbol)
+
+    def remove_from_sector_bucket(self, symbol):
+        '''Removes the symbol from its sector bucket, the bucket is removed when it is empty
+        Args:
+            symbol: The symbol to remove'''
+        if symbol not in self.bucket_sector_code_by_symbol:
+            return
+        sector_code = self.bucket_sector_code_by_symbol.pop(symbol)
+        symbols = self.symbols_by_sector_code[sector_code]
+        symbols.discard(symbol)
+        if len(symbols) == 0:
+            del self.symbols_by_sector_code[sector_code]
+
     def on_securities_changed(self, algorithm, changes):
         '''Event fired each time the we add/remove securities from the data feed
         Args:
@@ -81,13 +183,25 @@ class SectorWeightingPortfolioConstructionModel(EqualWeightingPortfolioConstruct
             # Removes the symbol from the self.sector_code_by_symbol dictionary
             # since we cannot emit PortfolioTarget for removed securities
             self.sector_code_by_symbol.pop(security.symbol, None)
+            # the insights of the removed securities are expired below
+            self.insights_by_symbol.pop(security.symbol, None)
+            self.update_target_insight(security.symbol)
 
         for security in changes.added_securities:
-            sector_code = self.get_sector_code(security)
+            if self.sector_code_cache.get(security.symbol) is None:
+                self.sector_code_cache[security.symbol] = self.get_sector_code(security)
+            sector_code = self.sector_code_cache[security.symbol]
             if sector_code:
                 self.sector_code_by_symbol[security.symbol] = sector_code
+            # a symbol with insights from before it was added moves to the bucket of its sector
+            self.update_target_insight(security.symbol)
 
+        # expiring the insights of the removed securities changes the version of the algorithm insights,
+        # the running state already dropped them
+        in_sync = algorithm is not None and self.insights_version == algorithm.insights.version
         super().on_securities_changed(algorithm, changes)
+        if in_sync:
+            self.insights_version = algorithm.insights.version
 
     def get_sector_code(self, security):
         '''Gets the sector code
@@ -12,7 +12,6 @@
 # limitations under the License.
 
 from AlgorithmImports import *
-from itertools import groupby
 
 class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
     '''Provides an implementation of IRiskManagementModel that that limits the sector exposure to the specified percentage'''
@@ -27,6 +26,12 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
         self.maximum_sector_exposure = maximum_sector_exposure
         self.targets_collection = PortfolioTargetCollection()
 
+        # Index of the securities by sector, maintained from the security changes
+        self._securities_by_sector = {}
+        self._sector_by_symbol = {}
+        # Securities added before their fundamental data was available
+        self._unclassified_securities = {}
+
     def manage_risk(self, algorithm, targets):
         '''Manages the algorithm's risk at each time step
         Args:
@@ -37,12 +42,11 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
 
         risk_targets = list()
 
-        # Group the securities by their sector
-        filtered = list(filter(lambda x: x.value.fundamentals is not None and x.value.fundamentals.has_fundamental_data, algorithm.universe_manager.active_securities))
-        filtered.sort(key = lambda x: x.value.fundamentals.company_reference.industry_template_code)
-        group_by_sector = groupby(filtered, lambda x: x.value.fundamentals.company_reference.industry_template_code)
+        self.classify_securities(self._unclassified_securities.values())
+
+        for code in sorted(self._securities_by_sector):
+            securities = self._securities_by_sector[code].values()
 
-        for code, securities in group_by_sector:
             # Compute the sector absolute holdings value
             # If the construction model has created a target, we consider that
             # value to calculate the security absolute holding value
@@ -50,16 +54,16 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
             sector_absolute_holdings_value = 0
 
             for security in securities:
-                symbol = security.value.symbol
-                quantities[symbol] = security.value.holdings.quantity
-                absolute_holdings_value = security.value.holdings.absolute_holdings_value
+                symbol = security.symbol
+                quantities[symbol] = security.holdings.quantity
+                absolute_holdings_value = security.holdings.absolute_holdings_value
 
                 if self.targets_collection.contains_key(symbol):
                     quantities[symbol] = self.targets_collection[symbol].quantity
 
-                    absolute_holdings_value = (security.value.price * abs(quantities[symbol]) *
-                        security.value.symbol_properties.contract_multiplier *
-                        security.value.quote_currency.conversion_rate)
+                    absolute_holdings_value = (security.price * abs(quantities[symbol]) *
+                        security.symbol_properties.contract_multiplier *
+                        security.quote_currency.conversion_rate)
 
                 sector_absolute_holdings_value += absolute_holdings_value
 
@@ -80,10 +84,36 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
         Args:
             algorithm: The algorithm instance that experienced the change in securities
             changes: The security additions and removals from the algorithm'''
-        any_fundamental_data = any([
-            kvp.value.fundamentals is not None and
-            kvp.value.fundamentals.has_fundamental_data for kvp in algorithm.active_securities
-            ])
-
-        if not any_fundamental_data:
+        for security in changes.removed_securities:
+            symbol = security.symbol
+            self._unclassified_securities.pop(symbol, None)
+            code = self._sector_by_symbol.pop(symbol, None)
+            if code is not None:
+                sector = self._securities_by_sector[code]
+                sector.pop(symbol)
+                if not sector:
+                    del self._securities_by_sector[code]
+
+        self.classify_securities(changes.added_securities)
+
+        if not self._sector_by_symbol:
             raise Exception("MaximumSectorExposureRiskManagementModel.on_securities_changed: Please select a portfolio selection model that selects securities with fundamental data.")
+
+    def classify_securities(self, securities):
+        '''Adds the securities with fundamental data to the sector index, the others are retried on the next call
+        Args:
+            securities: The securities to classify'''
+        for security in list(securities):
+            symbol = security.symbol
+            if symbol in self._sector_by_symbol:
+                continue
+
+            fundamentals = security.fundamentals
+            if fundamentals is None or not fundamentals.has_fundamental_data:
+                self._unclassified_securities[symbol] = security
+                continue
+
+            code = fundamentals.company_reference.industry_template_code
+            self._unclassified_securities.pop(symbol, None)
+            self._sector_by_symbol[symbol] = code
+            self._securities_by_sector.setdefault(code, {})[symbol] = security
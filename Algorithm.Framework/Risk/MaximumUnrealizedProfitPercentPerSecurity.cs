@@ -47,10 +47,9 @@ namespace QuantConnect.Algorithm.Framework.Risk
         /// <param name="targets">The current portfolio targets to be assessed for risk</param>
         public override IEnumerable<IPortfolioTarget> ManageRisk(QCAlgorithm algorithm, IPortfolioTarget[] targets)
         {
-            foreach (var kvp in algorithm.Securities)
+            // Only the securities with open positions are checked
+            foreach (var security in algorithm.Portfolio.InvestedSecurities)
             {
-                var security = kvp.Value;
-
                 if (!security.Invested)
                 {
                     continue;
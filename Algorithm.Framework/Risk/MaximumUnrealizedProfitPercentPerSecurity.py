@@ -28,9 +28,8 @@ class MaximumUnrealizedProfitPercentPerSecurity(RiskManagementModel):
             algorithm: The algorithm instance
             targets: The current portfolio targets to be assessed for risk'''
         targets = []
-        for kvp in algorithm.securities:
-            security = kvp.value
-
+        # Only the securities with open positions are checked
+        for security in algorithm.portfolio.invested_securities:
             if not security.invested:
                 continue
 
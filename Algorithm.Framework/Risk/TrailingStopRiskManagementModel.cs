@@ -16,6 +16,7 @@
 
 using System;
 using System.Collections.Generic;
+using System.Linq;
 using QuantConnect.Algorithm.Framework.Portfolio;
 
 namespace QuantConnect.Algorithm.Framework.Risk
@@ -45,10 +46,19 @@ namespace QuantConnect.Algorithm.Framework.Risk
         /// <param name="targets">The current portfolio targets to be assessed for risk</param>
         public override IEnumerable<IPortfolioTarget> ManageRisk(QCAlgorithm algorithm, IPortfolioTarget[] targets)
         {
-            foreach (var kvp in algorithm.Securities)
+            // Remove the state of the securities that are no longer invested
+            foreach (var symbol in _trailingAbsoluteHoldingsState.Keys.ToList())
             {
-                var symbol = kvp.Key;
-                var security = kvp.Value;
+                if (!algorithm.Securities.TryGetValue(symbol, out var security) || !security.Invested)
+                {
+                    _trailingAbsoluteHoldingsState.Remove(symbol);
+                }
+            }
+
+            // Only the securities with open positions are checked
+            foreach (var security in algorithm.Portfolio.InvestedSecurities)
+            {
+                var symbol = security.Symbol;
 
                 // Remove if not invested
                 if (!security.Invested)
@@ -30,9 +30,15 @@ class TrailingStopRiskManagementModel(RiskManagementModel):
             targets: The current portfolio targets to be assessed for risk'''
         risk_adjusted_targets = list()
 
-        for kvp in algorithm.securities:
-            symbol = kvp.key
-            security = kvp.value
+        # Remove the state of the securities that are no longer invested
+        for symbol in list(self.trailing_absolute_holdings_state):
+            security = algorithm.securities.get(symbol)
+            if security is None or not security.invested:
+                self.trailing_absolute_holdings_state.pop(symbol)
+
+        # Only the securities with open positions are checked
+        for security in algorithm.portfolio.invested_securities:
+            symbol = security.symbol
 
             # Remove if not invested
             if not security.invested:
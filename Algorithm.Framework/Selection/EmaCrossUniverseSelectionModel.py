@@ -22,13 +22,16 @@ class EmaCrossUniverseSelectionModel(FundamentalUniverseSelectionModel):
                  fastPeriod = 100,
                  slowPeriod = 300,
                  universeCount = 500,
-                 universeSettings = None):
+                 universeSettings = None,
+                 vectorized = False):
         '''Initializes a new instance of the EmaCrossUniverseSelectionModel class
         Args:
             fastPeriod: Fast EMA period
             slowPeriod: Slow EMA period
             universeCount: Maximum number of members of this universe selection
-            universeSettings: The settings used when adding symbols to the algorithm, specify null to use algorithm.UniverseSettings'''
+            universeSettings: The settings used when adding symbols to the algorithm, specify null to use algorithm.UniverseSettings
+            vectorized: If true, the averages of all the symbols are kept in arrays and updated at once instead of with an indicator per symbol.
+                        The averages are computed with floats instead of decimals, so symbols very close to the tolerance can be selected differently'''
         super().__init__(False, universeSettings)
         self.fast_period = fastPeriod
         self.slow_period = slowPeriod
@@ -36,6 +39,10 @@ class EmaCrossUniverseSelectionModel(FundamentalUniverseSelectionModel):
         self.tolerance = 0.01
         # holds our coarse fundamental indicators by symbol
         self.averages = {}
+        self.vectorized = vectorized
+        # symbols without fundamental data for this period are considered delisted and their averages are removed
+        self.eviction_period = timedelta(days=30)
+        self._averages_state = self.AveragesState(fastPeriod, slowPeriod)
 
     def select_coarse(self, algorithm: QCAlgorithm, fundamental: list[Fundamental]) -> list[Symbol]:
         '''Defines the coarse fundamental selection function.
@@ -44,6 +51,9 @@ class EmaCrossUniverseSelectionModel(FundamentalUniverseSelectionModel):
             fundamental: The coarse fundamental data used to perform filtering</param>
         Returns:
             An enumerable of symbols passing the filter'''
+        if self.vectorized:
+            return self.select_vectorized(fundamental)
+
         filtered = []
 
         for cf in fundamental:
@@ -64,6 +74,111 @@ class EmaCrossUniverseSelectionModel(FundamentalUniverseSelectionModel):
         # we only need to return the symbol and return 'universeCount' symbols
         return [x.symbol for x in filtered[:self.universe_count]]
 
+    def select_vectorized(self, fundamental: list[Fundamental]) -> list[Symbol]:
+        '''Updates the averages of all the symbols with one array expression and selects
+        the symbols with the larger delta by percentage between the two averages
+        Args:
+            fundamental: The coarse fundamental data used to perform filtering
+        Returns:
+            An enumerable of symbols passing the filter'''
+        symbols, times, prices = [], [], []
+        for cf in fundamental:
+            symbols.append(cf.symbol)
+            times.append(cf.end_time)
+            prices.append(cf.adjusted_price)
+
+        state = self._averages_state
+        if len(symbols) == 0:
+            return []
+
+        times = np.array(times, dtype='datetime64[ns]').view(np.int64)
+        slots = state.get_slots(symbols)
+        state.update(slots, times, np.array(prices, dtype=float))
+        state.evict(times.max() - pd.Timedelta(self.eviction_period).value)
+
+        # only pick symbols whose averages are ready and whose fast average is over their slow average
+        fast, slow = state.fast[slots], state.slow[slots]
+        candidates = np.flatnonzero(state.is_ready(slots) & (fast > slow * (1 + self.tolerance)))
+        fast, slow = fast[candidates], slow[candidates]
+        scaled_delta = (fast - slow) / ((fast + slow) / 2)
+
+        # prefer symbols with a larger delta by percentage between the two averages
+        if len(candidates) > self.universe_count:
+            top = np.argpartition(-scaled_delta, self.universe_count - 1)[:self.universe_count]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(-scaled_delta[top], kind='stable')]
+
+        return [symbols[i] for i in candidates[top]]
+
+    # state of the averages of every symbol, indexed by the slot of the symbol
+    class AveragesState:
+        def __init__(self, fast_period, slow_period):
+            self.fast_period = fast_period
+            self.slow_period = slow_period
+            self.slot_by_symbol = {}
+            self.symbol_by_slot = {}
+            self.free_slots = []
+            self.samples = np.zeros(0, dtype=np.int64)
+            self.last_time = np.zeros(0, dtype=np.int64)
+            # the sums of the first samples are the initial value of the averages, as in ExponentialMovingAverage
+            self.fast_sum = np.zeros(0)
+            self.slow_sum = np.zeros(0)
+            self.fast = np.zeros(0)
+            self.slow = np.zeros(0)
+
+        # gets the slots of the symbols, assigning free slots to new symbols
+        def get_slots(self, symbols):
+            slots = np.empty(len(symbols), dtype=np.int64)
+            for i, symbol in enumerate(symbols):
+                slot = self.slot_by_symbol.get(symbol)
+                if slot is None:
+                    slot = self.add(symbol)
+                slots[i] = slot
+            return slots
+
+        def add(self, symbol):
+            if len(self.free_slots) == 0:
+                size = len(self.samples)
+                capacity = max(1024, 2 * size)
+                for name in ['samples', 'last_time', 'fast_sum', 'slow_sum', 'fast', 'slow']:
+                    array = getattr(self, name)
+                    setattr(self, name, np.concatenate([array, np.zeros(capacity - size, dtype=array.dtype)]))
+                self.free_slots.extend(range(capacity - 1, size - 1, -1))
+
+            slot = self.free_slots.pop()
+            self.slot_by_symbol[symbol] = slot
+            self.symbol_by_slot[slot] = symbol
+            return slot
+
+        # removes the symbols not updated since the given time
+        def evict(self, time):
+            for slot in np.flatnonzero((self.samples > 0) & (self.last_time < time)):
+                symbol = self.symbol_by_slot.pop(slot)
+                del self.slot_by_symbol[symbol]
+                for array in [self.samples, self.last_time, self.fast_sum, self.slow_sum, self.fast, self.slow]:
+                    array[slot] = 0
+                self.free_slots.append(slot)
+
+        # updates the averages of the slots, ignoring values older than the last update as forward only indicators do
+        def update(self, slots, times, values):
+            forward = times >= self.last_time[slots]
+            slots, times, values = slots[forward], times[forward], values[forward]
+
+            self.samples[slots] += 1
+            self.last_time[slots] = times
+            samples = self.samples[slots]
+            for period, sums, averages in [(self.fast_period, self.fast_sum, self.fast), (self.slow_period, self.slow_sum, self.slow)]:
+                k = 2.0 / (period + 1)
+                initial = samples <= period
+                sums[slots[initial]] += values[initial]
+                averages[slots] = np.where(samples > period, values * k + averages[slots] * (1 - k),
+                                           np.where(samples == period, sums[slots] / period, 0))
+
+        # true for the slots whose averages are both ready
+        def is_ready(self, slots):
+            return self.samples[slots] >= max(self.fast_period, self.slow_period)
+
     # class used to improve readability of the coarse selection function
     class SelectionData:
         def __init__(self, symbol, fast_period, slow_period):
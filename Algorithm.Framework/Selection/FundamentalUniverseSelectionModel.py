@@ -30,6 +30,8 @@ class FundamentalUniverseSelectionModel:
             self.fundamental_data = False
         self.market = Market.USA
         self.universe_settings = universe_settings
+        # fields of the data frame passed to 'select_columns', None to pass the fundamental objects to 'select'
+        self.fundamental_columns = None
 
 
     def create_universes(self, algorithm: QCAlgorithm) -> list[Universe]:
@@ -44,6 +46,9 @@ class FundamentalUniverseSelectionModel:
             selection = lambda fundamental: self.select(algorithm, fundamental)
             if hasattr(self, "Select") and callable(self.Select):
                 selection = lambda fundamental: self.Select(algorithm, fundamental)
+            if self.fundamental_columns is not None:
+                selection = lambda fundamental: self.select_columns(algorithm,
+                    algorithm.pandas_converter.get_fundamental_data_frame(fundamental, list(self.fundamental_columns)))
             universe = FundamentalUniverseFactory(self.market, universe_settings, selection)
             return [universe]
         else:
@@ -95,6 +100,18 @@ class FundamentalUniverseSelectionModel:
         raise NotImplementedError("Please overrride the 'select' fundamental function")
 
 
+    def select_columns(self, algorithm: QCAlgorithm, data: pd.DataFrame) -> list[Symbol]:
+        '''Defines the fundamental selection function over a data frame, used when 'fundamental_columns' is set.
+        The data frame is built in bulk on the .NET side, so the selection can filter, group and rank with vectorized operations
+        Args:
+            algorithm: The algorithm instance
+            data: The fundamental data indexed by symbol with a column per field of 'fundamental_columns',
+                  e.g. 'dollar_volume' or 'company_reference.industry_template_code'. Numeric columns are float64
+        Returns:
+            An enumerable of symbols passing the filter'''
+        raise NotImplementedError("Please overrride the 'select_columns' fundamental function")
+
+
     def select_coarse(self, algorithm: QCAlgorithm, fundamental: list[Fundamental]) -> list[Symbol]:
         '''Defines the coarse fundamental selection function.
         Args:
@@ -20,13 +20,21 @@ class QC500UniverseSelectionModel(FundamentalUniverseSelectionModel):
     '''Defines the QC500 universe as a universe selection model for framework algorithm
     For details: https://github.com/QuantConnect/Lean/pull/1663'''
 
-    def __init__(self, filterFineData = True, universeSettings = None):
-        '''Initializes a new default instance of the QC500UniverseSelectionModel'''
-        super().__init__(filterFineData, universeSettings)
+    def __init__(self, filterFineData = True, universeSettings = None, vectorized = False):
+        '''Initializes a new default instance of the QC500UniverseSelectionModel
+        Args:
+            filterFineData: [Obsolete] Fine and Coarse selection are merged
+            universeSettings: The settings used when adding symbols to the algorithm, specify null to use algorithm.UniverseSettings
+            vectorized: If true, the coarse and fine criteria are applied in a single pass over a data frame of the fundamental fields'''
+        super().__init__(None if vectorized else filterFineData, universeSettings)
         self.number_of_symbols_coarse = 1000
         self.number_of_symbols_fine = 500
         self.dollar_volume_by_symbol = {}
         self.last_month = -1
+        if vectorized:
+            self.fundamental_columns = ['has_fundamental_data', 'volume', 'price', 'dollar_volume', 'market_cap',
+                'company_reference.country_id', 'company_reference.primary_exchange_id',
+                'company_reference.industry_template_code', 'security_reference.ipo_date']
 
     def select_coarse(self, algorithm: QCAlgorithm, fundamental: list[Fundamental]):
         '''Performs coarse selection for the QC500 constituents.
@@ -83,3 +91,42 @@ class QC500UniverseSelectionModel(FundamentalUniverseSelectionModel):
 
         sorted_by_dollar_volume = sorted(sorted_by_dollar_volume, key = lambda x: self.dollar_volume_by_symbol[x.Symbol], reverse=True)
         return [x.Symbol for x in sorted_by_dollar_volume[:self.number_of_symbols_fine]]
+
+    def select_columns(self, algorithm: QCAlgorithm, data: pd.DataFrame):
+        '''Performs the coarse and fine selection for the QC500 constituents with vectorized operations'''
+        if algorithm.time.month == self.last_month:
+            return Universe.UNCHANGED
+
+        coarse = data[data['has_fundamental_data'].astype(bool) & (data['volume'] > 0) & (data['price'] > 0)]
+        coarse = coarse.sort_values('dollar_volume', ascending=False, kind='stable').head(self.number_of_symbols_coarse)
+
+        self.dollar_volume_by_symbol = coarse['dollar_volume'].to_dict()
+
+        # If no security has met the QC500 criteria, the universe is unchanged.
+        # A new selection will be attempted on the next trading day as self.lastMonth is not updated
+        if len(coarse) == 0:
+            return Universe.UNCHANGED
+
+        # a missing IPO date is the minimum date, which pandas can't represent, it is older than half a year like in select_fine
+        ipo_date = coarse['security_reference.ipo_date']
+        ipo_age = pd.Timestamp(algorithm.time) - pd.to_datetime(ipo_date.where(ipo_date != datetime.min), errors='coerce')
+        fine = coarse[(coarse['company_reference.country_id'] == "USA")
+                      & coarse['company_reference.primary_exchange_id'].isin(["NYS","NAS"])
+                      & ((ipo_age.dt.days > 180) | ipo_age.isna())
+                      & (coarse['market_cap'] > 5e8)]
+
+        count = len(fine)
+        if count == 0:
+            return Universe.UNCHANGED
+
+        # Update self.lastMonth after all QC500 criteria checks passed
+        self.last_month = algorithm.time.month
+
+        # select stocks with top dollar volume in every single sector, fine is already sorted by dollar volume
+        percent = self.number_of_symbols_fine / count
+        sector = fine['company_reference.industry_template_code'].fillna('')
+        rank_in_sector = fine.groupby(sector, sort=False).cumcount()
+        sector_count = np.ceil(sector.map(sector.value_counts()) * percent)
+        selected = fine[rank_in_sector < sector_count]
+
+        return list(selected.index[:self.number_of_symbols_fine])
@@ -0,0 +1,111 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+### <summary>
+### Indicators shared by the framework models of an algorithm, by symbol, resolution and name.
+### The indicators of a symbol and resolution are registered with a single consolidator, which is removed
+### from the subscription manager when no model uses any of them anymore.
+### </summary>
+class SharedIndicatorPool:
+    '''Reference counted indicators and consolidators shared by the framework models of an algorithm'''
+
+    # .NET algorithms can't hold Python attributes, only the pool of the last one is kept
+    _clr_pool = None
+
+    def __init__(self, algorithm):
+        '''Initialize the SharedIndicatorPool
+        Args:
+            algorithm: The algorithm instance'''
+        self._algorithm = algorithm
+        self._entries = {}
+
+    @staticmethod
+    def get(algorithm):
+        '''Gets the pool shared by the models of the algorithm
+        Args:
+            algorithm: The algorithm instance
+        Returns:
+            The pool of the algorithm, created on the first call'''
+        # the pool is stored on the algorithm, so it is released with it
+        pool = getattr(algorithm, '_shared_indicator_pool', None)
+        if pool is not None:
+            return pool
+
+        clr_pool = SharedIndicatorPool._clr_pool
+        if clr_pool is not None and clr_pool._algorithm == algorithm:
+            return clr_pool
+
+        pool = SharedIndicatorPool(algorithm)
+        try:
+            algorithm._shared_indicator_pool = pool
+        except (AttributeError, TypeError):
+            # the pool of a new .NET algorithm replaces the pool of the previous one
+            SharedIndicatorPool._clr_pool = pool
+        return pool
+
+    def acquire(self, symbol, resolution, name, factory):
+        '''Gets the indicator of the symbol, resolution and name, creating and registering it if no model uses it yet
+        Args:
+            symbol: The symbol of the indicator
+            resolution: The resolution of the consolidator that updates the indicator
+            name: The name of the indicator, e.g. "SMA60"
+            factory: Function that creates the indicator given its full name
+        Returns:
+            The indicator and True if it was created by this call and needs to be warmed up'''
+        entry = self._get_entry(symbol, resolution)
+        indicator = entry.indicators.get(name)
+        if indicator is not None:
+            entry.references[name] += 1
+            return indicator, False
+
+        indicator = factory(self._algorithm.create_indicator_name(symbol, name, resolution))
+        self._algorithm.register_indicator(symbol, indicator, entry.consolidator)
+        entry.indicators[name] = indicator
+        entry.references[name] = 1
+        return indicator, True
+
+    def release(self, symbol, resolution, name):
+        '''Releases the indicator of the symbol, resolution and name. The consolidator is removed when
+        none of the indicators of the symbol and resolution are in use
+        Args:
+            symbol: The symbol of the indicator
+            resolution: The resolution of the consolidator that updates the indicator
+            name: The name of the indicator'''
+        key = (symbol, resolution)
+        entry = self._entries.get(key)
+        if entry is None or entry.references.get(name, 0) == 0:
+            return
+
+        entry.references[name] -= 1
+        if all(count == 0 for count in entry.references.values()):
+            self._algorithm.subscription_manager.remove_consolidator(symbol, entry.consolidator)
+            del self._entries[key]
+
+    def consolidator(self, symbol, resolution):
+        '''Gets the consolidator that updates the indicators of the symbol and resolution'''
+        return self._get_entry(symbol, resolution).consolidator
+
+    def _get_entry(self, symbol, resolution):
+        key = (symbol, resolution)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = SharedIndicatorPool.Entry(self._algorithm.resolve_consolidator(symbol, resolution))
+        return entry
+
+    class Entry:
+        def __init__(self, consolidator):
+            self.consolidator = consolidator
+            self.indicators = {}
+            self.references = {}
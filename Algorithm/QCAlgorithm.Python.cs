@@ -1018,11 +1018,12 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="format">The format of the returned data, a pandas.DataFrame by default. See <see cref="HistoryFormat"/></param>
         /// <returns>A python dictionary with pandas DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject tickers, int periods, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, HistoryFormat format = HistoryFormat.DataFrame)
         {
             if (tickers.TryConvert<Universe>(out var universe))
             {
@@ -1030,13 +1031,13 @@ namespace QuantConnect.Algorithm
                 var requests = CreateBarCountHistoryRequests(new[] { universe.Symbol }, universe.DataType, periods, resolution, fillForward, extendedMarketHours,
                     dataMappingMode, dataNormalizationMode, contractDepthOffset);
                 // we pass in 'BaseDataCollection' type so we clean up the data frame if we can
-                return GetDataFrame(History(requests.Where(x => x != null)), flatten, typeof(BaseDataCollection));
+                return GetDataFrame(History(requests.Where(x => x != null)), flatten, typeof(BaseDataCollection), format);
             }
             if (tickers.TryCreateType(out var type))
             {
                 var requests = CreateBarCountHistoryRequests(Securities.Keys, type, periods, resolution, fillForward, extendedMarketHours,
                     dataMappingMode, dataNormalizationMode, contractDepthOffset);
-                return GetDataFrame(History(requests.Where(x => x != null)), flatten, type);
+                return GetDataFrame(History(requests.Where(x => x != null)), flatten, type, format);
             }
 
             var symbols = tickers.ConvertToSymbolEnumerable().ToArray();
@@ -1045,7 +1046,8 @@ namespace QuantConnect.Algorithm
             return GetDataFrame(
                 History(symbols, periods, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode, contractDepthOffset),
                 flatten,
-                dataType);
+                dataType,
+                format);
         }
 
         /// <summary>
@@ -1065,14 +1067,15 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="format">The format of the returned data, a pandas.DataFrame by default. See <see cref="HistoryFormat"/></param>
         /// <returns>A python dictionary with pandas DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject tickers, TimeSpan span, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, HistoryFormat format = HistoryFormat.DataFrame)
         {
             return History(tickers, Time - span, Time, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode,
-                contractDepthOffset, flatten);
+                contractDepthOffset, flatten, format);
         }
 
         /// <summary>
@@ -1092,11 +1095,12 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="format">The format of the returned data, a pandas.DataFrame by default. See <see cref="HistoryFormat"/></param>
         /// <returns>A python dictionary with a pandas DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, HistoryFormat format = HistoryFormat.DataFrame)
         {
             if (tickers.TryConvert<Universe>(out var universe))
             {
@@ -1104,13 +1108,13 @@ namespace QuantConnect.Algorithm
                 var requests = CreateDateRangeHistoryRequests(new[] { universe.Symbol }, universe.DataType, start, end, resolution, fillForward, extendedMarketHours,
                     dataMappingMode, dataNormalizationMode, contractDepthOffset);
                 // we pass in 'BaseDataCollection' type so we clean up the data frame if we can
-                return GetDataFrame(History(requests.Where(x => x != null)), flatten, typeof(BaseDataCollection));
+                return GetDataFrame(History(requests.Where(x => x != null)), flatten, typeof(BaseDataCollection), format);
             }
             if (tickers.TryCreateType(out var type))
             {
                 var requests = CreateDateRangeHistoryRequests(Securities.Keys, type, start, end, resolution, fillForward, extendedMarketHours,
                     dataMappingMode, dataNormalizationMode, contractDepthOffset);
-                return GetDataFrame(History(requests.Where(x => x != null)), flatten, type);
+                return GetDataFrame(History(requests.Where(x => x != null)), flatten, type, format);
             }
 
             var symbols = tickers.ConvertToSymbolEnumerable().ToArray();
@@ -1119,7 +1123,8 @@ namespace QuantConnect.Algorithm
             return GetDataFrame(
                 History(symbols, start, end, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode, contractDepthOffset),
                 flatten,
-                dataType);
+                dataType,
+                format);
         }
 
         /// <summary>
@@ -1140,17 +1145,18 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="format">The format of the returned data, a pandas.DataFrame by default. See <see cref="HistoryFormat"/></param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject type, PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null,
             bool? fillForward = null, bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null,
-            DataNormalizationMode? dataNormalizationMode = null, int? contractDepthOffset = null, bool flatten = false)
+            DataNormalizationMode? dataNormalizationMode = null, int? contractDepthOffset = null, bool flatten = false, HistoryFormat format = HistoryFormat.DataFrame)
         {
             var symbols = tickers.ConvertToSymbolEnumerable().ToArray();
             var requestedType = type.CreateType();
             var requests = CreateDateRangeHistoryRequests(symbols, requestedType, start, end, resolution, fillForward, extendedMarketHours,
                 dataMappingMode, dataNormalizationMode, contractDepthOffset);
-            return GetDataFrame(History(requests.Where(x => x != null)), flatten, requestedType);
+            return GetDataFrame(History(requests.Where(x => x != null)), flatten, requestedType, format);
         }
 
         /// <summary>
@@ -1172,11 +1178,12 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="format">The format of the returned data, a pandas.DataFrame by default. See <see cref="HistoryFormat"/></param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject type, PyObject tickers, int periods, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, HistoryFormat format = HistoryFormat.DataFrame)
         {
             var symbols = tickers.ConvertToSymbolEnumerable().ToArray();
             var requestedType = type.CreateType();
@@ -1185,7 +1192,7 @@ namespace QuantConnect.Algorithm
             var requests = CreateBarCountHistoryRequests(symbols, requestedType, periods, resolution, fillForward, extendedMarketHours,
                 dataMappingMode, dataNormalizationMode, contractDepthOffset);
 
-            return GetDataFrame(History(requests.Where(x => x != null)), flatten, requestedType);
+            return GetDataFrame(History(requests.Where(x => x != null)), flatten, requestedType, format);
         }
 
         /// <summary>
@@ -1206,14 +1213,15 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="format">The format of the returned data, a pandas.DataFrame by default. See <see cref="HistoryFormat"/></param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject type, PyObject tickers, TimeSpan span, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, HistoryFormat format = HistoryFormat.DataFrame)
         {
             return History(type, tickers, Time - span, Time, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode,
-                contractDepthOffset, flatten);
+                contractDepthOffset, flatten, format);
         }
 
         /// <summary>
@@ -1234,14 +1242,15 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="format">The format of the returned data, a pandas.DataFrame by default. See <see cref="HistoryFormat"/></param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject type, Symbol symbol, DateTime start, DateTime end, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, HistoryFormat format = HistoryFormat.DataFrame)
         {
             return History(type.CreateType(), symbol, start, end, resolution, fillForward, extendedMarketHours, dataMappingMode,
-                dataNormalizationMode, contractDepthOffset, flatten);
+                dataNormalizationMode, contractDepthOffset, flatten, format);
         }
 
         /// <summary>
@@ -1262,10 +1271,11 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="format">The format of the returned data, a pandas.DataFrame by default. See <see cref="HistoryFormat"/></param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         private PyObject History(Type type, Symbol symbol, DateTime start, DateTime end, Resolution? resolution, bool? fillForward,
             bool? extendedMarketHours, DataMappingMode? dataMappingMode, DataNormalizationMode? dataNormalizationMode,
-            int? contractDepthOffset, bool flatten)
+            int? contractDepthOffset, bool flatten, HistoryFormat format)
         {
             var requests = CreateDateRangeHistoryRequests(new[] { symbol }, type, start, end, resolution, fillForward,
                 extendedMarketHours, dataMappingMode, dataNormalizationMode, contractDepthOffset);
@@ -1275,7 +1285,7 @@ namespace QuantConnect.Algorithm
                     $"This could be due to the specified security not being of the requested type. Symbol: {symbol} Requested Type: {type.Name}");
             }
 
-            return GetDataFrame(History(requests), flatten, type);
+            return GetDataFrame(History(requests), flatten, type, format);
         }
 
         /// <summary>
@@ -1297,11 +1307,12 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="format">The format of the returned data, a pandas.DataFrame by default. See <see cref="HistoryFormat"/></param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject type, Symbol symbol, int periods, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, HistoryFormat format = HistoryFormat.DataFrame)
         {
             var managedType = type.CreateType();
             resolution = GetResolution(symbol, resolution, managedType);
@@ -1311,7 +1322,7 @@ namespace QuantConnect.Algorithm
             var start = _historyRequestFactory.GetStartTimeAlgoTz(symbol, periods, resolution.Value, marketHours.ExchangeHours,
                 marketHours.DataTimeZone, managedType, extendedMarketHours);
             return History(managedType, symbol, start, Time, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode,
-                contractDepthOffset, flatten);
+                contractDepthOffset, flatten, format);
         }
 
         /// <summary>
@@ -1332,14 +1343,15 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="format">The format of the returned data, a pandas.DataFrame by default. See <see cref="HistoryFormat"/></param>
         /// <returns>pandas.DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject type, Symbol symbol, TimeSpan span, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, HistoryFormat format = HistoryFormat.DataFrame)
         {
             return History(type, symbol, Time - span, Time, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode,
-                contractDepthOffset, flatten);
+                contractDepthOffset, flatten, format);
         }
 
         /// <summary>
@@ -2061,10 +2073,21 @@ namespace QuantConnect.Algorithm
         }
 
         /// <summary>
-        /// Converts an enumerable of Slice into a Python Pandas data frame
+        /// Converts an enumerable of Slice into a Python Pandas data frame, or the columns of the given history format
         /// </summary>
-        protected PyObject GetDataFrame(IEnumerable<Slice> data, bool flatten, Type dataType = null)
+        protected PyObject GetDataFrame(IEnumerable<Slice> data, bool flatten, Type dataType = null, HistoryFormat format = HistoryFormat.DataFrame)
         {
+            if (format != HistoryFormat.DataFrame)
+            {
+                if (flatten)
+                {
+                    throw new ArgumentException($"QCAlgorithm.History(): flatten is only supported by the {HistoryFormat.DataFrame} history format");
+                }
+                return format == HistoryFormat.Arrow
+                    ? PandasConverter.GetRecordBatch(RemoveMemoizing(data), dataType)
+                    : PandasConverter.GetColumns(RemoveMemoizing(data), dataType);
+            }
+
             var history = PandasConverter.GetDataFrame(RemoveMemoizing(data), flatten, dataType);
             return flatten ? history : TryCleanupCollectionDataFrame(dataType, history);
         }
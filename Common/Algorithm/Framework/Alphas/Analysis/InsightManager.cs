@@ -113,6 +113,7 @@ namespace QuantConnect.Algorithm.Framework.Alphas.Analysis
             {
                 insight.Expire(currentUtcTime);
             }
+            IncrementVersion();
         }
 
         /// <summary>
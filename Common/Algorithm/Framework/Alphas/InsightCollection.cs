@@ -29,6 +29,7 @@ namespace QuantConnect.Algorithm.Framework.Alphas
     {
         private int _totalInsightCount;
         private int _openInsightCount;
+        private int _version;
         private readonly List<Insight> _insightsComplete = new();
         private readonly Dictionary<Symbol, List<Insight>> _insights = new();
 
@@ -60,6 +61,20 @@ namespace QuantConnect.Algorithm.Framework.Alphas
             }
         }
 
+        /// <summary>
+        /// The version of the open insights, incremented each time insights are added, removed or expired through this collection
+        /// </summary>
+        public int Version
+        {
+            get
+            {
+                lock (_insights)
+                {
+                    return _version;
+                }
+            }
+        }
+
         /// <summary>Adds an item to the <see cref="T:System.Collections.Generic.ICollection`1" />.</summary>
         /// <param name="item">The object to add to the <see cref="T:System.Collections.Generic.ICollection`1" />.</param>
         /// <exception cref="T:System.NotSupportedException">The <see cref="T:System.Collections.Generic.ICollection`1" /> is read-only.</exception>
@@ -69,6 +84,7 @@ namespace QuantConnect.Algorithm.Framework.Alphas
             {
                 _openInsightCount++;
                 _totalInsightCount++;
+                _version++;
 
                 _insightsComplete.Add(item);
 
@@ -131,6 +147,7 @@ namespace QuantConnect.Algorithm.Framework.Alphas
                     if (symbolInsights.Remove(item))
                     {
                         _openInsightCount--;
+                        _version++;
 
                         // remove empty list from dictionary
                         if (symbolInsights.Count == 0)
@@ -174,6 +191,7 @@ namespace QuantConnect.Algorithm.Framework.Alphas
                         _totalInsightCount += value.Count;
                     }
                     _insights[symbol] = value;
+                    _version++;
                 }
             }
         }
@@ -230,11 +248,23 @@ namespace QuantConnect.Algorithm.Framework.Alphas
                     if (_insights.Remove(symbol, out var existingInsights))
                     {
                         _openInsightCount -= existingInsights.Count;
+                        _version++;
                     }
                 }
             }
         }
 
+        /// <summary>
+        /// Increments the version of the open insights, for changes made to the insights themselves
+        /// </summary>
+        protected void IncrementVersion()
+        {
+            lock (_insights)
+            {
+                _version++;
+            }
+        }
+
         /// <summary>
         /// Gets the next expiry time UTC
         /// </summary>
@@ -35,6 +35,10 @@ namespace QuantConnect
         // placing orders for assets without a correct definition or mapping.
         private static bool _defaultIgnoreUnknownAssetHoldings = Config.GetBool("ignore-unknown-asset-holdings", true);
 
+        // Lets the benchmarks and performance investigations enable the performance tracking without changing the algorithm
+        private static TimeSpan _defaultPerformanceSamplePeriod =
+            TimeSpan.TryParse(Config.Get("performance-sample-period", "00:00:00"), out var samplePeriod) ? samplePeriod : TimeSpan.Zero;
+
         /// <summary>
         /// Gets whether or not WarmUpIndicator is allowed to warm up indicators
         /// </summary>
@@ -194,6 +198,7 @@ namespace QuantConnect
             MinAbsolutePortfolioTargetPercentage = 0.0000000001m;
             DatabasesRefreshPeriod = _defaultDatabasesRefreshPeriod;
             IgnoreUnknownAssetHoldings = _defaultIgnoreUnknownAssetHoldings;
+            PerformanceSamplePeriod = _defaultPerformanceSamplePeriod;
             SeedInitialPrices = false;
         }
     }
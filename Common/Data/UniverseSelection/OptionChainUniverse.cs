@@ -125,11 +125,10 @@ namespace QuantConnect.Data.UniverseSelection
             // we update member reference in this case
             if (Securities.Any(x => x.Value.Security == security))
             {
-                Member member;
-                Securities.TryRemove(security.Symbol, out member);
+                TryRemoveMember(security.Symbol);
             }
 
-            return Securities.TryAdd(security.Symbol, new Member(utcTime, security, isInternal));
+            return TryAddMember(new Member(utcTime, security, isInternal));
         }
 
         /// <summary>
@@ -85,6 +85,11 @@ namespace QuantConnect.Data.UniverseSelection
         /// </summary>
         public event EventHandler SelectionChanged;
 
+        /// <summary>
+        /// Event fired when a security is added to or removed from this universe, true when it was added
+        /// </summary>
+        internal event Action<Universe, Symbol, bool> MembershipChanged;
+
         /// <summary>
         /// Gets the security type of this universe
         /// </summary>
@@ -334,7 +339,7 @@ namespace QuantConnect.Data.UniverseSelection
                 return false;
             }
 
-            return Securities.TryAdd(security.Symbol, new Member(utcTime, security, isInternal));
+            return TryAddMember(new Member(utcTime, security, isInternal));
         }
 
         /// <summary>
@@ -350,8 +355,37 @@ namespace QuantConnect.Data.UniverseSelection
         {
             if (CanRemoveMember(utcTime, security))
             {
-                Member member;
-                return Securities.TryRemove(security.Symbol, out member);
+                return TryRemoveMember(security.Symbol);
+            }
+            return false;
+        }
+
+        /// <summary>
+        /// Adds the member to the securities of the universe, notifying the membership change
+        /// </summary>
+        /// <param name="member">The member to add</param>
+        /// <returns>True if the member was added, false if its security was already in the universe</returns>
+        protected bool TryAddMember(Member member)
+        {
+            if (Securities.TryAdd(member.Security.Symbol, member))
+            {
+                MembershipChanged?.Invoke(this, member.Security.Symbol, true);
+                return true;
+            }
+            return false;
+        }
+
+        /// <summary>
+        /// Removes the member of the symbol from the securities of the universe, notifying the membership change
+        /// </summary>
+        /// <param name="symbol">The symbol of the member to remove</param>
+        /// <returns>True if the member was removed, false if the symbol wasn't in the universe</returns>
+        protected bool TryRemoveMember(Symbol symbol)
+        {
+            if (Securities.TryRemove(symbol, out _))
+            {
+                MembershipChanged?.Invoke(this, symbol, false);
+                return true;
             }
             return false;
         }
@@ -18,7 +18,10 @@ Allowing support for indexing of Lean created Indexes with tickers like "SPY", S
 
 '''
 
+import ctypes
+import numpy as np
 import pandas as pd
+from collections import OrderedDict
 from pandas.core.indexes.frozen import FrozenList as pdFrozenList
 
 from clr import AddReference
@@ -42,24 +45,104 @@ class PandasColumn(str):
     def __hash__(self):
         return super().__hash__()
 
+class TickerCache:
+    '''
+    Bounded LRU cache of the SymbolCache lookups done by the mapper, so that indexing with the same tickers
+    doesn't cross into .NET every time. It is cleared when the SymbolCache version changes.
+    The version is read from its pinned .NET memory through ctypes, so checking it doesn't cross into .NET either.
+    '''
+
+    def __init__(self, maxsize = 1024):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._version = None
+        self._symbol_cache_version = ctypes.c_int32.from_address(SymbolCache.version_address)
+
+    def validate(self):
+        '''Clears the cache if the SymbolCache changed since the last call'''
+        version = self._symbol_cache_version.value
+        if version != self._version:
+            self._items.clear()
+            self._version = version
+
+    def get(self, ticker):
+        '''Gets the Symbol mapped to the ticker or the ticker itself if it cannot be mapped'''
+        items = self._items
+        if ticker in items:
+            items.move_to_end(ticker)
+            value = items[ticker]
+        else:
+            kvp = SymbolCache.try_get_symbol(ticker, None)
+            # misses are cached as None
+            value = kvp[1] if kvp[0] else None
+            items[ticker] = value
+            if len(items) > self.maxsize:
+                items.popitem(last=False)
+
+        return ticker if value is None else value
+
+ticker_cache = TickerCache()
+
+# If True, only the indexes, series and data frames created by Lean, which have a "symbol" index level, are remapped
+lean_frames_only = False
+
+def scope_to_lean_frames(enabled = True):
+    '''Limits the remapping of keys to the indexes, series and data frames created by Lean.
+    Other pandas objects are then indexed without any overhead
+    '''
+    global lean_frames_only
+    lean_frames_only = enabled
+
+def is_lean_object(obj):
+    '''Determines if the pandas object, or the object of an indexer, was created by Lean.
+    Lean indexes have a level named "symbol"
+    '''
+    if isinstance(obj, (pd.core.indexing._LocationIndexer, pd.core.indexing._ScalarAccessIndexer)):
+        obj = obj.obj
+    if isinstance(obj, pd.Index):
+        return 'symbol' in obj.names
+    if isinstance(obj, pd.DataFrame):
+        return 'symbol' in obj.index.names or 'symbol' in obj.columns.names
+    if isinstance(obj, pd.Series):
+        return 'symbol' in obj.index.names
+    return True
+
 def mapper(key):
     '''Maps a Symbol object or a Symbol Ticker (string) to the string representation of
-    Symbol SecurityIdentifier.If cannot map, returns the object
+    Symbol SecurityIdentifier.If cannot map, returns the object.
+    Containers are only rebuilt if any of their items was mapped, otherwise the same object is returned
     '''
     keyType = type(key)
-    if keyType is tuple:
-        return tuple(mapper(x) for x in key)
     if keyType is str:
-        kvp = SymbolCache.try_get_symbol(key, None)
-        if kvp[0]:
-            return kvp[1]
-        return key
+        return ticker_cache.get(key)
+    if keyType is tuple:
+        mapped = tuple(mapper(x) for x in key)
+        return key if all(x is y for x, y in zip(mapped, key)) else mapped
     if keyType is list:
-        return [mapper(x) for x in key]
+        mapped = [mapper(x) for x in key]
+        return key if all(x is y for x, y in zip(mapped, key)) else mapped
     if keyType is dict:
-        return {k: mapper(v) for k, v in key.items()}
+        mapped = {k: mapper(v) for k, v in key.items()}
+        return key if all(mapped[k] is v for k, v in key.items()) else mapped
     return key
 
+# Only these types can be or contain tickers, keys like ints, slices, Timestamps or arrays are never remapped
+_mappable_types = (str, tuple, list, dict)
+
+def map_arguments(args, kwargs):
+    '''Maps the keys in the args / kwargs of an indexing function.
+    The same objects are returned if there is nothing to map
+    '''
+    if not any(type(x) in _mappable_types for x in args[1:]) and not any(type(x) in _mappable_types for x in kwargs.values()):
+        return args, kwargs
+    if lean_frames_only and len(args) > 0 and not is_lean_object(args[0]):
+        return args, kwargs
+
+    ticker_cache.validate()
+    newargs = mapper(args) if len(args) > 1 else args
+    newkwargs = mapper(kwargs) if len(kwargs) > 0 else kwargs
+    return newargs, newkwargs
+
 def wrap_keyerror_function(f):
     '''Wraps function f with wrapped_function, used for functions that throw KeyError when not found.
     wrapped_function converts the args / kwargs to use alternative index keys and then calls the function.
@@ -67,18 +150,14 @@ def wrap_keyerror_function(f):
     '''
     def wrapped_function(*args, **kwargs):
         # Map args & kwargs and execute function
-        try:
-            newargs = args
-            newkwargs = kwargs
-
-            if len(args) > 1:
-                newargs = mapper(args)
-            if len(kwargs) > 0:
-                newkwargs = mapper(kwargs)
+        newargs, newkwargs = map_arguments(args, kwargs)
+        mapped = newargs is not args or newkwargs is not kwargs
 
-            return f(*newargs, **newkwargs)
-        except KeyError as e:
-            pass
+        if mapped:
+            try:
+                return f(*newargs, **newkwargs)
+            except KeyError as e:
+                pass
 
         # Execute original
         # Allows for df, Series, etc indexing for keys like 'SPY' if they exist
@@ -105,13 +184,9 @@ def wrap_bool_function(f):
             return originalResult
 
         # Try our mapped args; return this result regardless
-        newargs = args
-        newkwargs = kwargs
-
-        if len(args) > 1:
-            newargs = mapper(args)
-        if len(kwargs) > 0:
-            newkwargs = mapper(kwargs)
+        newargs, newkwargs = map_arguments(args, kwargs)
+        if newargs is args and newkwargs is kwargs:
+            return originalResult
 
         return f(*newargs, **newkwargs)
 
@@ -136,6 +211,43 @@ if (int(pd.__version__.split('.')[0]) < 1):
 # Wrap __contains__ to support Python syntax like 'SPY' in DataFrame
 pd.core.indexes.base.Index.__contains__ = wrap_bool_function(pd.core.indexes.base.Index.__contains__)
 
+def array_from_address(address, length, dtype):
+    '''Copies the values of a pinned .NET array in a new numpy array.
+    The values are copied in bulk, without creating a Python object per value
+    '''
+    dtype = np.dtype(dtype)
+    if length == 0:
+        return np.empty(0, dtype=dtype)
+    buffer = (ctypes.c_char * (length * dtype.itemsize)).from_address(address)
+    return np.frombuffer(buffer, dtype=dtype).copy()
+
+def repeat_values(values, counts):
+    '''Creates a numpy array repeating each value by its count, e.g. the symbol of each row of a columnar history
+    '''
+    return np.repeat(np.array(values, dtype=str), counts)
+
+def object_array(values):
+    '''Creates a numpy object array from a list, without expanding the items that are sequences
+    '''
+    return np.fromiter(values, dtype=object, count=len(values))
+
+def create_index(values, length, times, names):
+    '''Creates the index of a Lean data frame from its levels and codes, instead of a tuple per row.
+    values holds the values of the levels that are the same for every row, e.g. the symbol,
+    and times the int64 nanoseconds of the time level, or None if the index has no time level
+    '''
+    if len(values) == 1 and times is None:
+        return pd.Index(values[:1], name=names[0]).repeat(length)
+
+    constant_codes = np.zeros(length, dtype=np.int8)
+    levels = [pd.Index([x]) for x in values]
+    codes = [constant_codes] * len(values)
+    if times is not None:
+        time_codes, unique_times = pd.factorize(times, sort=True)
+        levels.append(pd.DatetimeIndex(unique_times.view('datetime64[ns]')))
+        codes.append(time_codes)
+    return pd.MultiIndex(levels=levels, codes=codes, names=names, verify_integrity=False)
+
 # For compatibility with PandasData.cs usage of this module (Previously wrapped classes)
 FrozenList = pdFrozenList
 Index = pd.Index
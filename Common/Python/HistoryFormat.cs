@@ -0,0 +1,39 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+namespace QuantConnect.Python
+{
+    /// <summary>
+    /// The format of the data returned by the Python history requests
+    /// </summary>
+    public enum HistoryFormat
+    {
+        /// <summary>
+        /// A pandas.DataFrame indexed by symbol and time (0)
+        /// </summary>
+        DataFrame,
+
+        /// <summary>
+        /// A dictionary of numpy arrays with a column per field, a "symbol" column with the security identifier of each row
+        /// and a "time" column with its end time in int64 nanoseconds since epoch. No data frame is created (1)
+        /// </summary>
+        Columns,
+
+        /// <summary>
+        /// A pyarrow.RecordBatch with the columns of <see cref="Columns"/>, it requires pyarrow (2)
+        /// </summary>
+        Arrow
+    }
+}
@@ -236,6 +236,14 @@ namespace QuantConnect.Python
                 }
             }
 
+            /// <summary>
+            /// Generates the dictionary of numpy arrays of the data, see <see cref="PandasData.ToColumns(IEnumerable{PandasData})"/>
+            /// </summary>
+            public PyObject GenerateColumns()
+            {
+                return PandasData.ToColumns(_pandasData?.Values ?? Enumerable.Empty<PandasData>());
+            }
+
             /// <summary>
             /// Creates the data frames for the data stored in the <see cref="_pandasData"/> dictionary
             /// </summary>
@@ -0,0 +1,163 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Linq;
+using System.Reflection;
+using Python.Runtime;
+using QuantConnect.Data.Fundamental;
+
+namespace QuantConnect.Python
+{
+    public partial class PandasConverter
+    {
+        private static readonly ConcurrentDictionary<string, FundamentalColumn> _fundamentalColumns = new();
+
+        /// <summary>
+        /// Converts the fundamental data of a universe selection in a pandas.DataFrame indexed by symbol,
+        /// with a column per requested field, so the selection can filter and rank with vectorized operations
+        /// </summary>
+        /// <param name="fundamental">The fundamental data of the universe selection</param>
+        /// <param name="fields">The fields of the columns, as property paths in snake or pascal case,
+        /// e.g. "dollar_volume", "market_cap" or "company_reference.industry_template_code"</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        public PyObject GetFundamentalDataFrame(IEnumerable<Fundamental> fundamental, IEnumerable<string> fields)
+        {
+            var columns = fields.Select(field => _fundamentalColumns.GetOrAdd(field, FundamentalColumn.Create)).ToList();
+            var data = fundamental as IReadOnlyCollection<Fundamental> ?? fundamental.ToList();
+
+            using (Py.GIL())
+            {
+                using var pyDict = new PyDict();
+                foreach (var column in columns)
+                {
+                    using var values = new PyList();
+                    foreach (var item in data)
+                    {
+                        var value = column.GetValue(item);
+                        values.Append(value);
+                        if (!value.IsNone())
+                        {
+                            value.Dispose();
+                        }
+                    }
+                    pyDict.SetItem(column.Name, values);
+                }
+
+                using var index = data.Select(x => x.Symbol).ToPyListUnSafe();
+                using var columnNames = columns.Select(x => x.Name).ToPyListUnSafe();
+                return _pandas.DataFrame(pyDict, index: _pandas.Index(index, name: "symbol"), columns: columnNames);
+            }
+        }
+
+        /// <summary>
+        /// Converts the fundamental data of a universe selection in a pandas.DataFrame indexed by symbol
+        /// </summary>
+        /// <param name="fundamental">The fundamental data of the universe selection</param>
+        /// <param name="fields">Python list of the fields of the columns</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        public PyObject GetFundamentalDataFrame(IEnumerable<Fundamental> fundamental, PyObject fields)
+        {
+            List<string> names;
+            using (Py.GIL())
+            {
+                names = fields.As<List<string>>();
+            }
+            return GetFundamentalDataFrame(fundamental, names);
+        }
+
+        /// <summary>
+        /// Reads a field of the fundamental data through a chain of properties resolved once per field
+        /// </summary>
+        private class FundamentalColumn
+        {
+            private readonly PropertyInfo[] _properties;
+            private readonly Func<object, PyObject> _convert;
+
+            public string Name { get; }
+
+            private FundamentalColumn(string name, PropertyInfo[] properties)
+            {
+                Name = name;
+                _properties = properties;
+                _convert = GetConverter(properties[^1].PropertyType);
+            }
+
+            public static FundamentalColumn Create(string field)
+            {
+                var type = typeof(Fundamental);
+                var properties = new List<PropertyInfo>();
+                foreach (var part in field.Split('.'))
+                {
+                    var name = part.Replace("_", string.Empty, StringComparison.InvariantCulture);
+                    var property = type.GetProperties(BindingFlags.Public | BindingFlags.Instance)
+                        .FirstOrDefault(x => string.Equals(x.Name, name, StringComparison.OrdinalIgnoreCase) && x.GetIndexParameters().Length == 0);
+                    if (property == null)
+                    {
+                        throw new ArgumentException($"PandasConverter.GetFundamentalDataFrame(): '{part}' of '{field}' is not a property of {type.Name}");
+                    }
+                    properties.Add(property);
+                    type = property.PropertyType;
+                }
+
+                // multi period fields are read as their default period value
+                var multiPeriodFieldValue = GetMultiPeriodFieldValue(type);
+                if (multiPeriodFieldValue != null)
+                {
+                    properties.Add(multiPeriodFieldValue);
+                }
+                return new FundamentalColumn(field, properties.ToArray());
+            }
+
+            public PyObject GetValue(Fundamental fundamental)
+            {
+                object value = fundamental;
+                foreach (var property in _properties)
+                {
+                    value = property.GetValue(value);
+                    if (value == null)
+                    {
+                        break;
+                    }
+                }
+                return _convert(value);
+            }
+
+            private static PropertyInfo GetMultiPeriodFieldValue(Type type)
+            {
+                for (var baseType = type; baseType != null; baseType = baseType.BaseType)
+                {
+                    if (baseType.IsGenericType && baseType.GetGenericTypeDefinition() == typeof(MultiPeriodField<>))
+                    {
+                        return type.GetProperty(nameof(MultiPeriodField.Value));
+                    }
+                }
+                return null;
+            }
+
+            private static Func<object, PyObject> GetConverter(Type type)
+            {
+                if (type == typeof(double) || type == typeof(float) || type == typeof(decimal) || type == typeof(int) || type == typeof(long))
+                {
+                    // numeric columns are float64 with NaN for the missing values
+                    return value => new PyFloat(value == null ? double.NaN : Convert.ToDouble(value, System.Globalization.CultureInfo.InvariantCulture));
+                }
+                return value => value == null ? PyObject.None : value.ToPython();
+            }
+        }
+    }
+}
@@ -60,6 +60,36 @@ namespace QuantConnect.Python
             return generator.GenerateDataFrame();
         }
 
+        /// <summary>
+        /// Converts an enumerable of <see cref="Slice"/> in a dictionary of numpy arrays, with a column per field,
+        /// a "symbol" column with the security identifier of each row and a "time" column with its end time in int64 nanoseconds since epoch
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <param name="dataType">Optional type of bars to add to the columns</param>
+        /// <returns><see cref="PyObject"/> containing a dictionary of numpy arrays</returns>
+        public PyObject GetColumns(IEnumerable<Slice> data, Type dataType = null)
+        {
+            var generator = new DataFrameGenerator(data, dataType: dataType);
+            return generator.GenerateColumns();
+        }
+
+        /// <summary>
+        /// Converts an enumerable of <see cref="Slice"/> in a pyarrow.RecordBatch with the columns of <see cref="GetColumns(IEnumerable{Slice}, Type)"/>
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <param name="dataType">Optional type of bars to add to the record batch</param>
+        /// <returns><see cref="PyObject"/> containing a pyarrow.RecordBatch</returns>
+        public PyObject GetRecordBatch(IEnumerable<Slice> data, Type dataType = null)
+        {
+            using (Py.GIL())
+            {
+                using var columns = GetColumns(data, dataType);
+                using var pyarrow = Py.Import("pyarrow");
+                using var recordBatch = pyarrow.GetAttr("RecordBatch");
+                return recordBatch.InvokeMethod("from_pydict", columns);
+            }
+        }
+
         /// <summary>
         /// Converts an enumerable of <see cref="IBaseData"/> in a pandas.DataFrame
         /// </summary>
@@ -0,0 +1,442 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using Python.Runtime;
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Globalization;
+
+namespace QuantConnect.Python
+{
+    public partial class PandasData
+    {
+        /// <summary>
+        /// The values of a column of the data frame. Doubles, integers, booleans, date times and strings are kept in typed buffers,
+        /// so that numeric columns are copied in bulk to numpy arrays. The buffer is promoted to doubles or objects
+        /// when the column holds values of different types, following the dtype pandas would infer for them
+        /// </summary>
+        private class Serie
+        {
+            private const int InitialCapacity = 16;
+            private const long NotATime = long.MinValue;
+
+            private static readonly IFormatProvider InvariantCulture = CultureInfo.InvariantCulture;
+            private static readonly long EpochTicks = new DateTime(1970, 1, 1).Ticks;
+            // the range of the date times datetime64[ns] can represent
+            private static readonly long MinNanosecondTicks = EpochTicks + long.MinValue / 100 + 1;
+            private static readonly long MaxNanosecondTicks = EpochTicks + long.MaxValue / 100;
+
+            private ValueKind _kind;
+            private double[] _doubles;
+            // the integers, or the ticks of the date times
+            private long[] _longs;
+            private byte[] _bools;
+            private string[] _strings;
+            private List<object> _objects;
+
+            public bool ShouldFilter { get; private set; }
+            public List<DateTime> Times { get; }
+            public int Count { get; private set; }
+
+            public Serie(bool withTimeIndex = true)
+            {
+                ShouldFilter = true;
+                if (withTimeIndex)
+                {
+                    Times = new();
+                }
+            }
+
+            public void Add(DateTime time, object input, bool overrideValues)
+            {
+                var value = input is decimal ? Convert.ToDouble(input, InvariantCulture) : input;
+                if (ShouldFilter)
+                {
+                    // we need at least 1 valid entry for the series not to get filtered
+                    if (value is double doubleValue)
+                    {
+                        if (!doubleValue.IsNaNOrZero())
+                        {
+                            ShouldFilter = false;
+                        }
+                    }
+                    else if (value is string stringValue)
+                    {
+                        if (!string.IsNullOrWhiteSpace(stringValue))
+                        {
+                            ShouldFilter = false;
+                        }
+                    }
+                    else if (value is bool boolValue)
+                    {
+                        if (boolValue)
+                        {
+                            ShouldFilter = false;
+                        }
+                    }
+                    else if (value != null)
+                    {
+                        if (value is ICollection enumerable)
+                        {
+                            if (enumerable.Count != 0)
+                            {
+                                ShouldFilter = false;
+                            }
+                        }
+                        else
+                        {
+                            ShouldFilter = false;
+                        }
+                    }
+                }
+
+                if (overrideValues && Times != null && Times.Count > 0 && Times[^1] == time)
+                {
+                    // If the time is the same as the last one, we overwrite the value
+                    Set(Count - 1, value);
+                }
+                else
+                {
+                    Set(Count, value);
+                    Count++;
+                    Times?.Add(time);
+                }
+            }
+
+            /// <summary>
+            /// Gets the value at the given index, missing doubles are NaN
+            /// </summary>
+            public object GetValue(int index)
+            {
+                return _kind switch
+                {
+                    ValueKind.Double => (object)_doubles[index],
+                    ValueKind.Long => _longs[index],
+                    ValueKind.Bool => _bools[index] != 0,
+                    ValueKind.DateTime => _longs[index] == NotATime ? null : new DateTime(_longs[index]),
+                    ValueKind.String => _strings[index],
+                    ValueKind.Object => _objects[index],
+                    _ => null
+                };
+            }
+
+            /// <summary>
+            /// Converts the values to a numpy array for the numeric, boolean and date time columns, or to a list otherwise
+            /// </summary>
+            public PyObject ToPython()
+            {
+                switch (_kind)
+                {
+                    case ValueKind.Double:
+                        return ToNumpyArray(_doubles, Count, _doubleType);
+                    case ValueKind.Long:
+                        return ToNumpyArray(_longs, Count, _longType);
+                    case ValueKind.Bool:
+                        return ToNumpyArray(_bools, Count, _boolType);
+                    case ValueKind.DateTime:
+                        var nanoseconds = new long[Count];
+                        for (var i = 0; i < nanoseconds.Length; i++)
+                        {
+                            nanoseconds[i] = _longs[i] == NotATime ? NotATime : (_longs[i] - EpochTicks) * 100;
+                        }
+                        return ToNumpyArray(nanoseconds, Count, _dateTimeType);
+                    default:
+                        var list = new PyList();
+                        for (var i = 0; i < Count; i++)
+                        {
+                            using var pyObject = GetValue(i).ToPython();
+                            list.Append(pyObject);
+                        }
+                        return list;
+                }
+            }
+
+            /// <summary>
+            /// Converts the values to a numpy array, an object array for the columns that aren't numeric, boolean or date times
+            /// </summary>
+            public PyObject ToNumpy()
+            {
+                if (_kind is ValueKind.Double or ValueKind.Long or ValueKind.Bool or ValueKind.DateTime)
+                {
+                    return ToPython();
+                }
+                using var list = ToPython();
+                return _objectArray.Invoke(list);
+            }
+
+            /// <summary>
+            /// Appends a block of rows with the values of another serie, at the given rows of the block or in order if rows is null.
+            /// The rows without a value, or every row if the other serie is null, are missing
+            /// </summary>
+            public void Append(Serie other, int[] rows, int rowCount)
+            {
+                if (other != null && rows == null && other.Count == rowCount && TryAppendTyped(other))
+                {
+                    return;
+                }
+
+                var values = new object[rowCount];
+                if (other != null)
+                {
+                    for (var i = 0; i < other.Count; i++)
+                    {
+                        values[rows == null ? i : rows[i]] = other.GetValue(i);
+                    }
+                }
+                foreach (var value in values)
+                {
+                    Set(Count, value);
+                    Count++;
+                }
+            }
+
+            /// <summary>
+            /// Converts the time to nanoseconds since epoch, ignoring its kind
+            /// </summary>
+            public static long ToNanoseconds(DateTime time)
+            {
+                return checked((time.Ticks - EpochTicks) * 100);
+            }
+
+            /// <summary>
+            /// Converts the times to nanoseconds since epoch, the representation of datetime64[ns].
+            /// Returns null if any of them can't be represented as a timezone naive datetime64[ns]
+            /// </summary>
+            public static long[] ToNanoseconds(List<DateTime> times)
+            {
+                var nanoseconds = new long[times.Count];
+                for (var i = 0; i < nanoseconds.Length; i++)
+                {
+                    var time = times[i];
+                    if (!IsNanosecondDateTime(time))
+                    {
+                        return null;
+                    }
+                    nanoseconds[i] = (time.Ticks - EpochTicks) * 100;
+                }
+                return nanoseconds;
+            }
+
+            /// <summary>
+            /// Copies the values of a serie of the same type, without boxing them
+            /// </summary>
+            private bool TryAppendTyped(Serie other)
+            {
+                if (other._kind != _kind && !(_kind == ValueKind.Missing && Count == 0))
+                {
+                    return false;
+                }
+
+                switch (other._kind)
+                {
+                    case ValueKind.Double:
+                        CopyValues(ref _doubles, other._doubles, other.Count);
+                        break;
+                    case ValueKind.Long:
+                    case ValueKind.DateTime:
+                        CopyValues(ref _longs, other._longs, other.Count);
+                        break;
+                    case ValueKind.Bool:
+                        CopyValues(ref _bools, other._bools, other.Count);
+                        break;
+                    case ValueKind.String:
+                        CopyValues(ref _strings, other._strings, other.Count);
+                        break;
+                    default:
+                        return false;
+                }
+                _kind = other._kind;
+                Count += other.Count;
+                return true;
+            }
+
+            private void CopyValues<T>(ref T[] buffer, T[] values, int count)
+            {
+                var length = Count + count;
+                if (buffer == null || buffer.Length < length)
+                {
+                    Array.Resize(ref buffer, Math.Max(length, (buffer?.Length ?? 0) * 2));
+                }
+                Array.Copy(values, 0, buffer, Count, count);
+            }
+
+            private static bool IsNanosecondDateTime(DateTime time)
+            {
+                return time.Kind == DateTimeKind.Unspecified && time.Ticks >= MinNanosecondTicks && time.Ticks <= MaxNanosecondTicks;
+            }
+
+            private void Set(int index, object value)
+            {
+                var kind = GetStorageKind(GetKind(value));
+                if (kind != _kind)
+                {
+                    Promote(kind);
+                }
+
+                switch (_kind)
+                {
+                    case ValueKind.Double:
+                        Store(ref _doubles, index, value == null ? double.NaN : Convert.ToDouble(value, InvariantCulture));
+                        break;
+                    case ValueKind.Long:
+                        Store(ref _longs, index, Convert.ToInt64(value, InvariantCulture));
+                        break;
+                    case ValueKind.Bool:
+                        Store(ref _bools, index, (byte)((bool)value ? 1 : 0));
+                        break;
+                    case ValueKind.DateTime:
+                        Store(ref _longs, index, value == null ? NotATime : ((DateTime)value).Ticks);
+                        break;
+                    case ValueKind.String:
+                        Store(ref _strings, index, (string)value);
+                        break;
+                    case ValueKind.Object:
+                        if (index == _objects.Count)
+                        {
+                            _objects.Add(value);
+                        }
+                        else
+                        {
+                            _objects[index] = value;
+                        }
+                        break;
+                }
+            }
+
+            /// <summary>
+            /// Gets the kind of buffer that can hold both the current values and a value of the given kind
+            /// </summary>
+            private ValueKind GetStorageKind(ValueKind kind)
+            {
+                if (kind == _kind)
+                {
+                    return kind;
+                }
+                if (kind == ValueKind.Missing || _kind == ValueKind.Missing && Count > 0)
+                {
+                    // integers and booleans have no missing value, pandas converts them to float64 and object
+                    var valueKind = kind == ValueKind.Missing ? _kind : kind;
+                    return valueKind switch
+                    {
+                        ValueKind.Long => ValueKind.Double,
+                        ValueKind.Bool => ValueKind.Object,
+                        _ => valueKind
+                    };
+                }
+                if (_kind == ValueKind.Missing)
+                {
+                    return kind;
+                }
+                if (_kind == ValueKind.Double && kind == ValueKind.Long || _kind == ValueKind.Long && kind == ValueKind.Double)
+                {
+                    return ValueKind.Double;
+                }
+                return ValueKind.Object;
+            }
+
+            /// <summary>
+            /// Moves the current values to the buffer of the given kind
+            /// </summary>
+            private void Promote(ValueKind kind)
+            {
+                var capacity = Math.Max(Count + 1, InitialCapacity);
+                switch (kind)
+                {
+                    case ValueKind.Double:
+                        var doubles = new double[capacity];
+                        for (var i = 0; i < Count; i++)
+                        {
+                            doubles[i] = _kind == ValueKind.Long ? _longs[i] : double.NaN;
+                        }
+                        _doubles = doubles;
+                        _longs = null;
+                        break;
+                    case ValueKind.DateTime:
+                        _longs = new long[capacity];
+                        Array.Fill(_longs, NotATime, 0, Count);
+                        break;
+                    case ValueKind.String:
+                        _strings = new string[capacity];
+                        break;
+                    case ValueKind.Object:
+                        _objects = new List<object>(capacity);
+                        for (var i = 0; i < Count; i++)
+                        {
+                            _objects.Add(GetValue(i));
+                        }
+                        _doubles = null;
+                        _longs = null;
+                        _bools = null;
+                        _strings = null;
+                        break;
+                }
+                _kind = kind;
+            }
+
+            private static ValueKind GetKind(object value)
+            {
+                switch (value)
+                {
+                    case null:
+                        return ValueKind.Missing;
+                    case double:
+                    case float:
+                        return ValueKind.Double;
+                    case long:
+                    case int:
+                    case uint:
+                    case short:
+                    case ushort:
+                    case byte:
+                    case sbyte:
+                        return ValueKind.Long;
+                    case bool:
+                        return ValueKind.Bool;
+                    case string:
+                        return ValueKind.String;
+                    case DateTime time when IsNanosecondDateTime(time):
+                        return ValueKind.DateTime;
+                    default:
+                        return ValueKind.Object;
+                }
+            }
+
+            private static void Store<T>(ref T[] buffer, int index, T value)
+            {
+                if (buffer == null)
+                {
+                    buffer = new T[InitialCapacity];
+                }
+                else if (index == buffer.Length)
+                {
+                    Array.Resize(ref buffer, buffer.Length * 2);
+                }
+                buffer[index] = value;
+            }
+
+            private enum ValueKind
+            {
+                Missing,
+                Double,
+                Long,
+                Bool,
+                DateTime,
+                String,
+                Object
+            }
+        }
+    }
+}
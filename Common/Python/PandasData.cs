@@ -21,9 +21,9 @@ using QuantConnect.Util;
 using System;
 using System.Collections;
 using System.Collections.Generic;
-using System.Globalization;
 using System.Linq;
 using System.Reflection;
+using System.Runtime.InteropServices;
 
 namespace QuantConnect.Python
 {
@@ -41,6 +41,14 @@ namespace QuantConnect.Python
         private static PyObject _multiIndexFactory;
         private static PyObject _multiIndex;
         private static PyObject _indexFactory;
+        private static PyObject _indexFromLevels;
+        private static PyObject _arrayFromAddress;
+        private static PyObject _objectArray;
+        private static PyObject _repeatValues;
+        private static PyString _doubleType;
+        private static PyString _longType;
+        private static PyString _boolType;
+        private static PyString _dateTimeType;
 
         private static PyList _defaultNames;
         private static PyList _level1Names;
@@ -101,7 +109,15 @@ namespace QuantConnect.Python
                 _multiIndex = _pandas.GetAttr("MultiIndex");
                 _multiIndexFactory = _multiIndex.GetAttr("from_tuples");
                 _indexFactory = _pandas.GetAttr("Index");
+                _indexFromLevels = _pandas.GetAttr("create_index");
+                _arrayFromAddress = _pandas.GetAttr("array_from_address");
+                _objectArray = _pandas.GetAttr("object_array");
+                _repeatValues = _pandas.GetAttr("repeat_values");
                 _empty = new PyString(string.Empty);
+                _doubleType = new PyString("float64");
+                _longType = new PyString("int64");
+                _boolType = new PyString("bool");
+                _dateTimeType = new PyString("datetime64[ns]");
 
                 var time = new PyString("time");
                 var symbol = new PyString("symbol");
@@ -315,43 +331,12 @@ namespace QuantConnect.Python
                 var key = serie.Times ?? EmptySeriesTimesKey;
                 if (!indexCache.TryGetValue(key, out var index))
                 {
-                    PyList indexSource;
-                    if (_timeAsColumn)
-                    {
-                        indexSource = serie.Values.Select(_ => CreateIndexSourceValue(DateTime.MinValue, indexTemplate)).ToPyListUnSafe();
-                    }
-                    else
-                    {
-                        indexSource = serie.Times.Select(time => CreateIndexSourceValue(time, indexTemplate)).ToPyListUnSafe();
-                    }
-
-                    if (indexTemplate.Length == 1)
-                    {
-                        using var nameDic = Py.kw("name", names[0]);
-                        index = _indexFactory.Invoke(new[] { indexSource }, nameDic);
-                    }
-                    else
-                    {
-                        using var namesDic = Py.kw("names", names);
-                        index = _multiIndexFactory.Invoke(new[] { indexSource }, namesDic);
-                    }
-
+                    index = CreateIndex(serie, indexTemplate, names);
                     indexCache[key] = index;
-
-                    foreach (var pyObject in indexSource)
-                    {
-                        pyObject.Dispose();
-                    }
-                    indexSource.Dispose();
                 }
 
                 // Adds pandas.Series value keyed by the column name
-                using var pyvalues = new PyList();
-                for (var i = 0; i < serie.Values.Count; i++)
-                {
-                    using var pyObject = serie.Values[i].ToPython();
-                    pyvalues.Append(pyObject);
-                }
+                using var pyvalues = serie.ToPython();
                 using var series = _seriesFactory.Invoke(pyvalues, index);
                 using var pyStrKey = seriesName.ToPython();
                 using var pyKey = _pandasColumn.Invoke(pyStrKey);
@@ -380,6 +365,51 @@ namespace QuantConnect.Python
             return result;
         }
 
+        /// <summary>
+        /// Creates the index of the series from the codes and levels of the index, the levels before the time level
+        /// have a single value. Falls back to a tuple per row if the times can't be represented as nanoseconds
+        /// </summary>
+        private PyObject CreateIndex(Serie serie, PyObject[] indexTemplate, PyList names)
+        {
+            var hasTimeLevel = !_timeAsColumn && indexTemplate.Length > 1;
+            var times = hasTimeLevel ? Serie.ToNanoseconds(serie.Times) : null;
+            if (!hasTimeLevel || times != null)
+            {
+                using var values = new PyList(hasTimeLevel ? indexTemplate[..^1] : indexTemplate);
+                using var length = (hasTimeLevel ? times.Length : serie.Count).ToPython();
+                using var pyTimes = hasTimeLevel ? ToNumpyArray(times, times.Length, _dateTimeType) : null;
+                return _indexFromLevels.Invoke(values, length, pyTimes ?? PyObject.None, names);
+            }
+
+            using var indexSource = serie.Times.Select(time => CreateIndexSourceValue(time, indexTemplate)).ToPyListUnSafe();
+            using var namesDic = Py.kw("names", names);
+            var index = _multiIndexFactory.Invoke(new[] { indexSource }, namesDic);
+            foreach (var pyObject in indexSource)
+            {
+                pyObject.Dispose();
+            }
+            return index;
+        }
+
+        /// <summary>
+        /// Copies the values of the array in a new numpy array of the given type, in a single copy
+        /// </summary>
+        private static PyObject ToNumpyArray<T>(T[] values, int count, PyObject dtype)
+            where T : struct
+        {
+            using var length = count.ToPython();
+            var handle = GCHandle.Alloc(values ?? Array.Empty<T>(), GCHandleType.Pinned);
+            try
+            {
+                using var address = handle.AddrOfPinnedObject().ToInt64().ToPython();
+                return _arrayFromAddress.Invoke(address, length, dtype);
+            }
+            finally
+            {
+                handle.Free();
+            }
+        }
+
         /// <summary>
         /// Helper method to create a single pandas data frame indexed by symbol
         /// </summary>
@@ -419,10 +449,10 @@ namespace QuantConnect.Python
                         value = valuesPerSeries[kvp.Key] = new PyList();
                     }
 
-                    if (kvp.Value.Values.Count > 0)
+                    if (kvp.Value.Count > 0)
                     {
                         // taking only 1 value per symbol
-                        using var valueOfSymbol = kvp.Value.Values[0].ToPython();
+                        using var valueOfSymbol = kvp.Value.GetValue(0).ToPython();
                         value.Append(valueOfSymbol);
                     }
                     else
@@ -456,6 +486,115 @@ namespace QuantConnect.Python
             return result;
         }
 
+        /// <summary>
+        /// Creates a dictionary of numpy arrays with a column per field, without creating a data frame.
+        /// The "symbol" column holds the security identifier of each row, and the "time" column its end time as int64 nanoseconds since epoch
+        /// </summary>
+        /// <remarks>The fields of a symbol that don't share the same times are merged by time, the missing values are NaN, NaT or None
+        /// depending on the type of the column. A time repeated in a field has a row per value</remarks>
+        public static PyObject ToColumns(IEnumerable<PandasData> pandasDatas)
+        {
+            var symbols = new List<string>();
+            var counts = new List<long>();
+            var times = new List<long>();
+            var columns = new Dictionary<string, Serie>();
+            var rowCount = 0;
+
+            foreach (var pandasData in pandasDatas)
+            {
+                var series = pandasData._series.Where(x => !x.Value.ShouldFilter).ToList();
+                if (series.Count == 0)
+                {
+                    continue;
+                }
+
+                var rowTimes = series[0].Value.Times;
+                var aligned = series.All(x => ReferenceEquals(x.Value.Times, rowTimes) || x.Value.Times.SequenceEqual(rowTimes));
+                Dictionary<DateTime, int> firstRowByTime = null;
+                if (!aligned)
+                {
+                    // a time has as many rows as the serie where it repeats the most, so that the values of a repeated time aren't merged
+                    var rowCountByTime = new Dictionary<DateTime, int>();
+                    foreach (var (_, serie) in series)
+                    {
+                        foreach (var group in serie.Times.GroupBy(time => time))
+                        {
+                            rowCountByTime[group.Key] = Math.Max(rowCountByTime.GetValueOrDefault(group.Key), group.Count());
+                        }
+                    }
+
+                    rowTimes = new List<DateTime>();
+                    firstRowByTime = new Dictionary<DateTime, int>();
+                    foreach (var (time, count) in rowCountByTime.OrderBy(x => x.Key))
+                    {
+                        firstRowByTime[time] = rowTimes.Count;
+                        rowTimes.AddRange(Enumerable.Repeat(time, count));
+                    }
+                }
+
+                foreach (var (name, serie) in series)
+                {
+                    if (!columns.TryGetValue(name, out var column))
+                    {
+                        // the rows of the previous symbols are missing for this column
+                        column = columns[name] = new Serie(withTimeIndex: false);
+                        column.Append(null, null, rowCount);
+                    }
+                    column.Append(serie, aligned ? null : GetRows(serie.Times, firstRowByTime), rowTimes.Count);
+                }
+                foreach (var (name, column) in columns)
+                {
+                    if (!pandasData._series.TryGetValue(name, out var serie) || serie.ShouldFilter)
+                    {
+                        column.Append(null, null, rowTimes.Count);
+                    }
+                }
+
+                symbols.Add(pandasData._symbol.ID.ToString());
+                counts.Add(rowTimes.Count);
+                times.AddRange(rowTimes.Select(time => Serie.ToNanoseconds(time)));
+                rowCount += rowTimes.Count;
+                pandasData._series.Clear();
+            }
+
+            using var _ = Py.GIL();
+            var result = new PyDict();
+
+            using var pySymbols = symbols.ToPyListUnSafe();
+            using var pyCounts = ToNumpyArray(counts.ToArray(), counts.Count, _longType);
+            using var symbolColumn = _repeatValues.Invoke(pySymbols, pyCounts);
+            result.SetItem("symbol", symbolColumn);
+
+            using var timeColumn = ToNumpyArray(times.ToArray(), times.Count, _longType);
+            result.SetItem("time", timeColumn);
+
+            foreach (var (name, column) in columns)
+            {
+                using var values = column.ToNumpy();
+                result.SetItem(name, values);
+            }
+            return result;
+        }
+
+        /// <summary>
+        /// Gets the row of each value of a serie, the n-th value of a time goes to the n-th row of that time
+        /// </summary>
+        private static int[] GetRows(List<DateTime> times, Dictionary<DateTime, int> firstRowByTime)
+        {
+            var rows = new int[times.Count];
+            var nextRowByTime = new Dictionary<DateTime, int>();
+            for (var i = 0; i < times.Count; i++)
+            {
+                if (!nextRowByTime.TryGetValue(times[i], out var row))
+                {
+                    row = firstRowByTime[times[i]];
+                }
+                rows[i] = row;
+                nextRowByTime[times[i]] = row + 1;
+            }
+            return rows;
+        }
+
         private List<DataTypeMember> GetInstanceDataTypeMembers(object data)
         {
             var type = data.GetType();
@@ -663,80 +802,6 @@ namespace QuantConnect.Python
             serie.Add(time, input, overrideValues);
         }
 
-        private class Serie
-        {
-            private static readonly IFormatProvider InvariantCulture = CultureInfo.InvariantCulture;
-
-            public bool ShouldFilter { get; private set; }
-            public List<DateTime> Times { get; }
-            public List<object> Values { get; }
-
-            public Serie(bool withTimeIndex = true)
-            {
-                ShouldFilter = true;
-                Values = new();
-                if (withTimeIndex)
-                {
-                    Times = new();
-                }
-            }
-
-            public void Add(DateTime time, object input, bool overrideValues)
-            {
-                var value = input is decimal ? Convert.ToDouble(input, InvariantCulture) : input;
-                if (ShouldFilter)
-                {
-                    // we need at least 1 valid entry for the series not to get filtered
-                    if (value is double doubleValue)
-                    {
-                        if (!doubleValue.IsNaNOrZero())
-                        {
-                            ShouldFilter = false;
-                        }
-                    }
-                    else if (value is string stringValue)
-                    {
-                        if (!string.IsNullOrWhiteSpace(stringValue))
-                        {
-                            ShouldFilter = false;
-                        }
-                    }
-                    else if (value is bool boolValue)
-                    {
-                        if (boolValue)
-                        {
-                            ShouldFilter = false;
-                        }
-                    }
-                    else if (value != null)
-                    {
-                        if (value is ICollection enumerable)
-                        {
-                            if (enumerable.Count != 0)
-                            {
-                                ShouldFilter = false;
-                            }
-                        }
-                        else
-                        {
-                            ShouldFilter = false;
-                        }
-                    }
-                }
-
-                if (overrideValues && Times != null && Times.Count > 0 && Times[^1] == time)
-                {
-                    // If the time is the same as the last one, we overwrite the value
-                    Values[^1] = value;
-                }
-                else
-                {
-                    Values.Add(value);
-                    Times?.Add(time);
-                }
-            }
-        }
-
         private class FixedTimeProvider : ITimeProvider
         {
             private readonly DateTime _time;
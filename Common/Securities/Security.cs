@@ -48,6 +48,7 @@ namespace QuantConnect.Securities
     {
         private SecurityExchange _exchange;
         private LocalTimeKeeper _localTimeKeeper;
+        private SecurityHolding _holdings;
 
         /// <summary>
         /// Collection of SubscriptionDataConfigs for this security.
@@ -192,10 +193,23 @@ namespace QuantConnect.Securities
         /// <seealso cref="ForexHolding"/>
         public SecurityHolding Holdings
         {
-            get;
-            set;
+            get => _holdings;
+            set
+            {
+                var previousHoldings = _holdings;
+                _holdings = value;
+                if (previousHoldings != null && !ReferenceEquals(previousHoldings, value))
+                {
+                    HoldingsReplaced?.Invoke(this, previousHoldings);
+                }
+            }
         }
 
+        /// <summary>
+        /// Event fired when the <see cref="Holdings"/> instance is replaced, the argument is the previous holdings
+        /// </summary>
+        internal event EventHandler<SecurityHolding> HoldingsReplaced;
+
         /// <summary>
         /// Exchange class contains the market opening hours, along with pre-post market hours.
         /// </summary>
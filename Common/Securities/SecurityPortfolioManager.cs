@@ -15,7 +15,9 @@
 
 using System;
 using System.Collections;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.Collections.Specialized;
 using System.Linq;
 using Python.Runtime;
 using QuantConnect.Data.Market;
@@ -43,6 +45,7 @@ namespace QuantConnect.Securities
         private decimal _freePortfolioValue;
         private SecurityPositionGroupModel _positions;
         private IAlgorithmSettings _algorithmSettings;
+        private readonly ConcurrentDictionary<Symbol, Security> _investedSecurities = new();
 
         /// <summary>
         /// Local access to the securities collection for the portfolio summation.
@@ -120,6 +123,30 @@ namespace QuantConnect.Securities
                 InvalidateTotalPortfolioValue();
             };
             UnsettledCashBook.Updated += (sender, args) => InvalidateTotalPortfolioValue();
+
+            foreach (var security in securityManager.Values)
+            {
+                TrackInvestedSecurity(security);
+            }
+            securityManager.CollectionChanged += (sender, args) =>
+            {
+                if (args.Action == NotifyCollectionChangedAction.Add)
+                {
+                    foreach (Security security in args.NewItems)
+                    {
+                        TrackInvestedSecurity(security);
+                    }
+                }
+                else if (args.Action == NotifyCollectionChangedAction.Remove)
+                {
+                    foreach (Security security in args.OldItems)
+                    {
+                        security.HoldingsReplaced -= SecurityOnHoldingsReplaced;
+                        security.Holdings.QuantityChanged -= HoldingsOnQuantityChanged;
+                        _investedSecurities.TryRemove(security.Symbol, out _);
+                    }
+                }
+            };
         }
 
         #region IDictionary Implementation
@@ -399,6 +426,12 @@ namespace QuantConnect.Securities
         /// <seealso cref="HoldStock"/>
         public bool Invested => HoldStock;
 
+        /// <summary>
+        /// Gets the securities we currently hold. It is maintained from the holdings quantity changes,
+        /// so iterating it scales with the number of open positions instead of the number of securities
+        /// </summary>
+        public ICollection<Security> InvestedSecurities => _investedSecurities.Values;
+
         /// <summary>
         /// Get the total unrealised profit in our portfolio from the individual security unrealized profits.
         /// </summary>
@@ -946,5 +979,37 @@ namespace QuantConnect.Securities
         {
             Positions = positionGroupModel;
         }
+
+        private void TrackInvestedSecurity(Security security)
+        {
+            security.HoldingsReplaced += SecurityOnHoldingsReplaced;
+            security.Holdings.QuantityChanged += HoldingsOnQuantityChanged;
+            UpdateInvestedSecurity(security);
+        }
+
+        private void SecurityOnHoldingsReplaced(object sender, SecurityHolding previousHoldings)
+        {
+            var security = (Security)sender;
+            previousHoldings.QuantityChanged -= HoldingsOnQuantityChanged;
+            security.Holdings.QuantityChanged += HoldingsOnQuantityChanged;
+            UpdateInvestedSecurity(security);
+        }
+
+        private void HoldingsOnQuantityChanged(object sender, SecurityHoldingQuantityChangedEventArgs e)
+        {
+            UpdateInvestedSecurity(e.Security);
+        }
+
+        private void UpdateInvestedSecurity(Security security)
+        {
+            if (security.Invested)
+            {
+                _investedSecurities[security.Symbol] = security;
+            }
+            else
+            {
+                _investedSecurities.TryRemove(security.Symbol, out _);
+            }
+        }
     }
 }
@@ -31,6 +31,7 @@ namespace QuantConnect.Securities
     public class UniverseManager : BaseExtendedDictionary<Symbol, Universe, ConcurrentDictionary<Symbol, Universe>>
     {
         private readonly Queue<UniverseManagerChanged> _pendingChanges = new();
+        private readonly ConcurrentDictionary<Symbol, int> _membershipCount = new();
 
         /// <summary>
         /// Event fired when a universe is added or removed
@@ -53,6 +54,16 @@ namespace QuantConnect.Securities
         {
         }
 
+        /// <summary>
+        /// Determines whether the symbol is a member of any of the universes, without scanning them
+        /// </summary>
+        /// <param name="symbol">The symbol to check</param>
+        /// <returns>True if at least one of the universes contains the symbol</returns>
+        public bool ContainsMember(Symbol symbol)
+        {
+            return _membershipCount.ContainsKey(symbol);
+        }
+
         /// <summary>
         /// Adds an element with the provided key and value to the dictionary
         /// </summary>
@@ -60,6 +71,15 @@ namespace QuantConnect.Securities
         {
             if (Dictionary.TryAdd(key, value))
             {
+                lock (_membershipCount)
+                {
+                    value.MembershipChanged += OnMembershipChanged;
+                    foreach (var symbol in value.Securities.Keys)
+                    {
+                        UpdateMembershipCount(symbol, 1);
+                    }
+                }
+
                 lock (_pendingChanges)
                 {
                     _pendingChanges.Enqueue(new UniverseManagerChanged(NotifyCollectionChangedAction.Add, value));
@@ -102,6 +122,22 @@ namespace QuantConnect.Securities
             while (universeChange != null);
         }
 
+        /// <summary>
+        /// Removes all the universes from the dictionary
+        /// </summary>
+        public override void Clear()
+        {
+            lock (_membershipCount)
+            {
+                foreach (var universe in Dictionary.Values)
+                {
+                    universe.MembershipChanged -= OnMembershipChanged;
+                }
+                _membershipCount.Clear();
+                base.Clear();
+            }
+        }
+
         /// <summary>
         /// Removes the element with the specified key from the dictionary
         /// </summary>
@@ -109,6 +145,16 @@ namespace QuantConnect.Securities
         {
             if (Dictionary.TryRemove(key, out var universe))
             {
+                // the members of a removed universe are no longer taken into account, as when scanning the universes
+                lock (_membershipCount)
+                {
+                    universe.MembershipChanged -= OnMembershipChanged;
+                    foreach (var symbol in universe.Securities.Keys)
+                    {
+                        UpdateMembershipCount(symbol, -1);
+                    }
+                }
+
                 universe.Dispose();
                 OnCollectionChanged(new UniverseManagerChanged(NotifyCollectionChangedAction.Remove, universe));
                 return true;
@@ -152,5 +198,30 @@ namespace QuantConnect.Securities
         {
             CollectionChanged?.Invoke(this, e);
         }
+
+        private void OnMembershipChanged(Universe universe, Symbol symbol, bool added)
+        {
+            lock (_membershipCount)
+            {
+                UpdateMembershipCount(symbol, added ? 1 : -1);
+            }
+        }
+
+        /// <summary>
+        /// Updates the number of universes the symbol is a member of, keeping only the symbols with members
+        /// </summary>
+        private void UpdateMembershipCount(Symbol symbol, int delta)
+        {
+            _membershipCount.TryGetValue(symbol, out var count);
+            count += delta;
+            if (count > 0)
+            {
+                _membershipCount[symbol] = count;
+            }
+            else
+            {
+                _membershipCount.TryRemove(symbol, out _);
+            }
+        }
     }
 }
@@ -18,6 +18,8 @@ using System;
 using System.Linq;
 using System.Collections.Generic;
 using System.Runtime.CompilerServices;
+using System.Runtime.InteropServices;
+using System.Threading;
 
 namespace QuantConnect
 {
@@ -31,6 +33,20 @@ namespace QuantConnect
         // we aggregate the two maps into a class so we can assign a new one as an atomic operation
         private static readonly Dictionary<string, Symbol> Symbols = new(StringComparer.OrdinalIgnoreCase);
         private static readonly Dictionary<Symbol, string> Tickers = new();
+        // the version lives in a pinned array so that Python can read it from memory without calling into .NET
+        private static readonly int[] VersionBuffer = GC.AllocateArray<int>(1, pinned: true);
+
+        /// <summary>
+        /// Gets a number that changes each time a mapping is added or removed,
+        /// so that callers keeping their own lookup caches know when to invalidate them
+        /// </summary>
+        public static int Version => Volatile.Read(ref VersionBuffer[0]);
+
+        /// <summary>
+        /// Gets the memory address of the <see cref="Version"/> as a 32-bit integer. It never moves,
+        /// so Python lookup caches can read the version through ctypes on every lookup without calling into .NET
+        /// </summary>
+        public static long VersionAddress { get; } = Marshal.UnsafeAddrOfPinnedArrayElement(VersionBuffer, 0).ToInt64();
 
         /// <summary>
         /// Adds a mapping for the specified ticker
@@ -41,6 +57,7 @@ namespace QuantConnect
         {
             lock (Symbols)
             {
+                Interlocked.Increment(ref VersionBuffer[0]);
                 Symbols[ticker] = symbol;
                 Tickers[symbol] = ticker;
 
@@ -121,6 +138,7 @@ namespace QuantConnect
         {
             lock (Symbols)
             {
+                Interlocked.Increment(ref VersionBuffer[0]);
                 return Tickers.Remove(symbol, out var ticker) && Symbols.Remove(ticker, out symbol);
             }
         }
@@ -135,6 +153,7 @@ namespace QuantConnect
         {
             lock (Symbols)
             {
+                Interlocked.Increment(ref VersionBuffer[0]);
                 return Symbols.Remove(ticker, out var symbol) && Tickers.Remove(symbol, out ticker);
             }
         }
@@ -147,6 +166,7 @@ namespace QuantConnect
         {
             lock (Symbols)
             {
+                Interlocked.Increment(ref VersionBuffer[0]);
                 Symbols.Clear();
                 Tickers.Clear();
             }
@@ -43,6 +43,13 @@ namespace QuantConnect.Configuration
                 new CommandLineOption("report-css-override-file", CommandOptionType.SingleValue, "CSS override source file"),
                 new CommandLineOption("report-html-custom-file", CommandOptionType.SingleValue, "Custom HTML source file"),
                 new CommandLineOption("python-venv", CommandOptionType.SingleValue, "Python virtual environment path"),
+                new CommandLineOption("report-chart-dpi", CommandOptionType.SingleValue, "Resolution of the chart images"),
+                new CommandLineOption("report-chart-format", CommandOptionType.SingleValue, "Format of the chart images: png or svg"),
+                new CommandLineOption("report-chart-max-points", CommandOptionType.SingleValue, "Number of points the chart time series are decimated to, 0 to plot every point"),
+                new CommandLineOption("report-chart-workers", CommandOptionType.SingleValue, "Number of Python processes the charts are rendered in, 0 to render them in the report process"),
+                new CommandLineOption("report-batch-source-folder", CommandOptionType.SingleValue, "Folder with the backtest result json files to generate the reports of, in a single process"),
+                new CommandLineOption("report-batch-destination-folder", CommandOptionType.SingleValue, "Destination folder of the batch reports, the source folder by default"),
+                new CommandLineOption("report-batch-workers", CommandOptionType.SingleValue, "Number of batch reports generated concurrently"),
             };
 
         /// <summary>
@@ -15,6 +15,7 @@
 */
 
 using System;
+using System.Diagnostics;
 using System.IO;
 using System.Linq;
 using System.Runtime.CompilerServices;
@@ -106,6 +107,7 @@ namespace QuantConnect.Lean.Engine
                 IBrokerage brokerage = null;
                 DataManager dataManager = null;
                 var performanceTrackingTool = new PerformanceTrackingTool();
+                var initializeStopwatch = Stopwatch.StartNew();
                 var synchronizer = _liveMode ? new LiveSynchronizer() : new Synchronizer();
                 try
                 {
@@ -315,6 +317,7 @@ namespace QuantConnect.Lean.Engine
                     $"         Data Provider:        {AlgorithmHandlers.DataProvider.GetType().FullName}{Environment.NewLine}");
 
                 //-> Using the job + initialization: load the designated handlers:
+                initializeStopwatch.Stop();
                 if (initializeComplete)
                 {
                     performanceTrackingTool.Initialize(algorithm);
@@ -398,6 +401,14 @@ namespace QuantConnect.Lean.Engine
                             var dataPoints = algorithmManager.DataPoints + algorithm.HistoryProvider.DataPointCount;
                             var kps = dataPoints / (double) 1000 / totalSeconds;
                             AlgorithmHandlers.Results.DebugMessage($"Algorithm Id:({job.AlgorithmId}) completed in {totalSeconds:F2} seconds at {kps:F0}k data points per second. Processing total of {dataPoints:N0} data points.");
+
+                            if (algorithm.Settings.PerformanceSamplePeriod > TimeSpan.Zero)
+                            {
+                                // history requests made during initialization and warm up are included in both timings
+                                var historySeconds = (algorithm.HistoryProvider as HistoryProviderManager)?.ElapsedTime.TotalSeconds ?? 0;
+                                AlgorithmHandlers.Results.DebugMessage($"Algorithm Id:({job.AlgorithmId}) initialized in {initializeStopwatch.Elapsed.TotalSeconds:F2} seconds. " +
+                                    $"History requests took {historySeconds:F2} seconds.");
+                            }
                         }
                     }
                     catch (Exception err)
@@ -23,7 +23,9 @@ using QuantConnect.Packets;
 using QuantConnect.Util;
 using System;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Linq;
+using System.Threading;
 using HistoryRequest = QuantConnect.Data.HistoryRequest;
 
 namespace QuantConnect.Lean.Engine.HistoricalData
@@ -39,6 +41,7 @@ namespace QuantConnect.Lean.Engine.HistoricalData
         private IBrokerage _brokerage;
         private bool _initialized;
         private bool _loggedEquityShortcutWarning;
+        private long _elapsedTicks;
 
         /// <summary>
         /// Collection of history providers being used
@@ -51,6 +54,11 @@ namespace QuantConnect.Lean.Engine.HistoricalData
         /// </summary>
         public override int DataPointCount => GetDataPointCount();
 
+        /// <summary>
+        /// Gets the total time spent producing the history slices, excluding the time the consumers spend processing them
+        /// </summary>
+        public TimeSpan ElapsedTime => Stopwatch.GetElapsedTime(0, Interlocked.Read(ref _elapsedTicks));
+
         /// <summary>
         /// Sets the brokerage to be used for historical requests
         /// </summary>
@@ -133,6 +141,30 @@ namespace QuantConnect.Lean.Engine.HistoricalData
         /// <param name="sliceTimeZone">The time zone used when time stamping the slice instances</param>
         /// <returns>An enumerable of the slices of data covering the span specified in each request</returns>
         public override IEnumerable<Slice> GetHistory(IEnumerable<HistoryRequest> requests, DateTimeZone sliceTimeZone)
+        {
+            var timestamp = Stopwatch.GetTimestamp();
+            var suspended = false;
+            try
+            {
+                foreach (var slice in GetHistorySlices(requests, sliceTimeZone))
+                {
+                    Interlocked.Add(ref _elapsedTicks, Stopwatch.GetTimestamp() - timestamp);
+                    suspended = true;
+                    yield return slice;
+                    suspended = false;
+                    timestamp = Stopwatch.GetTimestamp();
+                }
+            }
+            finally
+            {
+                if (!suspended)
+                {
+                    Interlocked.Add(ref _elapsedTicks, Stopwatch.GetTimestamp() - timestamp);
+                }
+            }
+        }
+
+        private IEnumerable<Slice> GetHistorySlices(IEnumerable<HistoryRequest> requests, DateTimeZone sliceTimeZone)
         {
             List<IEnumerator<Slice>> historyEnumerators = new(_historyProviders.Count);
 
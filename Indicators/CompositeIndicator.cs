@@ -45,6 +45,8 @@ namespace QuantConnect.Indicators
 
         /// <summary>function used to compose the individual indicators</summary>
         private readonly IndicatorComposer _composer;
+        private IndicatorUpdatedHandler _leftUpdatedHandler;
+        private IndicatorUpdatedHandler _rightUpdatedHandler;
 
         /// <summary>
         /// Gets the 'left' indicator for the delegate
@@ -177,7 +179,7 @@ namespace QuantConnect.Indicators
 
             IndicatorDataPoint newLeftData = null;
             IndicatorDataPoint newRightData = null;
-            Left.Updated += (sender, updated) =>
+            _leftUpdatedHandler = (sender, updated) =>
             {
                 newLeftData = updated;
 
@@ -192,7 +194,7 @@ namespace QuantConnect.Indicators
                 }
             };
 
-            Right.Updated += (sender, updated) =>
+            _rightUpdatedHandler = (sender, updated) =>
             {
                 newRightData = updated;
 
@@ -206,6 +208,19 @@ namespace QuantConnect.Indicators
                     newRightData = null;
                 }
             };
+
+            Left.Updated += _leftUpdatedHandler;
+            Right.Updated += _rightUpdatedHandler;
+        }
+
+        /// <summary>
+        /// Removes the event handlers from Left.Updated and Right.Updated so that this instance is no longer
+        /// updated by them. Useful when the left and right indicators outlive this instance
+        /// </summary>
+        public void Detach()
+        {
+            Left.Updated -= _leftUpdatedHandler;
+            Right.Updated -= _rightUpdatedHandler;
         }
 
         private DateTime MaxTime(IndicatorDataPoint updated)
@@ -15,9 +15,11 @@
 
 // ReSharper disable InconsistentNaming
 using System;
+using NodaTime;
 using Python.Runtime;
 using QuantConnect.Data;
 using System.Globalization;
+using System.Collections.Generic;
 
 namespace QuantConnect.Indicators
 {
@@ -39,6 +41,113 @@ namespace QuantConnect.Indicators
             return indicator.Update(new IndicatorDataPoint(time, value));
         }
 
+        /// <summary>
+        /// Updates the state of this indicator with each of the given values, in order, and returns true
+        /// if this indicator is ready, false otherwise. Non-finite values are skipped
+        /// </summary>
+        /// <param name="indicator">The indicator to be updated</param>
+        /// <param name="times">The times associated with the values</param>
+        /// <param name="values">The values to use to update this indicator</param>
+        /// <returns>True if this indicator is ready, false otherwise</returns>
+        public static bool Update(this IndicatorBase<IndicatorDataPoint> indicator, IReadOnlyList<DateTime> times, IReadOnlyList<double> values)
+        {
+            if (times.Count != values.Count)
+            {
+                throw new ArgumentException($"The number of times ({times.Count}) and values ({values.Count}) must match");
+            }
+
+            for (var i = 0; i < times.Count; i++)
+            {
+                var value = values[i];
+                if (value.IsNaNOrInfinity())
+                {
+                    continue;
+                }
+                indicator.Update(new IndicatorDataPoint(times[i], value.SafeDecimalCast()));
+            }
+            return indicator.IsReady;
+        }
+
+        /// <summary>
+        /// Updates the state of this indicator, or adds to this rolling window, a whole column of history in a single call
+        /// and returns true if it is ready, false otherwise. Non-finite values are skipped
+        /// </summary>
+        /// <param name="target">The indicator updated with IndicatorDataPoint, or the rolling window of IndicatorDataPoint, to warm up</param>
+        /// <param name="times">The times associated with the values: a pandas DatetimeIndex or Series, or a numpy datetime64 array,
+        /// of any resolution, or integer Unix timestamps in nanoseconds</param>
+        /// <param name="values">The values to use to update this indicator, e.g. a numpy array or pandas Series</param>
+        /// <param name="timeZone">The time zone of the times. If set, the times are converted to UTC. Ignored if the times are time zone aware</param>
+        /// <returns>True if the indicator or rolling window is ready, false otherwise</returns>
+        public static bool WarmUp(PyObject target, PyObject times, PyObject values, DateTimeZone timeZone = null)
+        {
+            var managedTarget = target.SafeAsManagedObject();
+            if (managedTarget is not IndicatorBase<IndicatorDataPoint>
+                && managedTarget is not RollingWindow<IndicatorDataPoint>
+                && managedTarget is not RollingWindow<object>)
+            {
+                throw new ArgumentException("WarmUp only supports indicators updated with IndicatorDataPoint and rolling windows of IndicatorDataPoint");
+            }
+
+            long[] timestamps;
+            double[] doubles;
+            bool isUtc;
+            using (Py.GIL())
+            {
+                timestamps = ToUnixNanoseconds(times, out isUtc);
+                doubles = ToArray<double>(values);
+            }
+
+            var dateTimes = new DateTime[timestamps.Length];
+            for (var i = 0; i < timestamps.Length; i++)
+            {
+                var time = Time.UnixNanosecondTimeStampToDateTime(timestamps[i]);
+                dateTimes[i] = timeZone == null || isUtc ? time : time.ConvertToUtc(timeZone);
+            }
+
+            switch (managedTarget)
+            {
+                case IndicatorBase<IndicatorDataPoint> indicator:
+                    return indicator.Update(dateTimes, doubles);
+                case RollingWindow<IndicatorDataPoint> window:
+                    return window.Add(dateTimes, doubles);
+                default:
+                    var pythonWindow = (RollingWindow<object>)managedTarget;
+                    return pythonWindow.Add(dateTimes, doubles);
+            }
+        }
+
+        /// <summary>
+        /// Adds each of the given values, in order, to this rolling window as an <see cref="IndicatorDataPoint"/> and returns
+        /// true if this window is ready, false otherwise. Non-finite values are skipped
+        /// </summary>
+        /// <param name="window">The rolling window the values are added to</param>
+        /// <param name="times">The times associated with the values</param>
+        /// <param name="values">The values to add to this window</param>
+        /// <returns>True if this window is ready, false otherwise</returns>
+        public static bool Add<T>(this RollingWindow<T> window, IReadOnlyList<DateTime> times, IReadOnlyList<double> values)
+            where T : class
+        {
+            if (times.Count != values.Count)
+            {
+                throw new ArgumentException($"The number of times ({times.Count}) and values ({values.Count}) must match");
+            }
+
+            for (var i = 0; i < times.Count; i++)
+            {
+                var value = values[i];
+                if (value.IsNaNOrInfinity())
+                {
+                    continue;
+                }
+                if (new IndicatorDataPoint(times[i], value.SafeDecimalCast()) is not T item)
+                {
+                    throw new ArgumentException($"Rolling windows of {typeof(T).Name} can't hold IndicatorDataPoint values");
+                }
+                window.Add(item);
+            }
+            return window.IsReady;
+        }
+
         /// <summary>
         /// Configures the second indicator to receive automatic updates from the first by attaching an event handler
         /// to first.DataConsolidated
@@ -541,6 +650,55 @@ namespace QuantConnect.Indicators
             return Plus(indicatorLeft, indicatorRight, name);
         }
 
+        /// <summary>
+        /// Converts the times to Unix timestamps in nanoseconds. datetime64 values are converted from their resolution,
+        /// which isn't always nanoseconds, e.g. pandas 3 defaults to microseconds. Other values are taken as nanoseconds
+        /// </summary>
+        /// <param name="times">The times as a pandas DatetimeIndex or Series, a numpy array or a Python sequence</param>
+        /// <param name="isUtc">True if the times are time zone aware, their values are then UTC</param>
+        private static long[] ToUnixNanoseconds(PyObject times, out bool isUtc)
+        {
+            isUtc = false;
+            if (!times.HasAttr("dtype"))
+            {
+                return ToArray<long>(times);
+            }
+
+            using var dtype = times.GetAttr("dtype");
+            using var kind = dtype.GetAttr("kind");
+            if (kind.As<string>() != "M")
+            {
+                return ToArray<long>(times);
+            }
+
+            if (dtype.HasAttr("tz"))
+            {
+                using var tz = dtype.GetAttr("tz");
+                isUtc = !tz.IsNone();
+            }
+
+            // the values of pandas objects are numpy datetime64 arrays, in UTC if they are time zone aware
+            using var datetimes = times.HasAttr("values") ? times.GetAttr("values") : times.InvokeMethod("view");
+            using var nanosecondsType = new PyString("datetime64[ns]");
+            using var nanoseconds = datetimes.InvokeMethod("astype", nanosecondsType);
+            using var int64 = new PyString("int64");
+            using var timestamps = nanoseconds.InvokeMethod("view", int64);
+            return ToArray<long>(timestamps);
+        }
+
+        /// <summary>
+        /// Converts a Python sequence, or a numpy array or pandas Series through their tolist method, to an array
+        /// </summary>
+        private static T[] ToArray<T>(PyObject sequence)
+        {
+            if (sequence.HasAttr("tolist"))
+            {
+                using var list = sequence.InvokeMethod("tolist");
+                return list.As<T[]>();
+            }
+            return sequence.As<T[]>();
+        }
+
         internal static IndicatorBase GetIndicatorAsManagedObject(this PyObject indicator)
         {
             if (indicator.TryConvert(out PythonIndicator pythonIndicator, true))
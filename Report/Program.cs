@@ -59,28 +59,6 @@ namespace QuantConnect.Report
             // Initialize and add our Paths
             PythonInitializer.Initialize();
 
-            // Parse content from source files into result objects
-            Log.Trace($"QuantConnect.Report.Main(): Parsing source files...{backtestDataFile}, {liveDataFile}");
-            var backtestSettings = new JsonSerializerSettings
-            {
-                Converters = new List<JsonConverter> { new NullResultValueTypeJsonConverter<BacktestResult>() },
-                FloatParseHandling = FloatParseHandling.Decimal
-            };
-
-            var backtest = JsonConvert.DeserializeObject<BacktestResult>(File.ReadAllText(backtestDataFile), backtestSettings);
-            LiveResult live = null;
-
-            if (!string.IsNullOrEmpty(liveDataFile))
-            {
-                var settings = new JsonSerializerSettings
-                {
-                    NullValueHandling = NullValueHandling.Ignore,
-                    Converters = new List<JsonConverter> { new NullResultValueTypeJsonConverter<LiveResult>() }
-                };
-
-                live = JsonConvert.DeserializeObject<LiveResult>(File.ReadAllText(liveDataFile), settings);
-            }
-
             string cssOverrideContent = null;
             if (!string.IsNullOrEmpty(cssOverrideFile))
             {
@@ -107,6 +85,27 @@ namespace QuantConnect.Report
                 }
             }
 
+            // Batch mode: generate the report of every result file of the folder in this process
+            var batchSourceFolder = Config.Get("report-batch-source-folder");
+            if (!string.IsNullOrEmpty(batchSourceFolder))
+            {
+                var batchDestinationFolder = Config.Get("report-batch-destination-folder", batchSourceFolder);
+                var workers = Config.GetInt("report-batch-workers", Environment.ProcessorCount);
+                ReportBatch.Run(batchSourceFolder, batchDestinationFolder, workers, description, version, cssOverrideContent, htmlCustomContent);
+                Exit();
+                return;
+            }
+
+            // Parse content from source files into result objects
+            Log.Trace($"QuantConnect.Report.Main(): Parsing source files...{backtestDataFile}, {liveDataFile}");
+            var backtest = ReportBatch.ReadBacktestResult(backtestDataFile);
+            LiveResult live = null;
+
+            if (!string.IsNullOrEmpty(liveDataFile))
+            {
+                live = ReportBatch.ReadLiveResult(liveDataFile);
+            }
+
             //Create a new report
             Log.Trace("QuantConnect.Report.Main(): Instantiating report...");
             var report = new Report(name, description, version, backtest, live, cssOverride: cssOverrideContent, htmlCustom: htmlCustomContent);
@@ -170,6 +169,11 @@ namespace QuantConnect.Report
                 Console.Write(html);
             }
 
+            Exit();
+        }
+
+        private static void Exit()
+        {
             Log.Trace("QuantConnect.Report.Main(): Completed.");
 
             if (!Console.IsInputRedirected && !Config.GetBool("close-automatically"))
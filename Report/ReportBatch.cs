@@ -0,0 +1,141 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Linq;
+using System.Threading.Tasks;
+using Newtonsoft.Json;
+using QuantConnect.Logging;
+using QuantConnect.Packets;
+
+namespace QuantConnect.Report
+{
+    /// <summary>
+    /// Generates the reports of every backtest result of a folder in a single process, so the Python
+    /// runtime, matplotlib and the chart fonts are initialized once for all of them
+    /// </summary>
+    public static class ReportBatch
+    {
+        /// <summary>
+        /// Suffix of the live result file of a backtest, following the "Foobar.json" and "Foobar-live.json" convention
+        /// </summary>
+        public const string LiveResultSuffix = "-live.json";
+
+        /// <summary>
+        /// Generates the HTML report of each backtest result json file of the source folder.
+        /// A "name-live.json" file next to "name.json" is used as the live result of the report
+        /// </summary>
+        /// <param name="sourceFolder">Folder with the result json files</param>
+        /// <param name="destinationFolder">Folder where the "name.html" reports are written</param>
+        /// <param name="workers">Number of reports generated concurrently</param>
+        /// <param name="description">Description of the strategies</param>
+        /// <param name="version">Version of the strategies</param>
+        /// <param name="cssOverride">CSS file that overrides some of the default rules defined in report.css</param>
+        /// <param name="htmlCustom">Custom HTML file to replace the default template</param>
+        /// <returns>The time taken by each report, by name. Reports that failed are not included</returns>
+        public static Dictionary<string, TimeSpan> Run(string sourceFolder, string destinationFolder, int workers,
+            string description = null, string version = null, string cssOverride = null, string htmlCustom = null)
+        {
+            Directory.CreateDirectory(destinationFolder);
+
+            var backtestFiles = GetBacktestFiles(sourceFolder).ToList();
+            Log.Trace($"ReportBatch.Run(): Generating {backtestFiles.Count} reports from {sourceFolder} with {workers} workers...");
+
+            var elapsed = new Dictionary<string, TimeSpan>();
+            var total = Stopwatch.StartNew();
+
+            Parallel.ForEach(backtestFiles, new ParallelOptions { MaxDegreeOfParallelism = Math.Max(1, workers) }, backtestFile =>
+            {
+                var name = Path.GetFileNameWithoutExtension(backtestFile);
+                var stopwatch = Stopwatch.StartNew();
+                try
+                {
+                    var liveFile = Path.Combine(sourceFolder, name + LiveResultSuffix);
+                    var backtest = ReadBacktestResult(backtestFile);
+                    var live = File.Exists(liveFile) ? ReadLiveResult(liveFile) : null;
+
+                    var destination = Path.Combine(destinationFolder, name + ".html");
+                    var report = new Report(name, description, version, backtest, live, destination, cssOverride, htmlCustom);
+                    report.Compile(out var html, out _);
+                    File.WriteAllText(destination, html);
+
+                    stopwatch.Stop();
+                    lock (elapsed)
+                    {
+                        elapsed[name] = stopwatch.Elapsed;
+                    }
+                    Log.Trace($"ReportBatch.Run(): {name} generated in {stopwatch.Elapsed.TotalSeconds:F2} seconds");
+                }
+                catch (Exception exception)
+                {
+                    Log.Error(exception, $"ReportBatch.Run(): Failed to generate the report of {backtestFile}");
+                }
+            });
+
+            total.Stop();
+            var throughput = elapsed.Count / Math.Max(total.Elapsed.TotalMinutes, double.Epsilon);
+            Log.Trace($"ReportBatch.Run(): Generated {elapsed.Count} of {backtestFiles.Count} reports in {total.Elapsed.TotalSeconds:F2} seconds " +
+                $"({throughput:F1} reports per minute)");
+
+            return elapsed;
+        }
+
+        /// <summary>
+        /// Gets the backtest result files of the folder, skipping live results and the files written by the report
+        /// </summary>
+        /// <param name="sourceFolder">Folder with the result json files</param>
+        public static IEnumerable<string> GetBacktestFiles(string sourceFolder)
+        {
+            return Directory.EnumerateFiles(sourceFolder, "*.json")
+                .Where(file => !file.EndsWith(LiveResultSuffix, StringComparison.OrdinalIgnoreCase)
+                    && !file.EndsWith("-portfolio.json", StringComparison.OrdinalIgnoreCase)
+                    && !Path.GetFileName(file).Equals(Report.StatisticsFileName, StringComparison.OrdinalIgnoreCase))
+                .OrderBy(file => file, StringComparer.Ordinal);
+        }
+
+        /// <summary>
+        /// Reads a backtest result json file
+        /// </summary>
+        /// <param name="path">Path of the file</param>
+        public static BacktestResult ReadBacktestResult(string path)
+        {
+            var settings = new JsonSerializerSettings
+            {
+                Converters = new List<JsonConverter> { new NullResultValueTypeJsonConverter<BacktestResult>() },
+                FloatParseHandling = FloatParseHandling.Decimal
+            };
+
+            return JsonConvert.DeserializeObject<BacktestResult>(File.ReadAllText(path), settings);
+        }
+
+        /// <summary>
+        /// Reads a live result json file
+        /// </summary>
+        /// <param name="path">Path of the file</param>
+        public static LiveResult ReadLiveResult(string path)
+        {
+            var settings = new JsonSerializerSettings
+            {
+                NullValueHandling = NullValueHandling.Ignore,
+                Converters = new List<JsonConverter> { new NullResultValueTypeJsonConverter<LiveResult>() }
+            };
+
+            return JsonConvert.DeserializeObject<LiveResult>(File.ReadAllText(path), settings);
+        }
+    }
+}
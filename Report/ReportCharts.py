@@ -11,16 +11,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import re
+import sys
 import matplotlib
+import multiprocessing
 import numpy as np
 import pandas as pd
+from io import BytesIO
 from base64 import b64encode
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import wraps
 from pandas.plotting import register_matplotlib_converters
-from clr import AddReference
-AddReference("System")
-from System import *
+# the worker processes of the chart pool run in a standalone interpreter, without the .NET runtime
+if 'clr' in sys.modules:
+    from clr import AddReference
+    AddReference("System")
+    from System import *
 
 register_matplotlib_converters()
 
@@ -39,6 +47,46 @@ from matplotlib.ticker import MaxNLocator, NullFormatter, ScalarFormatter, Forma
 la = matplotlib.font_manager.FontManager()
 lu = matplotlib.font_manager.FontProperties(family = "Open Sans Condensed")
 
+def find_python_executable():
+    '''
+    Gets the path of a standalone Python interpreter for the worker processes of the chart pool.
+    The interpreter that runs the report can be a .NET host embedding Python, which can't start them
+    Returns None if there is no interpreter next to the Python installation
+    '''
+    if os.path.basename(sys.executable).lower().startswith('python'):
+        return sys.executable
+
+    names = ['python.exe'] if os.name == 'nt' else [os.path.join('bin', 'python3'), os.path.join('bin', 'python')]
+    for prefix in dict.fromkeys([sys.prefix, sys.exec_prefix, sys.base_prefix]):
+        for name in names:
+            path = os.path.join(prefix, name)
+            if os.path.isfile(path):
+                return path
+    return None
+
+def to_python(value):
+    '''
+    Converts the .NET collections in the arguments of a chart method to Python lists, so they can be sent to the worker processes
+    '''
+    if isinstance(value, (str, bytes, np.ndarray, pd.Series, pd.DataFrame)) or not hasattr(value, '__iter__'):
+        return value
+    if isinstance(value, dict):
+        return {to_python(key): to_python(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(to_python(item) for item in value)
+    return [to_python(item) for item in value]
+
+def renders_in_pool(method):
+    '''
+    Renders the chart in the process pool of the ReportCharts instance, if it has one
+    '''
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.workers <= 0:
+            return method(self, *args, **kwargs)
+        return self.render_in_pool(method.__name__, args, kwargs)
+    return wrapper
+
 class ReportCharts:
     color_map = {
             "Equity": "#ff9914",
@@ -53,43 +101,156 @@ class ReportCharts:
             "CryptoFuture": "#E55812"
         }
 
-    def fig_to_base64(self, filename = '', fig = None, dpi = 200):
-        base64 = 'data:image/png;base64,'
+    # mime types of the supported image formats
+    mime_types = {
+            "png": "image/png",
+            "svg": "image/svg+xml"
+        }
+
+    def __init__(self, dpi = 200, image_format = 'png', max_points = -1, workers = 0):
+        '''
+        dpi: resolution of the raster images, lower values render faster
+        image_format: format of the images, 'png' or 'svg'
+        max_points: number of points the time series are decimated to before plotting. Negative values use
+                    twice the pixel width of the chart, a minimum and a maximum per pixel, and 0 plots every point
+        workers: number of processes the charts are rendered in, so that independent charts render concurrently.
+                 0 renders the charts in this process, one at a time
+        '''
+        if image_format not in self.mime_types:
+            raise ValueError(f"ReportCharts: unsupported image format '{image_format}'. Supported formats: {', '.join(self.mime_types)}")
+        self.dpi = dpi
+        self.image_format = image_format
+        self.max_points = max_points
+
+        # "Insufficient Data" images by size, font size, dpi and format
+        self.placeholders = {}
+
+        self._executor = None
+        self._python = find_python_executable() if workers > 0 else None
+        self.workers = workers if self._python is not None else 0
+
+    def render_in_pool(self, method, args, kwargs):
+        '''
+        Renders a chart in a worker process and waits for the result. The worker processes have their own pyplot state,
+        so the charts of concurrent callers render at the same time. The pool is started on first use
+        method: name of the chart method, e.g. 'GetCumulativeReturns'
+        '''
+        if self._executor is None:
+            # spawn instead of fork, the parent process can be a .NET host embedding Python
+            context = multiprocessing.get_context('spawn')
+            context.set_executable(self._python)
+            if not hasattr(sys, 'argv'):
+                sys.argv = ['']
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+
+        future = self._executor.submit(render_chart, self.dpi, self.image_format, self.max_points,
+                                       method, to_python(args), to_python(kwargs))
+        return future.result()
+
+    def close(self):
+        '''
+        Stops the worker processes of the chart pool
+        '''
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def fig_to_base64(self, filename = '', fig = None, dpi = None):
+        '''
+        Encodes the figure as a base64 data URI. The figure is rendered in memory, filename is kept for compatibility
+        '''
+        base64 = f'data:{self.mime_types[self.image_format]};base64,'
         if fig is not None:
-            fig.savefig(filename, dpi=dpi, bbox_inches='tight')
-            with open(filename, "rb") as fp:
-                base64 += b64encode(fp.read()).decode('utf-8').replace('\n', '')
+            buffer = BytesIO()
+            fig.savefig(buffer, format=self.image_format, dpi=dpi or self.dpi, bbox_inches='tight')
+            base64 += b64encode(buffer.getvalue()).decode('utf-8')
             return base64
 
-    def GetReturnsPerTrade(self, returns_per_trade = [], live_returns_per_trade = [],
-                           name = "returns-per-trade.png", width = 7, height = 5,
-                           live_color = "#ff9914", backtest_color = "#71c3fc"):
+    def get_placeholder(self, width, height, fontsize):
+        '''
+        Gets the "Insufficient Data" image of the given size, it is only rendered the first time
+        '''
+        key = (width, height, fontsize, self.dpi, self.image_format)
+        base64 = self.placeholders.get(key)
+        if base64 is not None:
+            return base64
 
-        if len(returns_per_trade) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
+        fig = plt.figure()
+        fig.set_size_inches(width, height)
 
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
+        left, box_width = .25, .5
+        bottom, box_height = .25, .5
+        right = left + box_width
+        top = bottom + box_height
 
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
+        ax = fig.add_axes([0, 0, 1, 1])
+        ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
+                horizontalalignment='center',
+                verticalalignment='center',
+                fontsize=fontsize,
+                transform=ax.transAxes)
 
-            ax.axis('off')
+        ax.axis('off')
 
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
+        for _, spine in ax.spines.items():
+            spine.set_visible(False)
 
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+        base64 = self.fig_to_base64('', fig)
+        plt.cla()
+        plt.clf()
+        plt.close('all')
+
+        self.placeholders[key] = base64
+        return base64
+
+    def decimate(self, time, *series, width = 11.5):
+        '''
+        Reduces the series sharing the time axis to the first and last points and, for each bucket of consecutive points,
+        the points with the minimum and maximum values. The buckets are narrower than a pixel of a chart of the given width,
+        so the chart looks the same while matplotlib draws a fraction of the points. The first and last NaN of each bucket
+        are kept too, so the lines still break at the gaps of the series
+        Returns the time and the series as lists
+        '''
+        time = list(time)
+        series = [list(values) for values in series]
+
+        max_points = self.max_points if self.max_points >= 0 else int(2 * width * self.dpi)
+        count = len(time)
+        if not series or max_points < 4 or count <= max_points or any(len(values) != count for values in series):
+            return (time, *series)
+
+        buckets = max_points // 2
+        starts = np.linspace(0, count, buckets + 1).astype(np.int64)[:-1]
+        bucket_of_point = np.repeat(np.arange(buckets), np.diff(np.append(starts, count)))
+
+        kept = [np.array([0, count - 1])]
+        for values in series:
+            values = np.asarray(values, dtype=float)
+            for reduce, fill in [(np.minimum, np.inf), (np.maximum, -np.inf)]:
+                filled = np.where(np.isnan(values), fill, values)
+                extremes = reduce.reduceat(filled, starts)
+                # the first point of each bucket holding its extreme
+                is_extreme = np.flatnonzero(filled == extremes[bucket_of_point])
+                _, first = np.unique(bucket_of_point[is_extreme], return_index=True)
+                kept.append(is_extreme[first])
+
+            is_nan = np.flatnonzero(np.isnan(values))
+            if len(is_nan) > 0:
+                nan_buckets = bucket_of_point[is_nan]
+                _, first = np.unique(nan_buckets, return_index=True)
+                _, last = np.unique(nan_buckets[::-1], return_index=True)
+                kept.extend([is_nan[first], is_nan[len(is_nan) - 1 - last]])
+
+        index = np.unique(np.concatenate(kept))
+        return ([time[i] for i in index], *[[values[i] for i in index] for values in series])
+
+    @renders_in_pool
+    def GetReturnsPerTrade(self, returns_per_trade = [], live_returns_per_trade = [],
+                           name = "returns-per-trade.png", width = 7, height = 5,
+                           live_color = "#ff9914", backtest_color = "#71c3fc"):
+
+        if len(returns_per_trade) == 0:
+            base64 = self.get_placeholder(width, height, 30)
             return base64
 
         if len(live_returns_per_trade) > 0:
@@ -135,6 +296,7 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @renders_in_pool
     def GetCumulativeReturns(self, data = None, live_data = None, benchmark_symbol = 'SPY',
                                  name = "cumulative-return.png", width = 11.5, height = 2.5, live_color = "#ff9914",
                                  backtest_color = "#71c3fc", gray = "#b3bcc0"):
@@ -151,30 +313,7 @@ class ReportCharts:
             live_data = [[],[],[],[]]
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_placeholder(width, height, 20)
             return base64
 
         plt.figure()
@@ -184,7 +323,7 @@ class ReportCharts:
 
         rectangles = []
         colors = [backtest_color, gray]
-        values = [[data[0], data[1]], [data[2], data[3]]]
+        values = [self.decimate(data[0], data[1], width=width), self.decimate(data[2], data[3], width=width)]
 
         for i, array in enumerate(values):
             if any(array[0]):
@@ -200,30 +339,7 @@ class ReportCharts:
 
         # Return if we don't have any valid labels
         if not any(labels):
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_placeholder(width, height, 20)
             return base64
 
         live_labels = []
@@ -232,7 +348,7 @@ class ReportCharts:
         if len(live_data[0]) > 0:
             colors = [live_color, gray]
             labels.append('Live')
-            values = [[live_data[0], live_data[1]], [live_data[2], live_data[3]]]
+            values = [self.decimate(live_data[0], live_data[1], width=width), self.decimate(live_data[2], live_data[3], width=width)]
 
             for i, array in enumerate(values):
                 if any(array[0]):
@@ -262,34 +378,12 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @renders_in_pool
     def GetDailyReturns(self, returns = [[],[]], live_returns = [[],[]],
                             name = "daily-returns.png", width = 11.5, height = 2.5,
                             live_color = "#ff9914", backtest_color = "#71c3fc", gray = "#b3bcc0"):
         if len(returns[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_placeholder(width, height, 20)
             return base64
 
         returns[0] = list(returns[0])
@@ -345,6 +439,7 @@ class ReportCharts:
         plt.clf()
         return base64
 
+    @renders_in_pool
     def GetMonthlyReturns(self, returns = {}, live_returns = {}, width=7, height=5, name='monthly-returns.png'):
         '''
         Expects monthly returns in dictionary keyed by year containing a list of monthly returns (as percentage values, i.e. 1% is 1.0 in the list).
@@ -359,30 +454,7 @@ class ReportCharts:
 
         if len(returns) == 0:
             print("No monthly returns found")
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_placeholder(width, height, 30)
             return base64
 
         # Make data frame
@@ -457,6 +529,7 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @renders_in_pool
     def GetAnnualReturns(self, data = None, live_data = None, name = "annual-returns.png",width = 3.5*2, height = 2.5*2):
 
         live_color = "#ff9914"
@@ -468,30 +541,7 @@ class ReportCharts:
             live_data = [[], []]
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_placeholder(width, height, 30)
             return base64
 
         # Cast to list just in case
@@ -528,34 +578,12 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @renders_in_pool
     def GetDrawdown(self, data = [[],[]], live_data = [[],[]], worst = [{}], name = "drawdowns.png",
                         width = 11.5, height = 2.5, gray = "#b3bcc0"):
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_placeholder(width, height, 20)
             return base64
 
         time = list(data[0]) + list(live_data[0])
@@ -569,7 +597,8 @@ class ReportCharts:
 
         # Backtest
         #ax.plot(time, drawdown, color=gray, zorder=2)
-        ax.fill_between(time, drawdown, 0, color=gray, zorder=3, step='post')
+        # the worst drawdown periods below are looked up in the whole series
+        ax.fill_between(*self.decimate(time, drawdown, width=width), 0, color=gray, zorder=3, step='post')
 
         for index, values in enumerate(worst):
             start = values['Begin']
@@ -613,6 +642,7 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @renders_in_pool
     def GetCrisisEventsPlots(self, data = [[],[],[]], name = '', width = 7, height = 5,
                              backtest_color = "#71c3fc", gray = "#b3bcc0"):
         if len(data[0]) == 0:
@@ -653,35 +683,13 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @renders_in_pool
     def GetRollingBeta(self, data = [[],[],[],[]], live_data = [[],[],[],[]], name = "rolling-portfolio-beta-to-equity.png",
                         width = 11.5, height = 2.5, live_six_months_color = "#ff9914", live_twelve_months_color = "#ffd700",
                         backtest_six_months_color = "#71c3fc", backtest_twelve_months_color = "#1d7dc1"):
 
         if len(data[0]) == 0 and len(live_data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_placeholder(width, height, 20)
             return base64
 
         # Data will come in the following format:
@@ -715,15 +723,15 @@ class ReportCharts:
 
         # Backtest
         if len(backtest_six_month_beta) > 0:
-            ax.plot(backtest_six_month_beta_dates, backtest_six_month_beta, linewidth=0.5, color=backtest_six_months_color)
+            ax.plot(*self.decimate(backtest_six_month_beta_dates, backtest_six_month_beta, width=width), linewidth=0.5, color=backtest_six_months_color)
         if len(backtest_twelve_month_beta) > 0:
-            ax.plot(backtest_twelve_month_beta_dates, backtest_twelve_month_beta, linewidth=0.5, color=backtest_twelve_months_color)
+            ax.plot(*self.decimate(backtest_twelve_month_beta_dates, backtest_twelve_month_beta, width=width), linewidth=0.5, color=backtest_twelve_months_color)
 
         # Live
         if len(live_six_month_beta) > 0:
-            ax.plot(live_six_month_beta_dates, live_six_month_beta, linewidth=0.5, color=live_six_months_color)
+            ax.plot(*self.decimate(live_six_month_beta_dates, live_six_month_beta, width=width), linewidth=0.5, color=live_six_months_color)
         if len(live_twelve_month_beta) > 0:
-            ax.plot(live_twelve_month_beta_dates, live_twelve_month_beta, linewidth=0.5, color=live_twelve_months_color)
+            ax.plot(*self.decimate(live_twelve_month_beta_dates, live_twelve_month_beta, width=width), linewidth=0.5, color=live_twelve_months_color)
 
         leg = ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
                         frameon=False, fontsize=8, ncol=2)
@@ -745,34 +753,12 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @renders_in_pool
     def GetRollingSharpeRatio(self, data = [[],[]], live_data = [[],[]], name = "rolling-sharpe-ratio.png",
                                 width = 11.5, height = 2.5, live_six_months_color = "#ff9914", live_twelve_months_color = "#ffd700",
                                 backtest_six_months_color = "#71c3fc", backtest_twelve_months_color = "#1d7dc1"):
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_placeholder(width, height, 20)
             return base64
 
         plt.figure()
@@ -804,15 +790,15 @@ class ReportCharts:
 
         # Backtest
         if len(backtest_six_month_rolling_sharpe) > 0:
-            ax.plot(backtest_six_month_rolling_sharpe_dates, backtest_six_month_rolling_sharpe, linewidth=0.5, color=backtest_six_months_color)
+            ax.plot(*self.decimate(backtest_six_month_rolling_sharpe_dates, backtest_six_month_rolling_sharpe, width=width), linewidth=0.5, color=backtest_six_months_color)
         if len(backtest_twelve_month_rolling_sharpe) > 0:
-            ax.plot(backtest_twelve_month_rolling_sharpe_dates, backtest_twelve_month_rolling_sharpe, linewidth=0.5, color=backtest_twelve_months_color)
+            ax.plot(*self.decimate(backtest_twelve_month_rolling_sharpe_dates, backtest_twelve_month_rolling_sharpe, width=width), linewidth=0.5, color=backtest_twelve_months_color)
 
         # Live
         if len(live_six_month_rolling_sharpe) > 0:
-            ax.plot(live_six_month_rolling_sharpe_dates, live_six_month_rolling_sharpe, linewidth=0.5, color=live_six_months_color)
+            ax.plot(*self.decimate(live_six_month_rolling_sharpe_dates, live_six_month_rolling_sharpe, width=width), linewidth=0.5, color=live_six_months_color)
         if len(live_twelve_month_rolling_sharpe) > 0:
-            ax.plot(live_twelve_month_rolling_sharpe_dates, live_twelve_month_rolling_sharpe, linewidth=0.5, color=live_twelve_months_color)
+            ax.plot(*self.decimate(live_twelve_month_rolling_sharpe_dates, live_twelve_month_rolling_sharpe, width=width), linewidth=0.5, color=live_twelve_months_color)
 
         leg = ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
                         frameon=False, fontsize=8)
@@ -835,33 +821,11 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @renders_in_pool
     def GetAssetAllocation(self, data = [[],[]], live_data = [[],[]],
                               name="asset-allocation.png", width = 7, height = 5):
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_placeholder(width, height, 30)
             return {"Backtest Asset Allocation": base64}
 
         symbols = [data[0], live_data[0]]
@@ -903,34 +867,12 @@ class ReportCharts:
 
         return pies
 
+    @renders_in_pool
     def GetLeverage(self, data = [[],[]], live_data = [[],[]], name = "leverage.png",width = 11.5,
                         height = 2.5, backtest_color = "#71c3fc", live_color = "#ff9914",):
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_placeholder(width, height, 20)
             return base64
 
         labels = ['Backtest']
@@ -940,13 +882,15 @@ class ReportCharts:
         fig = ax.get_figure()
 
         # Backtest
-        ax.fill_between(data[0], 0, data[1], color = backtest_color, alpha = 0.75, step='post')
+        time, leverage = self.decimate(data[0], data[1], width=width)
+        ax.fill_between(time, 0, leverage, color = backtest_color, alpha = 0.75, step='post')
 
         # Live
         if len(live_data[0]) != 0:
             labels.append('Live')
 
-        ax.fill_between(live_data[0], 0, live_data[1], color=live_color, alpha=0.75, step = 'post')
+        live_time, live_leverage = self.decimate(live_data[0], live_data[1], width=width)
+        ax.fill_between(live_time, 0, live_leverage, color=live_color, alpha=0.75, step = 'post')
 
         rectangles = [plt.Rectangle((0, 0), 1, 1, fc=backtest_color), plt.Rectangle((0, 0), 1, 1, fc=live_color)]
         ax.legend(rectangles, [label for label in labels], handlelength=0.8, handleheight=0.8,
@@ -970,35 +914,22 @@ class ReportCharts:
         plt.close('all')
         return base64
 
+    @renders_in_pool
     def GetExposure(self, time = [], long_securities = [], short_securities = [], long_data = [[]], short_data = [[]],
                         live_time = [], live_long_securities = [], live_short_securities = [], live_long_data = [[]],
                         live_short_data = [[]], name = "exposure.png", width = 11.5, height = 2.5):
         if len(time) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
+            base64 = self.get_placeholder(width, height, 20)
+            return base64
 
-            ax.axis('off')
+        # the time is shared by the rows of the long and short data, one row per security
+        long_data = list(long_data)
+        time, *rows = self.decimate(time, *long_data, *short_data, width=width)
+        long_data, short_data = rows[:len(long_data)], rows[len(long_data):]
 
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+        live_long_data = list(live_long_data)
+        live_time, *rows = self.decimate(live_time, *live_long_data, *live_short_data, width=width)
+        live_long_data, live_short_data = rows[:len(live_long_data)], rows[len(live_long_data):]
 
         for k, v in list(self.color_map.items()):
             self.color_map[k + ' - Short'] = '#' + hex(int(v[1:], 16) ^ 0xffffff)[2:].zfill(6)
@@ -1146,3 +1077,14 @@ class ReportCharts:
         plt.clf()
         plt.close('all')
         return base64
+
+# ReportCharts instance of each worker process by dpi, format and maximum points, their placeholder images are reused
+_worker_charts = {}
+
+def render_chart(dpi, image_format, max_points, method, args, kwargs):
+    '''Renders a single chart in a worker process of the chart pool'''
+    key = (dpi, image_format, max_points)
+    charts = _worker_charts.get(key)
+    if charts is None:
+        charts = _worker_charts[key] = ReportCharts(dpi, image_format, max_points)
+    return getattr(charts, method)(*args, **kwargs)
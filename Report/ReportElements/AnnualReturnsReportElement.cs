@@ -56,7 +56,7 @@ namespace QuantConnect.Report.ReportElements
             var liveStrategy = liveReturns.Values.ToList();
 
             var base64 = "";
-            using (Py.GIL())
+            using (LockCharting())
             {
                 var backtestList = new PyList();
                 var liveList = new PyList();
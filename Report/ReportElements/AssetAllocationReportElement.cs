@@ -65,7 +65,7 @@ namespace QuantConnect.Report.ReportElements
 
             PyObject result;
 
-            using (Py.GIL())
+            using (LockCharting())
             {
                 var data = new PyList();
                 var liveData = new PyList();
@@ -13,14 +13,23 @@
  * limitations under the License.
 */
 
+using System;
+using System.Threading;
 using Python.Runtime;
 using QuantConnect.Python;
+using QuantConnect.Configuration;
 
 
 namespace QuantConnect.Report.ReportElements
 {
     internal abstract class ChartReportElement : ReportElement
     {
+        // matplotlib.pyplot keeps the current figure in global state, and the GIL can switch threads in the
+        // middle of a chart method, so the charts of concurrent reports are rendered one at a time
+        // unless they are rendered in the worker processes of the chart pool, which have their own pyplot state
+        private static readonly object _chartingLock = new();
+        private static bool _renderInPool;
+
         internal static dynamic Charting;
 
         /// <summary>
@@ -30,12 +39,73 @@ namespace QuantConnect.Report.ReportElements
         {
             PythonInitializer.Initialize();
 
-            using (Py.GIL())
+            using (new ChartingScope(serialize: true))
             {
+                // all the elements, and the reports of a batch, share the same instance
+                if (Charting != null)
+                {
+                    return;
+                }
+
                 dynamic module = Py.Import("ReportCharts");
                 var classObj = module.ReportCharts;
 
-                Charting = classObj.Invoke();
+                // lower dpi or svg images render faster, the defaults keep the current output
+                var dpi = Config.GetInt("report-chart-dpi", 200);
+                var imageFormat = Config.Get("report-chart-format", "png");
+                // the time series are decimated to twice the pixel width of the charts by default
+                var maxPoints = Config.GetInt("report-chart-max-points", -1);
+                // 0 renders the charts in this process, the pool needs a standalone Python interpreter and falls back to 0 without one
+                var workers = Config.GetInt("report-chart-workers", 0);
+                Charting = classObj.Invoke(dpi.ToPython(), imageFormat.ToPython(), maxPoints.ToPython(), workers.ToPython());
+                _renderInPool = (int)Charting.workers > 0;
+            }
+        }
+
+        /// <summary>
+        /// Takes the lock that serializes the chart rendering of concurrent reports and then the GIL.
+        /// The lock is taken first, a thread waiting for it while holding the GIL would block the thread that has it.
+        /// With the chart pool only the GIL is taken, it is released while a chart is rendered in a worker process
+        /// </summary>
+        /// <returns>The scope that releases the GIL and the lock when disposed</returns>
+        protected static IDisposable LockCharting()
+        {
+            return new ChartingScope(serialize: !_renderInPool);
+        }
+
+        private sealed class ChartingScope : IDisposable
+        {
+            private readonly Py.GILState _gil;
+            private readonly bool _serialize;
+
+            public ChartingScope(bool serialize)
+            {
+                _serialize = serialize;
+                if (_serialize)
+                {
+                    Monitor.Enter(_chartingLock);
+                }
+                try
+                {
+                    _gil = Py.GIL();
+                }
+                catch
+                {
+                    if (_serialize)
+                    {
+                        Monitor.Exit(_chartingLock);
+                    }
+                    throw;
+                }
+            }
+
+            public void Dispose()
+            {
+                _gil.Dispose();
+                if (_serialize)
+                {
+                    Monitor.Exit(_chartingLock);
+                }
             }
         }
     }
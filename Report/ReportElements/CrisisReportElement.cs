@@ -61,7 +61,7 @@ namespace QuantConnect.Report.ReportElements
 
             foreach (var crisisEvent in Crisis.Events)
             {
-                using (Py.GIL())
+                using (LockCharting())
                 {
                     var crisis = crisisEvent.Value;
                     var data = new PyList();
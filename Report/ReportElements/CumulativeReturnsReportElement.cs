@@ -65,7 +65,7 @@ namespace QuantConnect.Report.ReportElements
             var liveBenchmarkStrategy = liveBenchmark.Values.ToList();
 
             var base64 = "";
-            using (Py.GIL())
+            using (LockCharting())
             {
                 var backtestList = new PyList();
                 var liveList = new PyList();
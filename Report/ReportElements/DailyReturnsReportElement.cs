@@ -57,7 +57,7 @@ namespace QuantConnect.Report.ReportElements
             var liveResampled = liveSeries.ResampleEquivalence(date => date.Date, s => s.LastValue()).PercentChange().DropMissing() * 100;
 
             var base64 = "";
-            using (Py.GIL())
+            using (LockCharting())
             {
                 var backtestList = new PyList();
                 backtestList.Append(backtestResampled.Keys.ToList().ToPython());
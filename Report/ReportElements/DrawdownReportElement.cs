@@ -59,7 +59,7 @@ namespace QuantConnect.Report.ReportElements
             var drawdownCollection = DrawdownCollection.FromResult(_backtest, _live, periods: 5);
 
             var base64 = "";
-            using (Py.GIL())
+            using (LockCharting())
             {
                 var backtestList = new PyList();
 
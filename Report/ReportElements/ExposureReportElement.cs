@@ -96,7 +96,7 @@ namespace QuantConnect.Report.ReportElements
             shortLiveFrame = shortLiveFrame.DropSparseColumnsAll();
 
             var base64 = "";
-            using (Py.GIL())
+            using (LockCharting())
             {
                 var time = backtestFrame.RowKeys.ToList().ToPython();
                 var longSecurities = longBacktestFrame.ColumnKeys.Select(x => x.Item1.ToStringInvariant()).ToList().ToPython();
@@ -64,7 +64,7 @@ namespace QuantConnect.Report.ReportElements
             var liveSeries = Metrics.LeverageUtilization(_livePortfolios).FillMissing(Direction.Forward);
 
             var base64 = "";
-            using (Py.GIL())
+            using (LockCharting())
             {
                 var backtestList = new PyList();
                 var liveList = new PyList();
@@ -61,7 +61,7 @@ namespace QuantConnect.Report.ReportElements
                 .Select(kvp => kvp.Value.TotalReturns());
 
             var base64 = "";
-            using (Py.GIL())
+            using (LockCharting())
             {
                 var backtestResults = new PyDict();
                 foreach (var kvp in backtestMonthlyReturns.GroupBy(kvp => kvp.Key.Year).GetObservations())
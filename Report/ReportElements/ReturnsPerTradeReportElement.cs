@@ -66,7 +66,7 @@ namespace QuantConnect.Report.ReportElements
             // TODO: LiveResult does not contain a TotalPerformance field, so skip live mode for now
 
             var base64 = "";
-            using (Py.GIL())
+            using (LockCharting())
             {
                 // Charting library does not expect values to be in whole percentage values (i.e. not 1% == 1.0, but rather 1% == 0.01),
                 base64 = Charting.GetReturnsPerTrade(backtestPercentagePerTrade.ToPython());
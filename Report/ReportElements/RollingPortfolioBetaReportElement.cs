@@ -60,7 +60,7 @@ namespace QuantConnect.Report.ReportElements
             var liveBenchmarkPoints = ResultsUtil.BenchmarkPoints(_live);
 
             var base64 = "";
-            using (Py.GIL())
+            using (LockCharting())
             {
                 var backtestList = new PyList();
                 var liveList = new PyList();
@@ -293,6 +293,94 @@ def getTradesOnlyHistory(algorithm, symbol, start):
             }
         }
 
+        [TestCase(Resolution.Tick, "HistoryFormat.COLUMNS")]
+        [TestCase(Resolution.Second, "HistoryFormat.COLUMNS")]
+        [TestCase(Resolution.Minute, "HistoryFormat.COLUMNS")]
+        [TestCase(Resolution.Daily, "HistoryFormat.COLUMNS")]
+        [TestCase(Resolution.Minute, "HistoryFormat.ARROW")]
+        [TestCase(Resolution.Minute, "HistoryFormat.COLUMNS", true)]
+        [TestCase(Resolution.Minute, "HistoryFormat.ARROW", true)]
+        public void PythonColumnarHistoryMatchesDataFrame(Resolution resolution, string format, bool customData = false)
+        {
+            var start = new DateTime(2013, 10, 07);
+            _algorithm = GetAlgorithm(start.AddDays(1));
+            var spy = _algorithm.AddEquity("SPY").Symbol;
+            var ibm = _algorithm.AddEquity("IBM").Symbol;
+
+            using (Py.GIL())
+            {
+                var pythonModule = PyModule.FromString("testModule",
+                    @$"
+from AlgorithmImports import *
+
+class UnalignedCustomData(PythonData):
+    def get_source(self, config, date, is_live_mode):
+        underlying = config.symbol.underlying
+        file_name = LeanData.generate_zip_file_name(underlying, date, config.resolution, config.tick_type)
+        source = Globals.data_folder + 'equity/usa/minute/' + underlying.value.lower() + '/' + file_name
+        return SubscriptionDataSource(source, SubscriptionTransportMedium.LOCAL_FILE, FileFormat.CSV)
+
+    def reader(self, config, line, date, is_live_mode):
+        data = line.split(',')
+        minute = (int(data[0]) - 34200000) // 60000
+
+        result = UnalignedCustomData()
+        result.symbol = config.symbol
+        result.time = date.date() + timedelta(milliseconds=int(data[0]))
+        result.end_time = result.time + timedelta(minutes=1)
+        result.value = float(data[4])
+        # the first bar of the day sets every field, the later ones skip some of them so that the fields don't share the same times
+        result['close'] = float(data[4])
+        if minute % 2 == 0:
+            result['open'] = float(data[1])
+        if minute % 3 == 0:
+            result['label'] = 'bar ' + str(minute)
+        return result
+
+def assert_columns_match_data_frame(algorithm, symbols, start, end, resolution, custom_data):
+    if custom_data:
+        symbols = [Symbol.create_base(UnalignedCustomData, symbol, Market.USA) for symbol in symbols]
+        frame = algorithm.history(UnalignedCustomData, symbols, start, end, resolution)
+        columns = algorithm.history(UnalignedCustomData, symbols, start, end, resolution, format={format})
+    else:
+        frame = algorithm.history(symbols, start, end, resolution)
+        columns = algorithm.history(symbols, start, end, resolution, format={format})
+    if not isinstance(columns, dict):
+        columns = columns.to_pydict()
+        columns = {{ key: np.array(values) for key, values in columns.items() }}
+
+    if frame.empty or not set(frame.columns).issubset(columns):
+        raise ValueError(f'Columns {{list(columns)}} do not match the data frame columns {{list(frame.columns)}}')
+
+    expected = frame.reset_index()
+    np.testing.assert_array_equal(columns['symbol'], [str(x.id) for x in expected['symbol']])
+    np.testing.assert_array_equal(columns['time'], expected['time'].values.astype('datetime64[ns]').astype(np.int64))
+    for column in frame.columns:
+        if frame[column].dtype.kind in 'fiub':
+            np.testing.assert_array_equal(columns[column].astype(float), expected[column].values.astype(float), err_msg=column)
+");
+                using var assertColumnsMatchDataFrame = pythonModule.GetAttr("assert_columns_match_data_frame");
+                _algorithm.SetPandasConverter();
+                using var pySymbols = new PyList(new[] { spy.ToPython(), ibm.ToPython() });
+                using var pyAlgorithm = _algorithm.ToPython();
+                using var pyResolution = resolution.ToPython();
+
+                var (historyStart, historyEnd) = resolution switch
+                {
+                    Resolution.Tick => (start.AddHours(9.5), start.AddHours(9.5).AddSeconds(5)),
+                    Resolution.Second => (start.AddHours(12), start.AddHours(12.2)),
+                    Resolution.Minute => (start, start.AddDays(1)),
+                    _ => (start.AddDays(-10), start.AddDays(1))
+                };
+                using var pyStart = historyStart.ToPython();
+                using var pyEnd = historyEnd.ToPython();
+
+                using var pyCustomData = customData.ToPython();
+
+                Assert.DoesNotThrow(() => assertColumnsMatchDataFrame.Invoke(pyAlgorithm, pySymbols, pyStart, pyEnd, pyResolution, pyCustomData));
+            }
+        }
+
         [Test]
         public void ImplicitTickResolutionHistoryRequestTradeBarDoesNotThrowsException()
         {
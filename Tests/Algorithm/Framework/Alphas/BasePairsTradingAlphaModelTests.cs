@@ -13,12 +13,17 @@
  * limitations under the License.
 */
 
+using System;
 using System.Collections.Generic;
+using System.Linq;
 using NUnit.Framework;
 using Python.Runtime;
 using QuantConnect.Algorithm;
 using QuantConnect.Algorithm.Framework.Alphas;
 using QuantConnect.Algorithm.Framework.Selection;
+using QuantConnect.Securities;
+using QuantConnect.Tests.Common.Data.UniverseSelection;
+using QuantConnect.Tests.Engine.DataFeeds;
 
 namespace QuantConnect.Tests.Algorithm.Framework.Alphas
 {
@@ -57,6 +62,82 @@ namespace QuantConnect.Tests.Algorithm.Framework.Alphas
             }
         }
 
+        [Test]
+        public void PythonPairsShareOneConsolidatorPerSymbol()
+        {
+            var algorithm = new QCAlgorithm();
+            algorithm.SubscriptionManager.SetDataManager(new DataManagerStub(algorithm));
+            var securities = new[] { "AIG", "BAC", "IBM", "SPY" }.Select(ticker => algorithm.AddEquity(ticker)).ToArray();
+            var model = CreatePythonAlphaModel();
+
+            int ConsolidatorsCount(Security security) => security.Subscriptions.Sum(x => x.Consolidators.Count);
+
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.AddedNonInternal(securities.Take(3).ToArray()));
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.AddedNonInternal(securities[3]));
+
+            // 6 pairs, but a single consolidator per symbol
+            using (Py.GIL())
+            {
+                Assert.AreEqual(6, ((AlphaModelPythonWrapper)model).GetProperty("pairs").Length());
+            }
+            Assert.IsTrue(securities.All(x => ConsolidatorsCount(x) == 1));
+
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.RemovedNonInternal(securities[0]));
+
+            using (Py.GIL())
+            {
+                Assert.AreEqual(3, ((AlphaModelPythonWrapper)model).GetProperty("pairs").Length());
+            }
+            Assert.AreEqual(0, ConsolidatorsCount(securities[0]));
+            Assert.IsTrue(securities.Skip(1).All(x => ConsolidatorsCount(x) == 1));
+        }
+
+        [Test]
+        public void PythonRemovedPairsStopListeningToSharedPrices()
+        {
+            var algorithm = new QCAlgorithm();
+            algorithm.SubscriptionManager.SetDataManager(new DataManagerStub(algorithm));
+            var securities = new[] { "AIG", "BAC", "IBM" }.Select(ticker => algorithm.AddEquity(ticker)).ToArray();
+
+            using (Py.GIL())
+            {
+                var instance = Py.Import("BasePairsTradingAlphaModel").GetAttr("BasePairsTradingAlphaModel").Invoke(_lookback.ToPython(), _resolution.ToPython());
+                var model = new AlphaModelPythonWrapper(instance);
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+
+def get_pairs(model, ticker):
+    return [pair for key, pair in model.pairs.items() if ticker in [x.value for x in key]]
+
+def get_prices(model):
+    return [entry[0] for entry in model._price_indicators.values()]
+
+def update_prices(prices, time):
+    for price in prices:
+        price.update(time, 10)
+");
+                model.OnSecuritiesChanged(algorithm, SecurityChangesTests.AddedNonInternal(securities));
+                var removed = module.GetAttr("get_pairs").Invoke(instance, "AIG".ToPython());
+                Assert.AreEqual(2, (int)removed.Length());
+
+                // the shared price indicators are captured before the removal releases the one of AIG
+                var prices = module.GetAttr("get_prices").Invoke(instance);
+                module.GetAttr("update_prices").Invoke(prices, new DateTime(2024, 1, 2).ToPython());
+
+                model.OnSecuritiesChanged(algorithm, SecurityChangesTests.RemovedNonInternal(securities[0]));
+                Assert.AreEqual(1, (int)instance.GetAttr("pairs").Length());
+                module.GetAttr("update_prices").Invoke(prices, new DateTime(2024, 1, 3).ToPython());
+
+                foreach (var pair in removed)
+                {
+                    Assert.AreEqual(1, pair.GetAttr("ratio").GetAttr("samples").As<int>());
+                }
+                var remaining = module.GetAttr("get_pairs").Invoke(instance, "IBM".ToPython());
+                Assert.AreEqual(2, remaining[0].GetAttr("ratio").GetAttr("samples").As<int>());
+            }
+        }
+
         protected override IEnumerable<Insight> ExpectedInsights()
         {
             Assert.Ignore("The CommonAlphaModelTests need to be refactored to support multiple securities with different prices for each security");
@@ -0,0 +1,101 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Linq;
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Algorithm;
+using QuantConnect.Python;
+using QuantConnect.Tests.Engine.DataFeeds;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Alphas
+{
+    [TestFixture]
+    public class HistoricalReturnsAlphaModelTests
+    {
+        [OneTimeSetUp]
+        public void Initialize()
+        {
+            PythonInitializer.Initialize();
+        }
+
+        [Test]
+        public void PythonBatchedModeEmitsTheSameInsights()
+        {
+            var algorithm = new QCAlgorithm();
+            algorithm.HistoryProvider = new SineHistoryProvider(algorithm.Securities);
+            algorithm.SubscriptionManager.SetDataManager(new DataManagerStub(algorithm));
+            algorithm.SetStartDate(2018, 1, 4);
+            var securities = new[] { "SPY", "AIG", "BAC", "IBM", "AAPL" }.Select(ticker => algorithm.AddEquity(ticker, Resolution.Daily)).ToList();
+
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+from Alphas.HistoricalReturnsAlphaModel import HistoricalReturnsAlphaModel
+
+def test(algorithm, securities):
+    random = np.random.default_rng(3)
+    models = [HistoricalReturnsAlphaModel(lookback = 2), HistoricalReturnsAlphaModel(lookback = 2, batched = True)]
+    active = list(securities)
+    inactive = []
+
+    def change(added, removed):
+        for model in models:
+            model.on_securities_changed(algorithm, SecurityChanges.create(added, removed, [], []))
+
+    change(active, [])
+    time = datetime(2030, 1, 1)
+    emitted = 0
+    for step in range(200):
+        # removes a security and adds one back later, the batched model reuses the released slots
+        if step % 20 == 5:
+            removed = active.pop(int(random.integers(len(active))))
+            inactive.append(removed)
+            change([], [removed])
+        if step % 20 == 15:
+            added = inactive.pop(int(random.integers(len(inactive))))
+            active.append(added)
+            change([added], [])
+
+        time += timedelta(days = 1)
+        # few distinct prices so that some of the returns are zero and their insights are cancelled
+        for security in active:
+            price = float(random.choice([10, 10.5, 11]))
+            for model in models:
+                model._symbol_data_by_symbol[security.symbol].roc.update(time, price)
+
+        # the slot of a removed security is reused when a security is added
+        if len(models[1]._returns) != 16:
+            return False
+
+        results = [sorted((str(x.symbol), str(x.direction), x.magnitude) for x in model.update(algorithm, None)) for model in models]
+        if len(results[0]) != len(results[1]):
+            return False
+        for expected, actual in zip(*results):
+            if expected[:2] != actual[:2] or abs(expected[2] - actual[2]) > 1e-12:
+                return False
+        emitted += len(results[0])
+
+    return emitted > 0");
+
+                using var pySecurities = new PyList(securities.Select(x => x.ToPython()).ToArray());
+                Assert.IsTrue(module.GetAttr("test").Invoke(algorithm.ToPython(), pySecurities).As<bool>());
+            }
+        }
+    }
+}
@@ -0,0 +1,70 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Alphas
+{
+    [TestFixture]
+    public class PearsonCorrelationPairsTradingAlphaModelTests
+    {
+        [TestCase(2, 1)]
+        [TestCase(10, 1)]
+        [TestCase(50, 5)]
+        public void RankPairsMatchesPairwisePearsonCorrelation(int size, int count)
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+from scipy.stats import pearsonr
+from Alphas.PearsonCorrelationPairsTradingAlphaModel import PearsonCorrelationPairsTradingAlphaModel
+
+def test(size, count):
+    returns = pd.DataFrame(np.random.default_rng(0).normal(size=(60, size)))
+    expected = sorted(((i, j) for i in range(size) for j in range(i + 1, size)),
+        key = lambda pair: pearsonr(returns.iloc[:, pair[0]], returns.iloc[:, pair[1]])[0], reverse = True)[:count]
+
+    pairs = PearsonCorrelationPairsTradingAlphaModel().rank_pairs(returns, count)
+    return [pair for pair, _ in pairs] == expected");
+
+                Assert.IsTrue(module.GetAttr("test").Invoke(size.ToPython(), count.ToPython()).As<bool>());
+            }
+        }
+
+        [Test]
+        public void RankPairsIgnoresUndefinedCorrelations()
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+from Alphas.PearsonCorrelationPairsTradingAlphaModel import PearsonCorrelationPairsTradingAlphaModel
+
+def test():
+    model = PearsonCorrelationPairsTradingAlphaModel()
+    returns = pd.DataFrame({ 'A': [0.01, 0.02, -0.01, 0.03], 'B': [0.0, 0.0, 0.0, 0.0], 'C': [0.02, 0.03, -0.02, 0.02] })
+    pairs = model.rank_pairs(returns, 1)
+    return len(model.rank_pairs(returns[['A']], 1)) == 0 and pairs[0][0] == (0, 2)");
+
+                Assert.IsTrue(module.GetAttr("test").Invoke().As<bool>());
+            }
+        }
+    }
+}
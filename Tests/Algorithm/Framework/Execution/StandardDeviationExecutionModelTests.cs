@@ -184,6 +184,123 @@ namespace QuantConnect.Tests.Algorithm.Framework.Execution
             Assert.DoesNotThrow(() => model.OnSecuritiesChanged(algorithm, changes));
         }
 
+        [Test]
+        public void PythonWarmsUpTheAddedSecuritiesWithASingleHistoryRequest()
+        {
+            var time = new DateTime(2018, 8, 2, 16, 0, 0);
+            var symbols = new[] { Symbols.AAPL, Symbols.SPY, Symbols.IBM };
+            var historyProvider = new Mock<IHistoryProvider>();
+            historyProvider.Setup(m => m.GetHistory(It.IsAny<IEnumerable<HistoryRequest>>(), It.IsAny<DateTimeZone>()))
+                .Returns(Enumerable.Range(0, 5).Select(i => new Slice(time.AddMinutes(i),
+                    symbols.Select((symbol, j) =>
+                    {
+                        var price = 100m * (j + 1) + i * i;
+                        return (BaseData)new TradeBar(time.AddMinutes(i), symbol, price, price, price, price, 100m);
+                    }).ToList(), time.AddMinutes(i))));
+
+            var algorithm = new QCAlgorithm();
+            algorithm.SetPandasConverter();
+            algorithm.SetHistoryProvider(historyProvider.Object);
+            algorithm.SubscriptionManager.SetDataManager(new DataManagerStub(algorithm));
+            algorithm.SetDateTime(time.AddMinutes(5));
+            var securities = symbols.Select(x => algorithm.AddEquity(x.Value)).ToList();
+            algorithm.SetFinishedWarmingUp();
+
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+from Execution.StandardDeviationExecutionModel import StandardDeviationExecutionModel
+
+def test(algorithm, securities):
+    # the second model reuses the warm indicators of the first one
+    models = [StandardDeviationExecutionModel(2, 1.5), StandardDeviationExecutionModel(2, 1.5)]
+    for model in models:
+        model.on_securities_changed(algorithm, SecurityChanges.create(securities, [], [], []))
+
+    for j, security in enumerate(securities):
+        sma = SimpleMovingAverage(2)
+        std = StandardDeviation(2)
+        for i in range(5):
+            end_time = datetime(2018, 8, 2, 16, i + 1)
+            sma.update(end_time, 100 * (j + 1) + i * i)
+            std.update(end_time, 100 * (j + 1) + i * i)
+
+        data = models[0]._symbol_data[security.symbol]
+        shared = models[1]._symbol_data[security.symbol]
+        if shared.sma is not data.sma or shared.std is not data.std or data.needs_warm_up or shared.needs_warm_up:
+            return False
+        for indicator, expected in [(data.sma, sma), (data.std, std)]:
+            if (indicator.samples != 5 or indicator.current.end_time != expected.current.end_time
+                or abs(indicator.current.value - expected.current.value) > 1e-10):
+                return False
+    return True");
+
+                using var pySecurities = new PyList(securities.Select(x => x.ToPython()).ToArray());
+                Assert.IsTrue(module.GetAttr("test").Invoke(algorithm.ToPython(), pySecurities).As<bool>());
+            }
+
+            historyProvider.Verify(m => m.GetHistory(It.IsAny<IEnumerable<HistoryRequest>>(), It.IsAny<DateTimeZone>()), Times.Once);
+        }
+
+        [Test]
+        public void PythonSharedIndicatorPoolRemovesTheConsolidatorWhenNoIndicatorIsUsed()
+        {
+            var algorithm = new QCAlgorithm();
+            algorithm.SubscriptionManager.SetDataManager(new DataManagerStub(algorithm));
+            var security = algorithm.AddEquity(Symbols.AAPL.Value);
+
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+from SharedIndicatorPool import SharedIndicatorPool
+
+def count_consolidators(algorithm, symbol):
+    return sum(config.consolidators.count for config in algorithm.subscription_manager.subscriptions if config.symbol == symbol)
+
+class TestAlgorithm(QCAlgorithm):
+    pass
+
+def test(algorithm, symbol):
+    pool = SharedIndicatorPool.get(algorithm)
+    if SharedIndicatorPool.get(algorithm) is not pool:
+        return False
+
+    # the pool of a Python algorithm is stored on it, only the pool of the last .NET algorithm is kept by the class
+    python_algorithm = TestAlgorithm()
+    python_pool = SharedIndicatorPool.get(python_algorithm)
+    if python_pool is pool or python_algorithm._shared_indicator_pool is not python_pool or SharedIndicatorPool._clr_pool is not pool:
+        return False
+    if SharedIndicatorPool.get(QCAlgorithm()) is pool or SharedIndicatorPool._clr_pool is pool:
+        return False
+
+    create_sma = lambda name: SimpleMovingAverage(name, 2)
+    sma, sma_created = pool.acquire(symbol, Resolution.MINUTE, 'SMA2', create_sma)
+    shared, shared_created = pool.acquire(symbol, Resolution.MINUTE, 'SMA2', create_sma)
+    std, std_created = pool.acquire(symbol, Resolution.MINUTE, 'STD2', lambda name: StandardDeviation(name, 2))
+    if not sma_created or shared_created or shared is not sma or not std_created or count_consolidators(algorithm, symbol) != 1:
+        return False
+
+    # the consolidator stays while one of the references to the SMA is not released
+    pool.release(symbol, Resolution.MINUTE, 'SMA2')
+    pool.release(symbol, Resolution.MINUTE, 'STD2')
+    if count_consolidators(algorithm, symbol) != 1:
+        return False
+    pool.release(symbol, Resolution.MINUTE, 'SMA2')
+    if count_consolidators(algorithm, symbol) != 0:
+        return False
+
+    # indicators acquired after they were released are created again
+    recreated, created = pool.acquire(symbol, Resolution.MINUTE, 'SMA2', create_sma)
+    return created and recreated is not sma and count_consolidators(algorithm, symbol) == 1");
+
+                Assert.IsTrue(module.GetAttr("test").Invoke(algorithm.ToPython(), security.Symbol.ToPython()).As<bool>());
+            }
+        }
+
         private static IExecutionModel GetExecutionModel(Language language)
         {
             const int period = 2;
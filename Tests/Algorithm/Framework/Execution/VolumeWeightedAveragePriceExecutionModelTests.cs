@@ -146,6 +146,89 @@ namespace QuantConnect.Tests.Algorithm.Framework.Execution
             }
         }
 
+        [TestCase(Language.CSharp)]
+        [TestCase(Language.Python)]
+        public void TargetsWithoutDataDoNotStopTheOtherTargets(Language language)
+        {
+            var time = new DateTime(2018, 8, 2, 16, 0, 0);
+            var algorithm = new QCAlgorithm();
+            algorithm.SubscriptionManager.SetDataManager(new DataManagerStub(algorithm));
+            algorithm.SetPandasConverter();
+            algorithm.SetDateTime(time);
+
+            var security = algorithm.AddEquity(Symbols.AAPL.Value);
+            security.SetMarketPrice(new TradeBar { Value = 250, Volume = 5000 });
+            // the model has no data for SPY, its larger target is executed first
+            var spy = algorithm.AddEquity(Symbols.SPY.Value);
+            spy.SetMarketPrice(new TradeBar { Value = 250, Volume = 5000 });
+
+            algorithm.SetFinishedWarmingUp();
+
+            var orderProcessor = ImmediateExecutionModelTests.GetAndSetBrokerageTransactionHandler(algorithm, out var brokerage);
+
+            try
+            {
+                var model = GetExecutionModel(language);
+                algorithm.SetExecution(model);
+
+                var changes = SecurityChangesTests.CreateNonInternal(new[] { security }, Enumerable.Empty<Security>());
+                model.OnSecuritiesChanged(algorithm, changes);
+
+                var consolidator = security.Subscriptions.Single(s => s.TickType == LeanData.GetCommonTickType(SecurityType.Equity)).Consolidators.First();
+                consolidator.Update(new TradeBar(time.AddMinutes(-1), Symbols.AAPL, 260, 260, 260, 260, 100, Time.OneMinute));
+
+                var targets = new IPortfolioTarget[] { new PortfolioTarget(Symbols.SPY, 1000), new PortfolioTarget(security.Symbol, 10) };
+                model.Execute(algorithm, targets);
+                orderProcessor.ProcessSynchronousEvents();
+
+                var orders = orderProcessor.GetOrders().ToList();
+                Assert.AreEqual(1, orders.Count);
+                Assert.AreEqual(Symbols.AAPL, orders[0].Symbol);
+                Assert.AreEqual(10, orders[0].Quantity);
+            }
+            finally
+            {
+                orderProcessor.Exit();
+                brokerage?.Dispose();
+            }
+        }
+
+        [Test]
+        public void PythonIntradayVwapResetsOnSessionBoundaries()
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+from Execution.VolumeWeightedAveragePriceExecutionModel import IntradayVwap
+
+def test():
+    symbol = Symbol.create('AAPL', SecurityType.EQUITY, Market.USA)
+    vwap = IntradayVwap('vwap')
+    if vwap.is_ready or not isinstance(vwap.last_date, date):
+        return False
+
+    start = datetime(2024, 1, 2, 9, 30)
+    vwap.update(TradeBar(start, symbol, 100, 102, 98, 100, 10, timedelta(minutes=1)))
+    vwap.update(TradeBar(start + timedelta(minutes=1), symbol, 104, 104, 104, 104, 30, timedelta(minutes=1)))
+    # fill forward bars and quote ticks are ignored, trade ticks are added with their quantity and price
+    vwap.update(TradeBar(start + timedelta(minutes=1), symbol, 50, 50, 50, 50, 1000, timedelta(minutes=1)).clone(True))
+    vwap.update(Tick(start + timedelta(minutes=2), symbol, 1, 2))
+    vwap.update(Tick(start + timedelta(minutes=2), symbol, '', '', 60, 106))
+    if not vwap.is_ready or abs(vwap.value - (100 * 10 + 104 * 30 + 106 * 60) / 100) > 1e-9:
+        return False
+    if vwap.last_date != date(2024, 1, 2):
+        return False
+
+    # the sums are reset on the next session
+    vwap.update(TradeBar(start + timedelta(days=1), symbol, 90, 90, 90, 90, 5, timedelta(minutes=1)))
+    return vwap.value == 90 and vwap.sum_of_volume == 5 and vwap.last_date == date(2024, 1, 3)");
+
+                Assert.IsTrue(module.GetAttr("test").Invoke().As<bool>());
+            }
+        }
+
         private static IExecutionModel GetExecutionModel(Language language)
         {
             if (language == Language.Python)
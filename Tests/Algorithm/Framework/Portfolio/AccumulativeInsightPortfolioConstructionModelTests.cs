@@ -41,8 +41,13 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
         [SetUp]
         public void SetUp()
         {
-            _algorithm = new QCAlgorithm();
-            _algorithm.SubscriptionManager.SetDataManager(new DataManagerStub(_algorithm));
+            _algorithm = CreateAlgorithm();
+        }
+
+        private QCAlgorithm CreateAlgorithm()
+        {
+            var algorithm = new QCAlgorithm();
+            algorithm.SubscriptionManager.SetDataManager(new DataManagerStub(algorithm));
 
             var prices = new Dictionary<Symbol, decimal>
             {
@@ -55,9 +60,10 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             {
                 var symbol = kvp.Key;
                 var security = GetSecurity(symbol);
-                security.SetMarketPrice(new Tick(_algorithm.Time, symbol, kvp.Value, kvp.Value));
-                _algorithm.Securities.Add(symbol, security);
+                security.SetMarketPrice(new Tick(algorithm.Time, symbol, kvp.Value, kvp.Value));
+                algorithm.Securities.Add(symbol, security);
             }
+            return algorithm;
         }
 
 
@@ -446,6 +452,106 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             Assert.IsTrue(createdValidTarget);
         }
 
+        [TestCase(PortfolioBias.LongShort, 1)]
+        [TestCase(PortfolioBias.LongShort, 2)]
+        [TestCase(PortfolioBias.Long, 3)]
+        [TestCase(PortfolioBias.Short, 4)]
+        public void PythonRunningStateMatchesTheReplayOfTheActiveInsights(PortfolioBias bias, int seed)
+        {
+            // the same insight stream is sent to a model on each algorithm, every algorithm has its own insights
+            var algorithms = new[] { _algorithm, CreateAlgorithm() };
+            foreach (var algorithm in algorithms)
+            {
+                algorithm.SetDateTime(new DateTime(2018, 7, 31, 14, 0, 0));
+            }
+
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+from AccumulativeInsightPortfolioConstructionModel import AccumulativeInsightPortfolioConstructionModel
+
+class ReplayAccumulativeInsightPortfolioConstructionModel(AccumulativeInsightPortfolioConstructionModel):
+    '''The replay of all the active insights on every rebalance that the running state replaced'''
+    def determine_target_percent(self, active_insights):
+        percent_per_symbol = {}
+        insights = sorted(self.algorithm.insights.get_active_insights(self.current_utc_time), key=lambda insight: insight.generated_time_utc)
+        for insight in insights:
+            target_percent = 0
+            if insight.symbol in percent_per_symbol:
+                target_percent = percent_per_symbol[insight.symbol]
+                if insight.direction == InsightDirection.FLAT:
+                    if abs(target_percent) < self.percent:
+                        target_percent = 0
+                    else:
+                        target_percent += (-self.percent if target_percent > 0 else self.percent)
+            target_percent += self.percent * insight.direction
+            if self.portfolio_bias != PortfolioBias.LONG_SHORT and self.sign(target_percent) != self.portfolio_bias:
+                target_percent = 0
+            percent_per_symbol[insight.symbol] = target_percent
+        return dict((insight, percent_per_symbol[insight.symbol]) for insight in active_insights)
+
+    def create_targets(self, algorithm, insights):
+        self.current_utc_time = algorithm.utc_time
+        return super(AccumulativeInsightPortfolioConstructionModel, self).create_targets(algorithm, insights)
+
+def create_insight(symbol, direction, generated_time_utc, period):
+    insight = Insight.price(symbol, period, direction)
+    insight.generated_time_utc = generated_time_utc
+    insight.close_time_utc = generated_time_utc + period
+    return insight
+
+def to_tuples(targets):
+    return sorted((str(x.symbol), float(x.quantity)) for x in targets)
+
+def test(algorithms, bias, seed):
+    random = np.random.default_rng(seed)
+    models = [PortfolioConstructionModelPythonWrapper(ReplayAccumulativeInsightPortfolioConstructionModel(None, bias)),
+        PortfolioConstructionModelPythonWrapper(AccumulativeInsightPortfolioConstructionModel(None, bias))]
+    symbols = list(algorithms[0].securities.keys)
+    directions = [InsightDirection.DOWN, InsightDirection.FLAT, InsightDirection.UP]
+    # the insights of each algorithm, the same insight is at the same index
+    insights = [[], []]
+    compared = 0
+
+    for step in range(300):
+        utc_time = algorithms[0].utc_time + timedelta(minutes = 1)
+        for algorithm in algorithms:
+            algorithm.set_date_time(utc_time)
+
+        # some of the insights are generated before the current time
+        created = [(symbols[int(random.integers(len(symbols)))], directions[int(random.integers(3))],
+            utc_time - timedelta(minutes = int(random.choice([0, 0, 0, 5]))), timedelta(minutes = int(random.integers(1, 30))))
+            for _ in range(int(random.integers(0, 4)))]
+        new_insights = [[create_insight(*x) for x in created] for _ in algorithms]
+        # insights cancelled, cleared or added without going through create_targets, also in the same step as new insights
+        cancelled = int(random.integers(len(insights[0]))) if len(insights[0]) > 0 and random.random() < 0.1 else None
+        cleared = symbols[int(random.integers(len(symbols)))] if random.random() < 0.03 else None
+        added = create_insight(*created[0]) if len(created) > 0 and random.random() < 0.05 else None
+
+        for i, algorithm in enumerate(algorithms):
+            if cancelled is not None:
+                algorithm.insights.cancel(Array[Insight]([insights[i][cancelled]]))
+            if cleared is not None:
+                algorithm.insights.clear(Array[Symbol]([cleared]))
+            if added is not None:
+                algorithm.insights.add(added if i == 0 else create_insight(added.symbol, added.direction, added.generated_time_utc, added.period))
+            algorithm.insights.add_range(new_insights[i])
+            insights[i].extend(new_insights[i])
+
+        results = [to_tuples(model.create_targets(algorithm, Array[Insight](new_insights[i]))) for i, (model, algorithm) in enumerate(zip(models, algorithms))]
+        if [x[0] for x in results[0]] != [x[0] for x in results[1]] or [x[1] for x in results[0]] != [x[1] for x in results[1]]:
+            return False
+        compared += len(results[0])
+
+    return compared > 0");
+
+                using var pyAlgorithms = new PyList(algorithms.Select(x => x.ToPython()).ToArray());
+                Assert.IsTrue(module.GetAttr("test").Invoke(pyAlgorithms, ((int)bias).ToPython(), seed.ToPython()).As<bool>());
+            }
+        }
+
         private Security GetSecurity(Symbol symbol)
         {
             var exchangeHours = MarketHoursDatabase.FromDataFolder().GetExchangeHours(symbol.ID.Market, symbol, symbol.SecurityType);
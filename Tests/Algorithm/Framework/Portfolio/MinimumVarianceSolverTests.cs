@@ -0,0 +1,118 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Logging;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Portfolio;
+
+[TestFixture]
+public class MinimumVarianceSolverTests
+{
+    private const string Code = @"
+from AlgorithmImports import *
+from time import perf_counter
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
+
+def get_returns(size, seed = 0):
+    random = np.random.default_rng(seed)
+    return pd.DataFrame(random.normal(0.0005, 0.01, (63, size)), columns = [f'S{i}' for i in range(size)])
+
+def create(name, lower, upper, fast):
+    if name == 'MinimumVariance':
+        return MinimumVariancePortfolioOptimizer(lower, upper, 0.0005, use_fast_solver = fast)
+    return MaximumSharpeRatioPortfolioOptimizer(lower, upper, use_fast_solver = fast)
+
+def is_feasible(optimizer, weights):
+    return np.all(weights >= optimizer.minimum_weight - 1e-6) and np.all(weights <= optimizer.maximum_weight + 1e-6)
+
+def fast_solver_is_not_worse(name, lower, upper, size):
+    returns = get_returns(size)
+    covariance = returns.cov().values
+    default = create(name, lower, upper, False).optimize(returns)
+    fast_optimizer = create(name, lower, upper, True)
+    fast = fast_optimizer.optimize(returns)
+
+    # the fast solver finds the same optimum, or a better one since the default path stops as soon as SLSQP tolerance is reached
+    if not is_feasible(fast_optimizer, fast):
+        return False
+    return fast @ covariance @ fast <= default @ covariance @ default * (1 + 1e-3)
+
+def warm_start_uses_previous_weights():
+    optimizer = create('MinimumVariance', 0, 0.3, True)
+    returns = get_returns(10)
+    weights = optimizer.optimize(returns)
+    guess = optimizer._solver.get_initial_guess(10, returns.columns)
+    return np.allclose(guess, np.clip(weights, 0, 0.3))
+
+def benchmark(name, lower, upper, size, rebalances):
+    elapsed = {}
+    for fast in [False, True]:
+        optimizer = create(name, lower, upper, fast)
+        start = perf_counter()
+        for i in range(rebalances):
+            optimizer.optimize(get_returns(size, i))
+        elapsed[fast] = (perf_counter() - start) / rebalances
+    return f'{name} size {size} bounds ({lower}, {upper}): default {elapsed[False] * 1000:.2f} ms fast {elapsed[True] * 1000:.2f} ms per rebalance'
+";
+
+    [TestCase("MinimumVariance", -1, 1, 5)]
+    [TestCase("MinimumVariance", 0, 1, 5)]
+    [TestCase("MinimumVariance", -1, 1, 50)]
+    [TestCase("MinimumVariance", 0, 1, 50)]
+    [TestCase("MaximumSharpeRatio", -1, 1, 5)]
+    [TestCase("MaximumSharpeRatio", 0, 1, 5)]
+    [TestCase("MaximumSharpeRatio", -1, 1, 50)]
+    [TestCase("MaximumSharpeRatio", 0, 1, 50)]
+    public void FastSolverIsNotWorseThanDefault(string name, int lower, int upper, int size)
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(), Code);
+            var result = module.GetAttr("fast_solver_is_not_worse").Invoke(name.ToPython(), lower.ToPython(), upper.ToPython(), size.ToPython());
+            Assert.IsTrue(result.As<bool>());
+        }
+    }
+
+    [Test]
+    public void WarmStartUsesPreviousWeights()
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(), Code);
+            Assert.IsTrue(module.GetAttr("warm_start_uses_previous_weights").Invoke().As<bool>());
+        }
+    }
+
+    [Explicit("Performance benchmark of the default and fast solver paths")]
+    [TestCase("MinimumVariance", -1, 1, 100)]
+    [TestCase("MinimumVariance", 0, 1, 100)]
+    [TestCase("MinimumVariance", -1, 1, 500)]
+    [TestCase("MaximumSharpeRatio", -1, 1, 100)]
+    [TestCase("MaximumSharpeRatio", 0, 1, 100)]
+    [TestCase("MaximumSharpeRatio", -1, 1, 500)]
+    public void Benchmark(string name, int lower, int upper, int size)
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(), Code);
+            var result = module.GetAttr("benchmark").Invoke(name.ToPython(), lower.ToPython(), upper.ToPython(), size.ToPython(), 10.ToPython());
+            Log.Trace(result.As<string>());
+        }
+    }
+}
@@ -0,0 +1,90 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Portfolio;
+
+[TestFixture]
+public class PortfolioOptimizerMomentsTests
+{
+    [Test]
+    public void UserDefinedOptimizersOnlyGetTheReturns()
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                @"
+from AlgorithmImports import *
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.PortfolioOptimizerMoments import optimize_with_moments
+
+class ReturnsOnlyOptimizer:
+    def optimize(self, historical_returns):
+        return ('returns', historical_returns)
+
+class MomentsOptimizer(MinimumVariancePortfolioOptimizer):
+    def optimize(self, historical_returns):
+        return ('subclass', historical_returns)
+
+def test():
+    if optimize_with_moments(ReturnsOnlyOptimizer(), 1, 2, 3) != ('returns', 1):
+        return False
+    return optimize_with_moments(MomentsOptimizer(), 1, 2, 3) == ('subclass', 1)");
+
+            Assert.IsTrue(module.GetAttr("test").Invoke().As<bool>());
+        }
+    }
+
+    [TestCase("MinimumVariancePortfolioOptimizer", 1.0)]
+    [TestCase("MinimumVariancePortfolioOptimizer", 0.8)]
+    [TestCase("MaximumSharpeRatioPortfolioOptimizer", 1.0)]
+    [TestCase("MaximumSharpeRatioPortfolioOptimizer", 0.8)]
+    [TestCase("UnconstrainedMeanVariancePortfolioOptimizer", 1.0)]
+    [TestCase("UnconstrainedMeanVariancePortfolioOptimizer", 0.8)]
+    [TestCase("RiskParityPortfolioOptimizer", 1.0)]
+    [TestCase("RiskParityPortfolioOptimizer", 0.8)]
+    public void PrecomputedMomentsMatchTheOptimizerDefaults(string name, double density)
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                @$"
+from AlgorithmImports import *
+from Portfolio.{name} import {name}
+from Portfolio.PortfolioOptimizerMoments import optimize_with_moments
+from Portfolio.RollingReturnsMatrix import RollingReturnsMatrix
+
+def test():
+    random = np.random.default_rng(3)
+    keys = [f'S{{i}}' for i in range(5)]
+    matrix = RollingReturnsMatrix(63)
+    for time in range(63):
+        for i, key in enumerate(keys):
+            if random.random() < {density.ToStringInvariant()}:
+                matrix.add(key, time, random.normal(0.01 * i - 0.01, 0.02))
+
+    # RiskParityPortfolioOptimizer uses np.cov, missing returns give it the same weights with or without the moments
+    returns = matrix.returns(keys)
+    expected = {name}().optimize(returns)
+    actual = optimize_with_moments({name}(), returns, matrix.mean(keys), matrix.covariance(keys))
+    return np.allclose(actual, expected, equal_nan=True, atol=1e-6)");
+
+            Assert.IsTrue(module.GetAttr("test").Invoke().As<bool>());
+        }
+    }
+}
@@ -0,0 +1,106 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Portfolio;
+
+[TestFixture]
+public class ReturnsWindowTests
+{
+    [TestCase(1)]
+    [TestCase(3)]
+    [TestCase(10)]
+    public void ViewsAreOrderedAndMatchRollingWindow(int size)
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                @"
+from AlgorithmImports import *
+from Portfolio.ReturnsWindow import ReturnsWindow
+
+def test(size):
+    window = ReturnsWindow(size)
+    rolling_window = RollingWindow(size)
+    start = datetime(2024, 1, 1)
+
+    for i in range(3 * size + 1):
+        time = start + timedelta(days=i)
+        window.add(time, i / 100)
+        rolling_window.add(IndicatorDataPoint(time, i / 100))
+
+        expected = [x.value for x in rolling_window][::-1]
+        if not np.allclose(window.values, expected) or window[0] != rolling_window[0].value:
+            return False
+        if window.is_ready != rolling_window.is_ready or window.samples != rolling_window.samples:
+            return False
+        series = window.to_series()
+        if series.index[-1] != pd.Timestamp(time) or not np.allclose(series.values, expected):
+            return False
+    return not window.values.flags.writeable");
+
+            Assert.IsTrue(module.GetAttr("test").Invoke(size.ToPython()).As<bool>());
+        }
+    }
+
+    [Test]
+    public void ResetClearsTheWindow()
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                @"
+from AlgorithmImports import *
+from Portfolio.ReturnsWindow import ReturnsWindow
+
+def test():
+    window = ReturnsWindow(2)
+    window.add(datetime(2024, 1, 1), 0.01)
+    window.add(datetime(2024, 1, 2), 0.02)
+    window.reset()
+    window.add(datetime(2024, 1, 3), 0.03)
+    return len(window) == 1 and not window.is_ready and window.values.tolist() == [0.03] and window.last_time == ReturnsWindow.to_nanoseconds(datetime(2024, 1, 3))");
+
+            Assert.IsTrue(module.GetAttr("test").Invoke().As<bool>());
+        }
+    }
+
+    [Test]
+    public void SeriesDoesNotChangeWhenReturnsAreAdded()
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                @"
+from AlgorithmImports import *
+from Portfolio.ReturnsWindow import ReturnsWindow
+
+def test():
+    window = ReturnsWindow(2)
+    window.add(datetime(2024, 1, 1), 0.01)
+    window.add(datetime(2024, 1, 2), 0.02)
+    series = window.to_series()
+
+    # the add overwrites the cells of the ring buffer the series was built from
+    window.add(datetime(2024, 1, 3), 0.03)
+    return series.tolist() == [0.01, 0.02] and series.index[-1] == pd.Timestamp(2024, 1, 2) and window.to_series().tolist() == [0.02, 0.03]");
+
+            Assert.IsTrue(module.GetAttr("test").Invoke().As<bool>());
+        }
+    }
+}
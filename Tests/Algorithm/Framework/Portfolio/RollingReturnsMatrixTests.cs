@@ -0,0 +1,95 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Portfolio;
+
+[TestFixture]
+public class RollingReturnsMatrixTests
+{
+    [TestCase(1.0)]
+    [TestCase(0.7)]
+    public void MeanAndCovarianceMatchPandas(double density)
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                @$"
+from AlgorithmImports import *
+from collections import deque
+from Portfolio.RollingReturnsMatrix import RollingReturnsMatrix
+
+def test():
+    random = np.random.default_rng(1)
+    period = 20
+    matrix = RollingReturnsMatrix(period)
+    windows = {{}}
+    keys = [f'S{{i}}' for i in range(10)]
+
+    for time in range(300):
+        for key in keys:
+            if random.random() < {density.ToStringInvariant()}:
+                value = random.normal(0, 0.01)
+                matrix.add(key, time, value)
+                windows.setdefault(key, deque(maxlen=period)).append((time, value))
+
+        if time % 50 == 0:
+            key = keys[random.integers(len(keys))]
+            matrix.remove(key)
+            windows.pop(key, None)
+
+        selected = keys[::2] + ['missing']
+        returns = pd.DataFrame({{ key: pd.Series([x[1] for x in windows.get(key, [])], index=[x[0] for x in windows.get(key, [])], dtype=float) for key in selected }})
+
+        if not np.allclose(matrix.mean(selected), returns.mean().values, equal_nan=True):
+            return False
+        if not np.allclose(matrix.covariance(selected), returns.cov().values, equal_nan=True):
+            return False
+        if not np.allclose(matrix.returns(selected).cov().values, returns.cov().values, equal_nan=True):
+            return False
+    return True");
+
+            Assert.IsTrue(module.GetAttr("test").Invoke().As<bool>());
+        }
+    }
+
+    [Test]
+    public void RemovedColumnsAreEmpty()
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                @"
+from AlgorithmImports import *
+from Portfolio.RollingReturnsMatrix import RollingReturnsMatrix
+
+def test():
+    matrix = RollingReturnsMatrix(2)
+    for time, value in enumerate([0.01, 0.02, -0.01]):
+        matrix.add('SPY', time, value)
+        matrix.add('AAPL', time, -value)
+    if matrix.count('SPY') != 2:
+        return False
+
+    matrix.remove('SPY')
+    return matrix.count('SPY') == 0 and np.isnan(matrix.mean(['SPY'])[0]) and len(matrix.returns(['AAPL'])) == 2");
+
+            Assert.IsTrue(module.GetAttr("test").Invoke().As<bool>());
+        }
+    }
+}
@@ -271,6 +271,122 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             AssertTargets(expectedTargets, actualTargets);
         }
 
+        [TestCase(1)]
+        [TestCase(2)]
+        [TestCase(3)]
+        public void PythonSectorBucketsMatchTheRebuildOnEveryRebalance(int seed)
+        {
+            Algorithm.SetDateTime(new DateTime(2018, 7, 31, 14, 0, 0));
+
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+from SectorWeightingPortfolioConstructionModel import SectorWeightingPortfolioConstructionModel
+
+class TestSectorWeightingPortfolioConstructionModel(SectorWeightingPortfolioConstructionModel):
+    def __init__(self, sector_code_by_symbol):
+        super().__init__(None)
+        self.test_sector_code_by_symbol = sector_code_by_symbol
+        self.percent_by_symbol = None
+
+    def get_sector_code(self, security):
+        return self.test_sector_code_by_symbol.get(security.symbol)
+
+    def determine_target_percent(self, active_insights):
+        result = super().determine_target_percent(active_insights)
+        self.percent_by_symbol = {insight.symbol: (str(insight.id), percent) for insight, percent in result.items()}
+        return result
+
+def rebuild_target_percent(algorithm, sector_code_by_symbol):
+    '''The rebuild of the sectors from the active insights on every rebalance that the sector buckets replaced'''
+    insights = sorted([x for x in algorithm.insights.get_active_insights(algorithm.utc_time) if x.symbol in sector_code_by_symbol],
+        key = lambda insight: insight.generated_time_utc)
+    last_insight_by_symbol = {insight.symbol: insight for insight in insights}
+
+    result = dict()
+    insights_by_sector_code = dict()
+    for symbol, insight in last_insight_by_symbol.items():
+        if insight.direction == InsightDirection.FLAT:
+            result[symbol] = (str(insight.id), 0)
+            continue
+        insights_by_sector_code.setdefault(sector_code_by_symbol[symbol], []).append(insight)
+
+    sector_percent = 0 if len(insights_by_sector_code) == 0 else 1.0 / len(insights_by_sector_code)
+    for insights in insights_by_sector_code.values():
+        for insight in insights:
+            result[insight.symbol] = (str(insight.id), insight.direction * sector_percent / len(insights))
+    return result
+
+def create_insight(symbol, direction, generated_time_utc, period):
+    insight = Insight.price(symbol, period, direction)
+    insight.generated_time_utc = generated_time_utc
+    insight.close_time_utc = generated_time_utc + period
+    return insight
+
+def test(algorithm, seed):
+    random = np.random.default_rng(seed)
+    # the sector code of a security can be missing and become known when it is added again
+    sector_code_by_symbol = {}
+    model = TestSectorWeightingPortfolioConstructionModel(sector_code_by_symbol)
+    wrapper = PortfolioConstructionModelPythonWrapper(model)
+    securities = list(algorithm.securities.values)
+    directions = [InsightDirection.DOWN, InsightDirection.FLAT, InsightDirection.UP]
+    # the sector codes of the securities in the universe, the code of a security is read again only when it was missing
+    expected_sector_code_by_symbol = {}
+    active = set()
+    insights = []
+    compared = 0
+
+    for step in range(300):
+        algorithm.set_date_time(algorithm.utc_time + timedelta(minutes = 1))
+
+        added = [x for x in securities if x.symbol not in active and random.random() < 0.1]
+        removed = [x for x in securities if x.symbol in active and random.random() < 0.03]
+        for security in added:
+            if sector_code_by_symbol.get(security.symbol) is None:
+                sector_code_by_symbol[security.symbol] = str(random.choice(['', 'B', 'T', 'X'])) if random.random() < 0.8 else None
+            if sector_code_by_symbol[security.symbol]:
+                expected_sector_code_by_symbol[security.symbol] = sector_code_by_symbol[security.symbol]
+        for security in removed:
+            expected_sector_code_by_symbol.pop(security.symbol, None)
+        active.difference_update(x.symbol for x in removed)
+        active.update(x.symbol for x in added)
+        if len(added) > 0 or len(removed) > 0:
+            wrapper.on_securities_changed(algorithm, SecurityChanges.create(added, removed, [], []))
+
+        # insights of the active securities and of some securities out of the universe, some generated before the current time
+        new_insights = [create_insight(x.symbol, directions[int(random.integers(3))],
+            algorithm.utc_time - timedelta(minutes = int(random.choice([0, 0, 0, 5]))), timedelta(minutes = int(random.integers(1, 30))))
+            for x in securities if random.random() < (0.3 if x.symbol in active else 0.05)]
+        # insights cancelled, cleared or added without going through create_targets, also in the same step as new insights
+        if len(insights) > 0 and random.random() < 0.05:
+            algorithm.insights.cancel(Array[Insight]([insights[int(random.integers(len(insights)))]]))
+        if random.random() < 0.02:
+            algorithm.insights.clear(Array[Symbol]([securities[int(random.integers(len(securities)))].symbol]))
+        if random.random() < 0.03:
+            algorithm.insights.add(create_insight(securities[0].symbol, InsightDirection.UP, algorithm.utc_time, timedelta(minutes = 10)))
+        algorithm.insights.add_range(new_insights)
+        insights.extend(new_insights)
+
+        expected = rebuild_target_percent(algorithm, expected_sector_code_by_symbol)
+        model.percent_by_symbol = None
+        list(wrapper.create_targets(algorithm, Array[Insight](new_insights)))
+        if model.percent_by_symbol is None:
+            continue
+
+        actual = model.percent_by_symbol
+        if actual.keys() != expected.keys() or any(actual[x][0] != expected[x][0] or not np.isclose(actual[x][1], expected[x][1]) for x in expected):
+            return False
+        compared += len(actual)
+
+    return compared > 0");
+
+                Assert.IsTrue(module.GetAttr("test").Invoke(Algorithm.ToPython(), seed.ToPython()).As<bool>());
+            }
+        }
+
         public override Insight GetInsight(Symbol symbol, InsightDirection direction, DateTime generatedTimeUtc, TimeSpan? period = null, double? weight = _weight)
         {
             period ??= TimeSpan.FromDays(1);
@@ -0,0 +1,133 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Python;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Risk
+{
+    [TestFixture]
+    public class MaximumSectorExposureRiskManagementModelTests
+    {
+        [OneTimeSetUp]
+        public void Initialize()
+        {
+            PythonInitializer.Initialize();
+        }
+
+        [TestCase(1)]
+        [TestCase(2)]
+        [TestCase(3)]
+        public void PythonSectorIndexMatchesActiveSecuritiesScan(int seed)
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+from itertools import groupby
+from types import SimpleNamespace
+from Risk.MaximumSectorExposureRiskManagementModel import MaximumSectorExposureRiskManagementModel
+
+def baseline_manage_risk(algorithm, targets_collection, maximum_sector_exposure, targets):
+    '''The scan of the active securities grouped by sector that the sector index replaced'''
+    maximum_sector_exposure_value = float(algorithm.portfolio.total_portfolio_value) * maximum_sector_exposure
+    targets_collection.add_range(targets)
+    risk_targets = list()
+
+    filtered = list(filter(lambda x: x.value.fundamentals is not None and x.value.fundamentals.has_fundamental_data, algorithm.universe_manager.active_securities))
+    filtered.sort(key = lambda x: x.value.fundamentals.company_reference.industry_template_code)
+    for code, securities in groupby(filtered, lambda x: x.value.fundamentals.company_reference.industry_template_code):
+        quantities = {}
+        sector_absolute_holdings_value = 0
+        for security in securities:
+            symbol = security.value.symbol
+            quantities[symbol] = security.value.holdings.quantity
+            absolute_holdings_value = security.value.holdings.absolute_holdings_value
+            if targets_collection.contains_key(symbol):
+                quantities[symbol] = targets_collection[symbol].quantity
+                absolute_holdings_value = (security.value.price * abs(quantities[symbol]) *
+                    security.value.symbol_properties.contract_multiplier *
+                    security.value.quote_currency.conversion_rate)
+            sector_absolute_holdings_value += absolute_holdings_value
+
+        ratio = float(sector_absolute_holdings_value) / maximum_sector_exposure_value
+        if ratio > 1:
+            for symbol, quantity in quantities.items():
+                if quantity != 0:
+                    risk_targets.append(PortfolioTarget(symbol, float(quantity) / ratio))
+    return risk_targets
+
+def create_fundamentals(code):
+    return SimpleNamespace(has_fundamental_data = True, company_reference = SimpleNamespace(industry_template_code = code))
+
+def create_security(i, random):
+    security = SimpleNamespace(symbol = Symbol.create(f'S{i:03d}', SecurityType.EQUITY, Market.USA),
+        code = str(random.choice(['N', 'M', 'U', 'T'])), price = 1.0, fundamentals = None,
+        holdings = SimpleNamespace(quantity = 0, absolute_holdings_value = 0),
+        symbol_properties = SimpleNamespace(contract_multiplier = 1), quote_currency = SimpleNamespace(conversion_rate = 1))
+    # the first securities always have fundamental data, the others load it later
+    if i < 5:
+        security.fundamentals = create_fundamentals(security.code)
+    return security
+
+def to_tuples(targets):
+    return sorted((str(x.symbol), float(x.quantity)) for x in targets)
+
+def test(seed):
+    random = np.random.default_rng(seed)
+    pool = [create_security(i, random) for i in range(40)]
+    model = MaximumSectorExposureRiskManagementModel(0.1)
+    baseline_targets = PortfolioTargetCollection()
+    algorithm = SimpleNamespace(portfolio = SimpleNamespace(total_portfolio_value = 1e6), universe_manager = SimpleNamespace(active_securities = []))
+    always_active = set(x.symbol for x in pool[:5])
+    active = {}
+    compared = 0
+
+    for step in range(100):
+        added = [x for x in pool if x.symbol not in active and (step == 0 and x.fundamentals is not None or random.random() < 0.1)]
+        # the first securities stay, the model requires securities with fundamental data
+        removed = [x for x in active.values() if x.symbol not in always_active and random.random() < 0.1]
+        for security in removed:
+            active.pop(security.symbol)
+        for security in added:
+            active[security.symbol] = security
+        model.on_securities_changed(algorithm, SimpleNamespace(added_securities = added, removed_securities = removed))
+
+        for security in active.values():
+            if security.fundamentals is None and random.random() < 0.2:
+                security.fundamentals = create_fundamentals(security.code)
+            security.price = float(random.uniform(10, 100))
+            security.holdings.quantity = int(random.integers(-2000, 2000))
+            security.holdings.absolute_holdings_value = security.price * abs(security.holdings.quantity)
+
+        targets = [PortfolioTarget(x.symbol, float(random.integers(-2000, 2000))) for x in active.values() if random.random() < 0.3]
+        algorithm.universe_manager.active_securities = [SimpleNamespace(key = x.symbol, value = x) for x in active.values()]
+
+        actual = to_tuples(model.manage_risk(algorithm, targets))
+        expected = to_tuples(baseline_manage_risk(algorithm, baseline_targets, 0.1, targets))
+        if [x[0] for x in actual] != [x[0] for x in expected] or not np.allclose([x[1] for x in actual], [x[1] for x in expected]):
+            return False
+        compared += len(expected)
+
+    return compared > 0");
+
+                Assert.IsTrue(module.GetAttr("test").Invoke(seed.ToPython()).As<bool>());
+            }
+        }
+    }
+}
@@ -0,0 +1,79 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Selection;
+
+[TestFixture]
+public class EmaCrossUniverseSelectionModelTests
+{
+    private const string Code = @"
+from AlgorithmImports import *
+from Selection.EmaCrossUniverseSelectionModel import EmaCrossUniverseSelectionModel
+
+class FundamentalStub:
+    def __init__(self, symbol, end_time, adjusted_price):
+        self.symbol = symbol
+        self.end_time = end_time
+        self.adjusted_price = adjusted_price
+
+def get_fundamental(day, prices, missing = lambda i: False):
+    time = datetime(2020, 1, 1) + timedelta(days = day)
+    return [FundamentalStub(f'S{i}', time, prices[day, i]) for i in range(prices.shape[1]) if not missing(i)]
+
+def vectorized_selection_matches_indicators():
+    default = EmaCrossUniverseSelectionModel(5, 15, 20)
+    vectorized = EmaCrossUniverseSelectionModel(5, 15, 20, vectorized = True)
+    prices = 100 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 0.02, (60, 200)), axis = 0))
+
+    for day in range(60):
+        fundamental = get_fundamental(day, prices, lambda i: i % 5 == 0 and 20 < day < 25)
+        if default.select_coarse(None, fundamental) != vectorized.select_coarse(None, fundamental):
+            return False
+    return True
+
+def delisted_symbols_are_evicted():
+    model = EmaCrossUniverseSelectionModel(5, 15, 20, vectorized = True)
+    prices = np.full((60, 10), 100.0)
+    for day in range(60):
+        model.select_coarse(None, get_fundamental(day, prices, lambda i: i == 0 and day > 10))
+
+    state = model._averages_state
+    return 'S0' not in state.slot_by_symbol and len(state.slot_by_symbol) == 9
+";
+
+    [Test]
+    public void VectorizedSelectionMatchesIndicators()
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(), Code);
+            Assert.IsTrue(module.GetAttr("vectorized_selection_matches_indicators").Invoke().As<bool>());
+        }
+    }
+
+    [Test]
+    public void DelistedSymbolsAreEvicted()
+    {
+        using (Py.GIL())
+        {
+            var module = PyModule.FromString(Guid.NewGuid().ToString(), Code);
+            Assert.IsTrue(module.GetAttr("delisted_symbols_are_evicted").Invoke().As<bool>());
+        }
+    }
+}
@@ -136,6 +136,56 @@ namespace QuantConnect.Tests.Algorithm.Framework.Selection
             Assert.AreEqual(0, fineCountByDateTime.Count);
         }
 
+        [TestCase(1)]
+        [TestCase(2)]
+        [TestCase(3)]
+        public void PythonSelectColumnsMatchesSelectFine(int seed)
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+from types import SimpleNamespace
+from Selection.QC500UniverseSelectionModel import QC500UniverseSelectionModel
+
+def test(seed):
+    random = np.random.default_rng(seed)
+    size = 1500
+    time = datetime(2024, 1, 2)
+    symbols = [Symbol.create(f'S{i:04d}', SecurityType.EQUITY, Market.USA) for i in range(size)]
+    has_fundamental_data = random.random(size) < 0.9
+    volumes = random.choice([0, 1e6], size, p = [0.05, 0.95])
+    dollar_volumes = random.permutation(size) * 1e4 + 1e4
+    market_caps = random.lognormal(21, 2, size)
+    countries = random.choice(['USA', 'USA', 'USA', 'CAN'], size)
+    exchanges = random.choice(['NYS', 'NAS', 'ASE'], size)
+    codes = random.choice(['N', 'M', 'U', 'T', 'B', 'I'], size)
+    # a missing IPO date is the minimum date, older than half a year, some of the IPOs are too recent
+    ipo_dates = [datetime.min if random.random() < 0.1 else time - timedelta(days = int(x)) for x in random.integers(0, 9000, size)]
+
+    fundamental = [SimpleNamespace(Symbol = symbols[i], has_fundamental_data = bool(has_fundamental_data[i]), volume = volumes[i],
+        price = dollar_volumes[i] / 1e6, dollar_volume = dollar_volumes[i], market_cap = market_caps[i],
+        company_reference = SimpleNamespace(country_id = countries[i], primary_exchange_id = exchanges[i], industry_template_code = codes[i]),
+        security_reference = SimpleNamespace(ipo_date = ipo_dates[i])) for i in range(size)]
+    data = pd.DataFrame({
+        'has_fundamental_data': has_fundamental_data, 'volume': volumes, 'price': dollar_volumes / 1e6, 'dollar_volume': dollar_volumes,
+        'market_cap': market_caps, 'company_reference.country_id': countries, 'company_reference.primary_exchange_id': exchanges,
+        'company_reference.industry_template_code': codes, 'security_reference.ipo_date': np.array(ipo_dates, dtype = object)
+    }, index = pd.Index(symbols, name = 'symbol'))
+
+    algorithm = SimpleNamespace(time = time)
+    model = QC500UniverseSelectionModel()
+    coarse = set(model.select_coarse(algorithm, fundamental))
+    expected = model.select_fine(algorithm, [x for x in fundamental if x.Symbol in coarse])
+    actual = QC500UniverseSelectionModel(vectorized = True).select_columns(algorithm, data)
+    missing_ipo_date = set(x.Symbol for x in fundamental if x.Symbol in coarse and x.security_reference.ipo_date == datetime.min)
+    return len(expected) > 0 and actual == expected and any(x in missing_ipo_date for x in actual)");
+
+                Assert.IsTrue(module.GetAttr("test").Invoke(seed.ToPython()).As<bool>());
+            }
+        }
+
         private void RunSimulation(Language language,
             Func<Symbol, DateTime, CoarseFundamental> getCoarseFundamental,
             Func<Symbol, DateTime, FineFundamental> getFineFundamental,
@@ -77,6 +77,7 @@ namespace QuantConnect.Tests
                 "./RegressionAlgorithms",
                 "./Research/RegressionScripts",
                 "./Python/PandasTests",
+                "./Python/Benchmarks",
                 "../../../Algorithm",
                 "../../../Algorithm/Selection",
                 "../../../Algorithm.Framework",
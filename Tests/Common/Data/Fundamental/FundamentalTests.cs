@@ -14,8 +14,11 @@
 */
 
 using System;
+using System.Linq;
 using NUnit.Framework;
+using Python.Runtime;
 using QuantConnect.Data;
+using QuantConnect.Python;
 using QuantConnect.Data.Fundamental;
 using QuantConnect.Data.UniverseSelection;
 
@@ -39,6 +42,40 @@ namespace QuantConnect.Tests.Common.Data.Fundamental
             Assert.AreEqual(469400291359, fine.MarketCap);
         }
 
+        [Test]
+        public void FundamentalDataFrameHasAColumnPerField()
+        {
+            var fundamental = new[] { Symbols.AAPL, Symbols.IBM, Symbols.AIG }
+                .Select(symbol => new QuantConnect.Data.Fundamental.Fundamental(new DateTime(2014, 04, 01), symbol))
+                .ToList();
+
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(), @"
+def test(data, symbols):
+    return (list(data.index) == symbols
+        and list(data.columns) == ['market_cap', 'company_reference.industry_template_code', 'valuation_ratios.pe_ratio']
+        and data['market_cap'].dtype == 'float64'
+        and data['market_cap'].tolist() == [469400291359, 192825068158, 72866646492]
+        and data['company_reference.industry_template_code'].tolist() == ['N', 'N', 'I']
+        and abs(data['valuation_ratios.pe_ratio'].iloc[2] - 8.185855) < 1e-9)");
+
+                var data = new PandasConverter().GetFundamentalDataFrame(fundamental,
+                    new[] { "market_cap", "company_reference.industry_template_code", "valuation_ratios.pe_ratio" });
+                var symbols = fundamental.Select(x => x.Symbol).ToList();
+
+                Assert.IsTrue(module.GetAttr("test").Invoke(data, symbols.ToPyListUnSafe()).As<bool>());
+            }
+        }
+
+        [Test]
+        public void FundamentalDataFrameThrowsForUnknownFields()
+        {
+            var fundamental = new[] { new QuantConnect.Data.Fundamental.Fundamental(new DateTime(2014, 04, 01), Symbols.AAPL) };
+
+            Assert.Throws<ArgumentException>(() => new PandasConverter().GetFundamentalDataFrame(fundamental, new[] { "company_reference.not_a_field" }));
+        }
+
         [Test]
         public void ZeroMarketCapForDefaultObject()
         {
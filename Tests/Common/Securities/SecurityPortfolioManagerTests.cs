@@ -303,6 +303,82 @@ namespace QuantConnect.Tests.Common.Securities
             }
         }
 
+        [Test]
+        public void InvestedSecuritiesTracksHoldingsChanges()
+        {
+            var securities = new SecurityManager(TimeKeeper);
+            var transactions = new SecurityTransactionManager(null, securities);
+            var portfolio = new SecurityPortfolioManager(securities, transactions, new AlgorithmSettings());
+
+            foreach (var symbol in new[] { Symbols.AAPL, Symbols.SPY, Symbols.IBM })
+            {
+                securities.Add(
+                    new Security(
+                        SecurityExchangeHours,
+                        CreateTradeBarDataConfig(SecurityType.Equity, symbol),
+                        new Cash(Currencies.USD, 0, 1m),
+                        SymbolProperties.GetDefault(Currencies.USD),
+                        ErrorCurrencyConverter.Instance,
+                        RegisteredSecurityDataTypesProvider.Null,
+                        new SecurityCache()
+                    )
+                );
+            }
+            CollectionAssert.IsEmpty(portfolio.InvestedSecurities);
+
+            securities[Symbols.AAPL].Holdings.SetHoldings(100m, 10);
+            securities[Symbols.SPY].Holdings.SetHoldings(200m, -5);
+            CollectionAssert.AreEquivalent(new[] { Symbols.AAPL, Symbols.SPY }, portfolio.InvestedSecurities.Select(x => x.Symbol));
+
+            securities[Symbols.AAPL].Holdings.SetHoldings(100m, 0);
+            CollectionAssert.AreEquivalent(new[] { Symbols.SPY }, portfolio.InvestedSecurities.Select(x => x.Symbol));
+
+            securities.Remove(Symbols.SPY);
+            CollectionAssert.IsEmpty(portfolio.InvestedSecurities);
+        }
+
+        [Test]
+        public void InvestedSecuritiesTracksReplacedHoldings()
+        {
+            var securities = new SecurityManager(TimeKeeper);
+            var transactions = new SecurityTransactionManager(null, securities);
+            var portfolio = new SecurityPortfolioManager(securities, transactions, new AlgorithmSettings());
+
+            var security = new Security(
+                SecurityExchangeHours,
+                CreateTradeBarDataConfig(SecurityType.Equity, Symbols.AAPL),
+                new Cash(Currencies.USD, 0, 1m),
+                SymbolProperties.GetDefault(Currencies.USD),
+                ErrorCurrencyConverter.Instance,
+                RegisteredSecurityDataTypesProvider.Null,
+                new SecurityCache()
+            );
+            securities.Add(security);
+            var previousHoldings = security.Holdings;
+            previousHoldings.SetHoldings(100m, 10);
+            CollectionAssert.AreEquivalent(new[] { Symbols.AAPL }, portfolio.InvestedSecurities.Select(x => x.Symbol));
+
+            // the new holdings are flat, the security is no longer invested
+            portfolio[Symbols.AAPL] = new SecurityHolding(security, ErrorCurrencyConverter.Instance);
+            CollectionAssert.IsEmpty(portfolio.InvestedSecurities);
+
+            // the previous holdings are no longer tracked
+            previousHoldings.SetHoldings(100m, 5);
+            CollectionAssert.IsEmpty(portfolio.InvestedSecurities);
+
+            security.Holdings.SetHoldings(100m, 20);
+            CollectionAssert.AreEquivalent(new[] { Symbols.AAPL }, portfolio.InvestedSecurities.Select(x => x.Symbol));
+
+            var investedHoldings = new SecurityHolding(security, ErrorCurrencyConverter.Instance);
+            investedHoldings.SetHoldings(100m, -3);
+            security.Holdings = new SecurityHolding(security, ErrorCurrencyConverter.Instance);
+            security.Holdings = investedHoldings;
+            CollectionAssert.AreEquivalent(new[] { Symbols.AAPL }, portfolio.InvestedSecurities.Select(x => x.Symbol));
+
+            investedHoldings.SetHoldings(100m, 0);
+            CollectionAssert.IsEmpty(portfolio.InvestedSecurities);
+        }
+
         [Test]
         public void ComputeMarginProperlyAsSecurityPriceFluctuates()
         {
@@ -103,6 +103,55 @@ namespace QuantConnect.Tests.Common.Securities
             manager.Remove(universe.Configuration.Symbol);
         }
 
+        [Test]
+        public void TracksMembershipAcrossUniverses()
+        {
+            var manager = new UniverseManager();
+            var settings = new UniverseSettings(Resolution.Minute, 2, true, false, TimeSpan.Zero);
+            var first = new FuncUniverse(CreateTradeBarConfig(), settings, data => data.Select(x => x.Symbol));
+            var second = new FuncUniverse(CreateTradeBarConfig(Symbols.AAPL), settings, data => data.Select(x => x.Symbol));
+            var security = CreateSecurity(Symbols.IBM);
+
+            // members added before the universe is added to the manager are taken into account
+            first.AddMember(DateTime.UtcNow, security, false);
+            manager.Add(first.Configuration.Symbol, first);
+            manager.Add(second.Configuration.Symbol, second);
+            Assert.IsTrue(manager.ContainsMember(Symbols.IBM));
+
+            second.AddMember(DateTime.UtcNow, security, false);
+            first.RemoveMember(DateTime.UtcNow, security);
+            Assert.IsTrue(manager.ContainsMember(Symbols.IBM));
+
+            second.RemoveMember(DateTime.UtcNow, security);
+            Assert.IsFalse(manager.ContainsMember(Symbols.IBM));
+
+            second.AddMember(DateTime.UtcNow, security, false);
+            manager.Remove(second.Configuration.Symbol);
+            Assert.IsFalse(manager.ContainsMember(Symbols.IBM));
+
+            // the removed universe is no longer tracked
+            second.RemoveMember(DateTime.UtcNow, security);
+            first.AddMember(DateTime.UtcNow, security, false);
+            Assert.IsTrue(manager.ContainsMember(Symbols.IBM));
+        }
+
+        private static Security CreateSecurity(Symbol symbol)
+        {
+            return new Security(
+                SecurityExchangeHours.AlwaysOpen(TimeZones.NewYork),
+                CreateTradeBarConfig(symbol),
+                new Cash(Currencies.USD, 0, 1m),
+                SymbolProperties.GetDefault(Currencies.USD),
+                ErrorCurrencyConverter.Instance,
+                RegisteredSecurityDataTypesProvider.Null,
+                new SecurityCache());
+        }
+
+        private static SubscriptionDataConfig CreateTradeBarConfig(Symbol symbol)
+        {
+            return new SubscriptionDataConfig(typeof(TradeBar), symbol, Resolution.Minute, TimeZones.NewYork, TimeZones.NewYork, false, false, true);
+        }
+
         private SubscriptionDataConfig CreateTradeBarConfig()
         {
             return new SubscriptionDataConfig(typeof(TradeBar), Symbols.SPY, Resolution.Minute, TimeZones.NewYork, TimeZones.NewYork, false, false, true);
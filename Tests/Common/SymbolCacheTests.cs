@@ -15,6 +15,7 @@
 */
 
 using System;
+using System.Runtime.InteropServices;
 using NUnit.Framework;
 using QuantConnect.Data.Custom.IconicTypes;
 using Bitcoin = QuantConnect.Algorithm.CSharp.LiveTradingFeaturesAlgorithm.Bitcoin;
@@ -225,5 +226,19 @@ namespace QuantConnect.Tests.Common
             Assert.IsFalse(SymbolCache.TryGetSymbol("SPY", out symbol));
             Assert.IsFalse(SymbolCache.TryGetTicker(Symbols.SPY, out ticker));
         }
+
+        [Test]
+        public void VersionAddressReflectsTheVersionChanges()
+        {
+            var address = new IntPtr(SymbolCache.VersionAddress);
+            var version = SymbolCache.Version;
+            Assert.AreEqual(version, Marshal.ReadInt32(address));
+
+            SymbolCache.Set("SPY", Symbols.SPY);
+            SymbolCache.TryRemove("SPY");
+            SymbolCache.Clear();
+            Assert.AreEqual(version + 3, SymbolCache.Version);
+            Assert.AreEqual(SymbolCache.Version, Marshal.ReadInt32(address));
+        }
     }
 }
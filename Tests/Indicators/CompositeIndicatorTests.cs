@@ -72,6 +72,26 @@ namespace QuantConnect.Tests.Indicators
             Assert.AreEqual(2m, composite.Current.Value);
         }
 
+        [Test]
+        public void DetachedCompositeIsNoLongerUpdated()
+        {
+            var left = new Identity("left");
+            var right = new Identity("right");
+            var composite = CreateCompositeIndicator(left, right, (l, r) => l.Current.Value + r.Current.Value);
+            var other = CreateCompositeIndicator(left, right, (l, r) => l.Current.Value * r.Current.Value);
+
+            left.Update(DateTime.Today, 2m);
+            right.Update(DateTime.Today, 3m);
+            Assert.AreEqual(5m, composite.Current.Value);
+
+            composite.Detach();
+            left.Update(DateTime.Today.AddSeconds(1), 4m);
+            right.Update(DateTime.Today.AddSeconds(1), 5m);
+            Assert.AreEqual(5m, composite.Current.Value);
+            Assert.AreEqual(1, composite.Samples);
+            Assert.AreEqual(20m, other.Current.Value);
+        }
+
         [Test]
         public virtual void ResetsProperly()
         {
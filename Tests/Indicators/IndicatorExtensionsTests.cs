@@ -716,6 +716,98 @@ namespace QuantConnect.Tests.Indicators
             }
         }
 
+        [TestCase("us")]
+        [TestCase("ns")]
+        [TestCase("s")]
+        public void WarmUpUpdatesIndicatorWithWholeHistoryColumn(string unit)
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(), @$"
+from AlgorithmImports import *
+
+def get_history():
+    index = pd.date_range('2024-01-02 16:00', periods=10, freq='D', name='time').as_unit('{unit}')
+    return pd.DataFrame({{ 'close': [100, 101, np.nan, 103, 102, 104, 105, 104, 106, 107] }}, index=index)
+
+def get_nanoseconds(index):
+    return index.values.astype('datetime64[ns]').view('int64')");
+                var history = module.GetAttr("get_history").Invoke();
+                var index = history.GetAttr("index");
+                var close = history.GetAttr("close").GetAttr("values");
+
+                var expected = new RateOfChange(3);
+                var rows = history.GetAttr("close").InvokeMethod("items");
+                foreach (PyObject row in rows)
+                {
+                    var value = row[1].As<double>();
+                    if (!double.IsNaN(value))
+                    {
+                        expected.Update(row[0].As<DateTime>(), (decimal)value);
+                    }
+                }
+
+                var actual = new RateOfChange(3);
+                var isReady = IndicatorExtensions.WarmUp(actual.ToPython(), index, close);
+
+                Assert.IsTrue(isReady);
+                Assert.AreEqual(new DateTime(2024, 1, 11, 16, 0, 0), actual.Current.EndTime);
+                Assert.AreEqual(expected.Samples, actual.Samples);
+                Assert.AreEqual(expected.Current.EndTime, actual.Current.EndTime);
+                Assert.AreEqual(expected.Current.Value, actual.Current.Value);
+
+                // the datetime64 values and the nanosecond timestamps give the same times
+                var nanoseconds = new RateOfChange(3);
+                IndicatorExtensions.WarmUp(nanoseconds.ToPython(), index.GetAttr("values"), close);
+                Assert.AreEqual(expected.Current.EndTime, nanoseconds.Current.EndTime);
+                nanoseconds.Reset();
+                IndicatorExtensions.WarmUp(nanoseconds.ToPython(), module.GetAttr("get_nanoseconds").Invoke(index), close);
+                Assert.AreEqual(expected.Current.EndTime, nanoseconds.Current.EndTime);
+
+                var utc = new RateOfChange(3);
+                IndicatorExtensions.WarmUp(utc.ToPython(), index, close, TimeZones.NewYork);
+                Assert.AreEqual(expected.Current.EndTime.ConvertToUtc(TimeZones.NewYork), utc.Current.EndTime);
+
+                // time zone aware times are already UTC
+                var aware = new RateOfChange(3);
+                IndicatorExtensions.WarmUp(aware.ToPython(), index.InvokeMethod("tz_localize", "America/New_York".ToPython()), close, TimeZones.NewYork);
+                Assert.AreEqual(utc.Current.EndTime, aware.Current.EndTime);
+            }
+        }
+
+        [Test]
+        public void WarmUpAddsWholeHistoryColumnToRollingWindow()
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(), @"
+from AlgorithmImports import *
+
+def get_history():
+    index = pd.date_range('2024-01-02 16:00', periods=5, freq='D', name='time')
+    return pd.Series([100, 101, np.nan, 103, 102], index=index)
+
+def get_window():
+    return RollingWindow(3)");
+                var history = module.GetAttr("get_history").Invoke();
+
+                var window = new RollingWindow<IndicatorDataPoint>(3);
+                Assert.IsTrue(IndicatorExtensions.WarmUp(window.ToPython(), history.GetAttr("index"), history));
+                Assert.AreEqual(4, window.Samples);
+                Assert.AreEqual(102m, window[0].Value);
+                Assert.AreEqual(new DateTime(2024, 1, 6, 16, 0, 0), window[0].EndTime);
+                Assert.AreEqual(101m, window[2].Value);
+
+                // the Python RollingWindow holds objects
+                var pythonWindow = module.GetAttr("get_window").Invoke();
+                Assert.IsTrue(IndicatorExtensions.WarmUp(pythonWindow, history.GetAttr("index"), history));
+                var managedWindow = (RollingWindow<object>)pythonWindow.AsManagedObject(typeof(RollingWindow<object>));
+                Assert.AreEqual(102m, ((IndicatorDataPoint)managedWindow[0]).Value);
+
+                Assert.Throws<ArgumentException>(() => IndicatorExtensions.WarmUp(new RollingWindow<decimal>(3).ToPython(), history.GetAttr("index"), history));
+            }
+        }
+
         private class TestIndicator<T> : IndicatorBase<T>
             where T : IBaseData
         {
@@ -0,0 +1,249 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from QuantConnect.Tests.Engine.DataFeeds import *
+from time import perf_counter
+from types import SimpleNamespace
+import tracemalloc
+# patches the pandas indexers benchmarked below
+import PandasMapper
+
+from Alphas.PearsonCorrelationPairsTradingAlphaModel import PearsonCorrelationPairsTradingAlphaModel
+from Portfolio.BlackLittermanOptimizationPortfolioConstructionModel import BlackLittermanOptimizationPortfolioConstructionModel
+from Portfolio.MeanVarianceOptimizationPortfolioConstructionModel import MeanVarianceOptimizationPortfolioConstructionModel
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Selection.QC500UniverseSelectionModel import QC500UniverseSelectionModel
+
+DEFAULT_SIZES = [50, 100, 250, 500, 1000, 2000]
+
+### <summary>
+### Micro benchmarks of the Python framework models and the pandas indexers patched by PandasMapper.
+### Each benchmark calls a single entry point with synthetic inputs for a universe of N securities,
+### and reports the time and the memory allocated per call for every N, and how the time scales with N.
+### </summary>
+class MicroBenchmark:
+    '''A benchmarked entry point'''
+    def __init__(self, name, create, max_size = None):
+        '''Initialize the MicroBenchmark
+        Args:
+            name: The name of the benchmark
+            create: Function that, given the universe size, returns the (prepare, call) pair. prepare is called,
+                    untimed, before each call, to reset the state the call changes
+            max_size: The largest universe size the benchmark runs with, None for no limit'''
+        self.name = name
+        self.create = create
+        self.max_size = max_size
+
+    def measure(self, size, iterations):
+        '''Measures the calls for the given universe size
+        Args:
+            size: The number of securities of the synthetic inputs
+            iterations: The number of timed calls, after a warm up call
+        Returns:
+            The median and minimum time of a call in milliseconds, and the peak and retained memory allocated by a call in KiB'''
+        prepare, call = self.create(size)
+        prepare()
+        call()
+
+        times = []
+        for _ in range(iterations):
+            prepare()
+            start = perf_counter()
+            call()
+            times.append(perf_counter() - start)
+
+        # the allocations are traced in a separate call, tracing slows down the calls
+        prepare()
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            call()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            'size': size,
+            'median-ms': float(np.median(times)) * 1000,
+            'min-ms': min(times) * 1000,
+            'peak-kib': (peak - before) / 1024,
+            'retained-kib': (current - before) / 1024
+        }
+
+def create_symbols(size):
+    symbols = [Symbol.create(f'S{i:04d}', SecurityType.EQUITY, Market.USA) for i in range(size)]
+    for symbol in symbols:
+        SymbolCache.set(symbol.value, symbol)
+    return symbols
+
+def create_returns(size, rows, seed = 0):
+    random = np.random.default_rng(seed)
+    return random.normal(0.0005, 0.01, (rows, size))
+
+class BenchmarkAlgorithm(AlgorithmStub):
+    '''Algorithm stub serving the history requests from the synthetic price frame set in prices'''
+    def history(self, symbols, periods, resolution = None):
+        frame = self.prices.loc[pd.IndexSlice[list(symbols), :], :]
+        return frame.groupby(level = 0, group_keys = False).tail(periods)
+
+def mean_variance_determine_target_percent(fast_solver):
+    def create(size):
+        optimizer = MinimumVariancePortfolioOptimizer(-1, 1, 0.02, use_fast_solver = True) if fast_solver else None
+        model = MeanVarianceOptimizationPortfolioConstructionModel(optimizer = optimizer)
+        symbols = create_symbols(size)
+        returns = create_returns(size, model.period)
+        times = pd.date_range('2024-01-01', periods = model.period, freq = 'D')
+        for i, symbol in enumerate(symbols):
+            symbol_data = model.MeanVarianceSymbolData(symbol, model.lookback, model.period, model._returns)
+            model.symbol_data_by_symbol[symbol] = symbol_data
+            for time, value in zip(times, returns[:, i]):
+                symbol_data.add(time, value)
+
+        insights = [Insight.price(symbol, timedelta(days = 1), InsightDirection.UP, 0.01) for symbol in symbols]
+        return lambda: None, lambda: model.determine_target_percent(insights)
+    return create
+
+def black_litterman_get_views(size):
+    model = BlackLittermanOptimizationPortfolioConstructionModel()
+    random = np.random.default_rng(0)
+    insights = []
+    for source_model in ['AlphaA', 'AlphaB', 'AlphaC']:
+        for symbol in create_symbols(size):
+            direction = InsightDirection.UP if random.random() > 0.5 else InsightDirection.DOWN
+            insight = Insight.price(symbol, timedelta(days = 1), direction, float(random.uniform(0.001, 0.05)))
+            insight.source_model = source_model
+            insights.append(insight)
+    return lambda: None, lambda: model.get_views(insights)
+
+def pearson_correlation_on_securities_changed(size):
+    lookback = 15
+    symbols = create_symbols(size)
+    times = pd.date_range('2024-01-02 09:31', periods = lookback, freq = 'min')
+    closes = 100 * np.exp(np.cumsum(create_returns(size, lookback), axis = 0))
+    index = pd.MultiIndex.from_product([symbols, times], names = ['symbol', 'time'])
+    prices = pd.DataFrame({ 'close': closes.T.ravel() }, index = index)
+
+    algorithm = BenchmarkAlgorithm()
+    algorithm.prices = prices
+    securities = [algorithm.add_equity(symbol.value, Resolution.MINUTE) for symbol in symbols]
+    changes = SecurityChanges.create(securities, [], [], [])
+
+    state = SimpleNamespace(model = None)
+    def prepare():
+        state.model = PearsonCorrelationPairsTradingAlphaModel(lookback, Resolution.MINUTE)
+    return prepare, lambda: state.model.on_securities_changed(algorithm, changes)
+
+def create_fundamentals(size, seed = 0):
+    random = np.random.default_rng(seed)
+    symbols = create_symbols(size)
+    countries = random.choice(['USA', 'USA', 'USA', 'CAN'], size)
+    exchanges = random.choice(['NYS', 'NAS', 'ASE'], size)
+    codes = random.choice(['N', 'M', 'U', 'T', 'B', 'I'], size)
+    ipo_dates = [datetime(2000, 1, 1) + timedelta(days = int(x)) for x in random.integers(0, 9000, size)]
+    market_caps = random.lognormal(21, 2, size)
+    dollar_volumes = random.lognormal(16, 2, size)
+
+    fundamentals = [SimpleNamespace(Symbol = symbols[i], dollar_volume = dollar_volumes[i], market_cap = market_caps[i],
+        company_reference = SimpleNamespace(country_id = countries[i], primary_exchange_id = exchanges[i], industry_template_code = codes[i]),
+        security_reference = SimpleNamespace(ipo_date = ipo_dates[i])) for i in range(size)]
+
+    columns = pd.DataFrame({
+        'has_fundamental_data': True, 'volume': 1e6, 'price': dollar_volumes / 1e6, 'dollar_volume': dollar_volumes, 'market_cap': market_caps,
+        'company_reference.country_id': countries, 'company_reference.primary_exchange_id': exchanges,
+        'company_reference.industry_template_code': codes, 'security_reference.ipo_date': ipo_dates
+    }, index = pd.Index(symbols, name = 'symbol'))
+    return fundamentals, columns
+
+# the selection only reads the time of the algorithm
+selection_algorithm = SimpleNamespace(time = datetime(2024, 1, 2))
+
+def qc500_select_fine(size):
+    model = QC500UniverseSelectionModel()
+    fundamentals, _ = create_fundamentals(size)
+    dollar_volume_by_symbol = { x.Symbol: x.dollar_volume for x in fundamentals }
+    def prepare():
+        model.dollar_volume_by_symbol = dollar_volume_by_symbol
+    return prepare, lambda: model.select_fine(selection_algorithm, fundamentals)
+
+def qc500_select_columns(size):
+    model = QC500UniverseSelectionModel(vectorized = True)
+    _, columns = create_fundamentals(size)
+    def prepare():
+        model.last_month = -1
+    return prepare, lambda: model.select_columns(selection_algorithm, columns)
+
+def pandas_mapper_indexing(size):
+    symbols = create_symbols(size)
+    times = pd.date_range('2024-01-02', periods = 10, freq = 'D')
+    index = pd.MultiIndex.from_product([symbols, times], names = ['symbol', 'time'])
+    frame = pd.DataFrame({ 'close': np.arange(len(index), dtype = float) }, index = index)
+    closes = frame['close'].unstack(level = 0)
+    tickers = [symbol.value for symbol in symbols]
+
+    def call():
+        # the lookups done by algorithms on a history frame, by ticker and by Symbol
+        for ticker, symbol in zip(tickers, symbols):
+            frame.loc[ticker]
+            frame.loc[symbol]
+            closes[ticker]
+            ticker in closes
+    return lambda: None, call
+
+BENCHMARKS = [
+    MicroBenchmark('MeanVarianceOptimizationPortfolioConstructionModel.determine_target_percent',
+        mean_variance_determine_target_percent(False), max_size = 250),
+    MicroBenchmark('MeanVarianceOptimizationPortfolioConstructionModel.determine_target_percent (fast solver)',
+        mean_variance_determine_target_percent(True), max_size = 1000),
+    MicroBenchmark('BlackLittermanOptimizationPortfolioConstructionModel.get_views', black_litterman_get_views),
+    MicroBenchmark('PearsonCorrelationPairsTradingAlphaModel.on_securities_changed', pearson_correlation_on_securities_changed),
+    MicroBenchmark('QC500UniverseSelectionModel.select_fine', qc500_select_fine),
+    MicroBenchmark('QC500UniverseSelectionModel.select_columns', qc500_select_columns),
+    MicroBenchmark('PandasMapper indexing (loc, getitem and contains by ticker and Symbol)', pandas_mapper_indexing),
+]
+
+def run(sizes = None, iterations = 5, names = None):
+    '''Runs the benchmarks
+    Args:
+        sizes: The universe sizes, DEFAULT_SIZES if None. Sizes larger than the maximum size of a benchmark are skipped
+        iterations: The number of timed calls per size
+        names: The names, or part of the names, of the benchmarks to run. All of them if None
+    Returns:
+        Dictionary with the measurements of each size and the scaling exponent of the time, by benchmark name'''
+    sizes = DEFAULT_SIZES if sizes is None else list(sizes)
+    results = {}
+    for benchmark in BENCHMARKS:
+        if names is not None and not any(name in benchmark.name for name in names):
+            continue
+
+        points = [benchmark.measure(size, iterations) for size in sizes if benchmark.max_size is None or size <= benchmark.max_size]
+        results[benchmark.name] = { 'points': points, 'exponent': scaling_exponent(points) }
+    return results
+
+def scaling_exponent(points):
+    '''The exponent k of the time ~ N^k fit of the measurements, None if there are less than two sizes'''
+    points = [x for x in points if x['median-ms'] > 0]
+    if len(points) < 2:
+        return None
+    return float(np.polyfit(np.log([x['size'] for x in points]), np.log([x['median-ms'] for x in points]), 1)[0])
+
+def format_report(results):
+    '''Formats the results of run as a table per benchmark'''
+    lines = []
+    for name, result in results.items():
+        exponent = result['exponent']
+        lines.append(f'{name}: time ~ N^{exponent:.2f}' if exponent is not None else name)
+        lines.append(f'{"N":>8} {"median ms":>12} {"min ms":>12} {"peak KiB":>12} {"retained KiB":>14}')
+        for x in result['points']:
+            lines.append(f'{x["size"]:>8} {x["median-ms"]:>12.3f} {x["min-ms"]:>12.3f} {x["peak-kib"]:>12.1f} {x["retained-kib"]:>14.1f}')
+    return '\n'.join(lines)
@@ -0,0 +1,63 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Logging;
+
+namespace QuantConnect.Tests.Python;
+
+[TestFixture]
+public class FrameworkMicroBenchmarksTests
+{
+    [Test]
+    public void RunsEveryBenchmark()
+    {
+        using (Py.GIL())
+        {
+            var module = Py.Import("FrameworkMicroBenchmarks");
+            var benchmarks = (int)module.GetAttr("BENCHMARKS").Length();
+
+            using var sizes = new PyList(new PyObject[] { 10.ToPython(), 20.ToPython() });
+            var results = module.GetAttr("run").Invoke(new[] { sizes, 1.ToPython() });
+
+            Assert.AreEqual(benchmarks, (int)results.Length());
+            foreach (var name in results.GetIterator())
+            {
+                var result = results.GetItem(name);
+                Assert.AreEqual(2, (int)result.GetItem("points").Length(), name.ToString());
+                Assert.IsFalse(result.GetItem("exponent").IsNone(), name.ToString());
+            }
+            Assert.IsNotEmpty(module.GetAttr("format_report").Invoke(results).As<string>());
+        }
+    }
+
+    [Explicit("Performance benchmark of the Python framework models and the PandasMapper indexers")]
+    [TestCase("MeanVarianceOptimizationPortfolioConstructionModel")]
+    [TestCase("BlackLittermanOptimizationPortfolioConstructionModel")]
+    [TestCase("PearsonCorrelationPairsTradingAlphaModel")]
+    [TestCase("QC500UniverseSelectionModel")]
+    [TestCase("PandasMapper")]
+    public void Benchmark(string name)
+    {
+        using (Py.GIL())
+        {
+            var module = Py.Import("FrameworkMicroBenchmarks");
+            using var names = new PyList(new[] { name.ToPython() });
+            var results = module.GetAttr("run").Invoke(new[] { PyObject.None, 5.ToPython(), names });
+            Log.Trace(module.GetAttr("format_report").Invoke(results).As<string>());
+        }
+    }
+}
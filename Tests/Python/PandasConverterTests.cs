@@ -408,6 +408,55 @@ namespace QuantConnect.Tests.Python
             }
         }
 
+        [Test]
+        public void HandlesTypedColumns()
+        {
+            var converter = new PandasConverter();
+            var symbol = Symbols.SPY;
+            var time = new DateTime(2024, 1, 2, 9, 30, 0);
+
+            var rawBars = Enumerable
+                .Range(0, 10)
+                .Select(i => new TradeBar(time.AddMinutes(i), symbol, i + 101m, i + 102m, i + 100m, i + 101m, 1000m + i))
+                .ToArray();
+            var nullableValues = Enumerable
+                .Range(0, 10)
+                .Select(i => new NullableValueData
+                {
+                    Symbol = Symbols.AAPL,
+                    EndTime = time.AddDays(i),
+                    NullableInt = i % 2 == 0 ? i : null,
+                    NullableTime = i % 2 == 0 ? null : time.AddDays(i)
+                })
+                .ToArray();
+
+            dynamic dataFrame = converter.GetDataFrame(rawBars);
+            dynamic nullableDataFrame = converter.GetDataFrame(nullableValues);
+
+            using (Py.GIL())
+            {
+                Assert.AreEqual("float64", dataFrame.close.dtype.name.ToString());
+                Assert.AreEqual("float64", dataFrame.volume.dtype.name.ToString());
+                Assert.AreEqual("datetime64[ns]", dataFrame.index.levels[1].dtype.name.ToString());
+
+                var symbols = dataFrame.index.get_level_values(0);
+                var times = dataFrame.index.get_level_values(1);
+                for (var i = 0; i < rawBars.Length; i++)
+                {
+                    Assert.AreEqual(symbol, symbols[i].AsManagedObject(typeof(Symbol)));
+                    Assert.AreEqual(rawBars[i].EndTime, times[i].AsManagedObject(typeof(DateTime)));
+                    Assert.AreEqual(rawBars[i].Close, dataFrame.close.iloc[i].AsManagedObject(typeof(decimal)));
+                    Assert.AreEqual(rawBars[i].Volume, dataFrame.volume.iloc[i].AsManagedObject(typeof(decimal)));
+                }
+
+                // integers and date times with missing values are float64 and datetime64 columns, as pandas infers them
+                Assert.AreEqual("float64", nullableDataFrame.nullableint.dtype.name.ToString());
+                Assert.AreEqual("datetime64[ns]", nullableDataFrame.nullabletime.dtype.name.ToString());
+                Assert.AreEqual(5, nullableDataFrame.nullableint.isna().sum().AsManagedObject(typeof(int)));
+                Assert.AreEqual(5, nullableDataFrame.nullabletime.isna().sum().AsManagedObject(typeof(int)));
+            }
+        }
+
         /// <summary>
         /// Specific issues for symbol LOW, reference GH issue #4886
         /// </summary>
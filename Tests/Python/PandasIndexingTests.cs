@@ -74,6 +74,26 @@ namespace QuantConnect.Tests.Python
             }
         }
 
+        [Test]
+        public void MappedTickersFollowSymbolCacheChanges()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_mapped_tickers_follow_symbol_cache_changes();
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
+        [Test]
+        public void RemappingCanBeScopedToLeanFrames()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_scope_to_lean_frames();
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
         [Test]
         public void ExpectedException()
         {
@@ -68,3 +68,24 @@ class PandasDataFrameTests():
             return True
         except:
             return False
+
+    def test_mapped_tickers_follow_symbol_cache_changes(self):
+        # The mapper caches the tickers lookups, new mappings should still be used
+        ticker = 'PANDAS_MAPPER_TICKER'
+        df = pd.DataFrame({'close': [1.0]}, index=pd.Index([self.aapl], name='symbol'))
+        found_before = ticker in df.index
+        SymbolCache.Set(ticker, self.aapl)
+        try:
+            return not found_before and ticker in df.index and df.loc[ticker]['close'] == 1
+        finally:
+            SymbolCache.TryRemove(ticker)
+
+    def test_scope_to_lean_frames(self):
+        import PandasMapper
+        PandasMapper.scope_to_lean_frames()
+        try:
+            # Frames without a symbol level are not remapped
+            df = pd.DataFrame({'close': [1.0]}, index=pd.Index([self.spy]))
+            return 'SPY' not in df.index and len(self.spydf.loc['SPY']) > 0
+        finally:
+            PandasMapper.scope_to_lean_frames(False)
@@ -0,0 +1,80 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.IO;
+using System.Linq;
+using NUnit.Framework;
+using QuantConnect.Report;
+
+namespace QuantConnect.Tests.Report
+{
+    [TestFixture]
+    public class ReportBatchTests
+    {
+        private string _folder;
+
+        [SetUp]
+        public void SetUp()
+        {
+            _folder = Path.Combine(Path.GetTempPath(), Guid.NewGuid().ToString());
+            Directory.CreateDirectory(_folder);
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            Directory.Delete(_folder, true);
+        }
+
+        [Test]
+        public void GetBacktestFilesSkipsTheLiveResultsAndTheFilesWrittenByTheReport()
+        {
+            foreach (var name in new[] { "B.json", "A.json", "A-live.json", "A-LIVE.json", "A-portfolio.json",
+                QuantConnect.Report.Report.StatisticsFileName, "A.html", "notes.txt" })
+            {
+                File.WriteAllText(Path.Combine(_folder, name), "{}");
+            }
+
+            var files = ReportBatch.GetBacktestFiles(_folder).Select(Path.GetFileName).ToList();
+
+            CollectionAssert.AreEqual(new[] { "A.json", "B.json" }, files);
+        }
+
+        [Test]
+        public void RunGeneratesTheReportOfEachBacktest()
+        {
+            var backtest = Path.Combine("TestData", "test_report_data.json");
+            File.Copy(backtest, Path.Combine(_folder, "A.json"));
+            File.Copy(backtest, Path.Combine(_folder, "B.json"));
+            // the failed reports are logged and skipped
+            File.WriteAllText(Path.Combine(_folder, "C.json"), "not json");
+            File.WriteAllText(Path.Combine(_folder, "A-portfolio.json"), "not json");
+            var destination = Path.Combine(_folder, "reports");
+
+            var elapsed = ReportBatch.Run(_folder, destination, 2);
+
+            CollectionAssert.AreEquivalent(new[] { "A", "B" }, elapsed.Keys);
+            foreach (var name in elapsed.Keys)
+            {
+                var html = File.ReadAllText(Path.Combine(destination, name + ".html"));
+                Assert.IsNotEmpty(html);
+                StringAssert.Contains("data:image/", html);
+            }
+            Assert.IsFalse(File.Exists(Path.Combine(destination, "C.html")));
+            Assert.IsFalse(File.Exists(Path.Combine(destination, "A-portfolio.html")));
+        }
+    }
+}
@@ -18,6 +18,7 @@ using System;
 using System.IO;
 using System.Collections.Generic;
 using System.Linq;
+using System.Threading.Tasks;
 using Python.Runtime;
 using QuantConnect.Packets;
 using QuantConnect.Report;
@@ -51,6 +52,27 @@ namespace QuantConnect.Tests.Report
             Assert.IsNotEmpty(html);
         }
 
+        [Test]
+        public void ConcurrentReportsRenderTheSameCharts()
+        {
+            var backtestResult = GetBacktestResult();
+            var expected = new QuantConnect.Report.Report("Report", "Report", "v1.0.0", backtestResult, (LiveResult)null);
+            expected.Compile(out var expectedHtml, out _);
+
+            // the reports share the pyplot global state, the chart elements render one at a time
+            var htmls = new string[4];
+            Parallel.For(0, htmls.Length, new ParallelOptions { MaxDegreeOfParallelism = htmls.Length }, i =>
+            {
+                var report = new QuantConnect.Report.Report("Report", "Report", "v1.0.0", GetBacktestResult(), (LiveResult)null);
+                report.Compile(out htmls[i], out _);
+            });
+
+            foreach (var html in htmls)
+            {
+                Assert.AreEqual(expectedHtml, html);
+            }
+        }
+
         [Test]
         public void ReportChartsColorMapWorksForEverySecurityType()
         {
@@ -76,6 +98,101 @@ namespace QuantConnect.Tests.Report
             }
         }
 
+        [Test]
+        public void PooledChartsMatchTheChartsRenderedInProcess()
+        {
+            var time = Enumerable.Range(0, 2000).Select(i => new DateTime(2012, 10, 1).AddDays(i)).ToList();
+            var equity = time.Select((_, i) => 100 + Math.Sin(i / 50d) * 10).ToList();
+            var benchmark = time.Select((_, i) => 100 + i / 100d).ToList();
+
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(), @"
+from ReportCharts import ReportCharts
+from concurrent.futures import ThreadPoolExecutor
+
+def test(data, live_data):
+    charts = ReportCharts(100)
+    pool = ReportCharts(100, 'png', -1, 2)
+    try:
+        if pool.workers != 2:
+            return False
+        expected = charts.GetCumulativeReturns(data, live_data)
+        # the .NET lists are converted before being sent to the worker processes
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda _: pool.GetCumulativeReturns(data, live_data), range(4)))
+        allocation = [['SPY', 'AAPL'], [0.6, 0.4]]
+        return (all(result == expected for result in results)
+            and pool.GetAssetAllocation(allocation, [[], []]) == charts.GetAssetAllocation(allocation, [[], []]))
+    finally:
+        pool.close()");
+
+                using var data = new PyList(new PyObject[] { time.ToPython(), equity.ToPython(), time.ToPython(), benchmark.ToPython() });
+                using var liveData = new PyList(new PyObject[] { new List<DateTime>().ToPython(), new List<double>().ToPython(), new List<DateTime>().ToPython(), new List<double>().ToPython() });
+                Assert.IsTrue(module.GetAttr("test").Invoke(data, liveData).As<bool>());
+            }
+        }
+
+        [TestCase(100000, -1)]
+        [TestCase(100000, 1000)]
+        [TestCase(500, 1000)]
+        public void DecimationKeepsTheEndsAndTheExtremesOfTheSeries(int count, int maxPoints)
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(), @"
+import numpy as np
+from ReportCharts import ReportCharts
+
+def test(count, max_points):
+    charts = ReportCharts(100, 'png', max_points)
+    time = list(range(count))
+    values = np.cumsum(np.random.default_rng(0).normal(size=count)).tolist()
+    values[count // 2] = np.nan
+    decimated_time, decimated_values = charts.decimate(time, values, width=11.5)
+
+    limit = count if max_points == 0 else (max_points if max_points > 0 else 2 * 11.5 * 100)
+    return (len(decimated_time) <= limit + 3 and decimated_time == sorted(decimated_time)
+        and decimated_time[0] == 0 and decimated_time[-1] == count - 1
+        and np.nanmin(decimated_values) == np.nanmin(values) and np.nanmax(decimated_values) == np.nanmax(values)
+        and all(values[t] == v or np.isnan(v) for t, v in zip(decimated_time, decimated_values)))");
+
+                Assert.IsTrue(module.GetAttr("test").Invoke(count.ToPython(), maxPoints.ToPython()).As<bool>());
+            }
+        }
+
+        [TestCase(1)]
+        [TestCase(2)]
+        [TestCase(3)]
+        public void DecimationKeepsTheGapsOfTheSeries(int seed)
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(), @"
+import numpy as np
+from ReportCharts import ReportCharts
+
+def test(seed):
+    charts = ReportCharts(100, 'png', 1000)
+    random = np.random.default_rng(seed)
+    count = 100000
+    values = np.cumsum(random.normal(size=count))
+    # gaps far apart from each other, each bucket of the decimation holds at most one of them
+    for start in random.choice(np.arange(1, count // 1000 - 1), 20, replace=False) * 1000:
+        values[start:start + int(random.integers(1, 500))] = np.nan
+    decimated_time, decimated_values = charts.decimate(range(count), values.tolist(), width=11.5)
+
+    is_gap = np.isnan(values)
+    is_decimated_gap = np.isnan(decimated_values)
+    gaps = np.count_nonzero(is_decimated_gap & ~np.append(False, is_decimated_gap[:-1]))
+    # the line between two consecutive points with values never crosses a gap
+    return gaps == 20 and not any(is_gap[start:end].any() for start, end, start_gap, end_gap
+        in zip(decimated_time[:-1], decimated_time[1:], is_decimated_gap[:-1], is_decimated_gap[1:]) if not start_gap and not end_gap)");
+
+                Assert.IsTrue(module.GetAttr("test").Invoke(seed.ToPython()).As<bool>());
+            }
+        }
+
         [TestCaseSource(nameof(CurrencySymbols))]
         public void EstimatedCapacityIsParsedRegardlessOfTheCurrency(string currencySymbol)
         {
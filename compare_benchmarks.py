@@ -1,28 +1,93 @@
 import sys
 import json
+import argparse
+import statistics
+from math import comb, erf, sqrt
+from itertools import combinations
 
-print(f'Will compare benchmark results {sys.argv[2]} against reference {sys.argv[1]}')
+def parseArguments():
+	parser = argparse.ArgumentParser(description="Compares benchmark results against a reference, failing on statistically significant regressions")
+	parser.add_argument("reference", help="Reference benchmark_results.json")
+	parser.add_argument("new", help="New benchmark_results.json")
+	parser.add_argument("--alpha", type=float, default=0.05, help="Significance level of the one-sided Mann-Whitney U test")
+	parser.add_argument("--min-effect", type=float, default=0.03,
+		help="Minimum relative drop of the median data points per second reported as a regression, even when significant")
+	parser.add_argument("--output", default=None, help="Optional path of the json comparison")
+	return parser.parse_args()
 
-referenceBenchmark = json.load(open(sys.argv[1]))
-newBenchmark = json.load(open(sys.argv[2]))
+def getSamples(result):
+	'''Gets the data points per second samples of a benchmark, 'samples' holds them in both the current and the previous format'''
+	return [x for x in result.get("samples", []) if x is not None]
 
-failed = False
-for language in ["CSharp", "Python"]:
+def mannWhitneyGreater(reference, new):
+	'''One-sided Mann-Whitney U test p-value of the reference samples being stochastically greater than the new samples.
+	The p-value is exact, enumerating the assignments of the pooled samples, when there are few of them'''
+	def uStatistic(first, second):
+		return sum(1 if x > y else 0.5 if x == y else 0 for x in first for y in second)
 
-	for key, value in referenceBenchmark[language].items():
-		if key not in newBenchmark[language]:
-			failed = True
-			print(f'Performance benchmark {key} language {language} was not found in new results')
-			continue
-		newResult = newBenchmark[language][key]
+	n, m = len(reference), len(new)
+	observed = uStatistic(reference, new)
 
-		# allow 5% noise
-		expectedValue = value["average-dps"] * 0.90
-		if expectedValue > newResult["average-dps"]:
-			failed = True
-			print(f'Performance benchmark Failed for algorithm {key} language {language}. Was {str(newResult["average-dps"])} expected as low as {str(expectedValue)}')
-		else:
-			print(f'Performance benchmark Passed for algorithm {key} language {language}. Was {str(newResult["average-dps"])} expected as low as {str(expectedValue)}')
+	if comb(n + m, n) <= 100000:
+		pooled = reference + new
+		indexes = range(n + m)
+		count = total = 0
+		for selected in combinations(indexes, n):
+			selected = set(selected)
+			first = [pooled[i] for i in indexes if i in selected]
+			second = [pooled[i] for i in indexes if i not in selected]
+			count += uStatistic(first, second) >= observed
+			total += 1
+		return count / total
 
-if failed:
-	exit(1)
+	# normal approximation with continuity correction, without the tie correction
+	mean = n * m / 2
+	deviation = sqrt(n * m * (n + m + 1) / 12)
+	z = (observed - mean - 0.5) / deviation
+	return 0.5 * (1 - erf(z / sqrt(2)))
+
+def compare(referenceResult, newResult, alpha, minEffect):
+	reference, new = getSamples(referenceResult), getSamples(newResult)
+	referenceMedian, newMedian = statistics.median(reference), statistics.median(new)
+	change = (newMedian - referenceMedian) / referenceMedian if referenceMedian else 0
+	pValue = mannWhitneyGreater(reference, new)
+
+	# a single sample on either side can't be tested, it falls back to the relative change
+	regression = change < -minEffect and (pValue < alpha or min(len(reference), len(new)) < 2)
+	return { "reference-median-dps": referenceMedian, "new-median-dps": newMedian, "change": change, "p-value": pValue, "regression": regression }
+
+def main():
+	args = parseArguments()
+	print(f'Will compare benchmark results {args.new} against reference {args.reference}')
+
+	referenceBenchmark = json.load(open(args.reference))
+	newBenchmark = json.load(open(args.new))
+
+	failed = False
+	comparison = {}
+	for language in ["CSharp", "Python"]:
+
+		comparison[language] = {}
+		for key, value in referenceBenchmark.get(language, {}).items():
+			if key not in newBenchmark.get(language, {}):
+				failed = True
+				print(f'Performance benchmark {key} language {language} was not found in new results')
+				continue
+
+			result = compare(value, newBenchmark[language][key], args.alpha, args.min_effect)
+			comparison[language][key] = result
+
+			status = "Failed" if result["regression"] else "Passed"
+			failed |= result["regression"]
+			print(f'Performance benchmark {status} for algorithm {key} language {language}. Median {result["new-median-dps"]:.1f}k dps'
+				f' against {result["reference-median-dps"]:.1f}k ({result["change"]:+.1%}, p-value {result["p-value"]:.3f})')
+
+	if args.output:
+		with open(args.output, "w") as outfile:
+			json.dump(comparison, outfile, indent=1)
+
+	if failed:
+		exit(1)
+
+if __name__ == "__main__":
+	main()
@@ -2,64 +2,297 @@ import os
 import re
 import sys
 import json
+import time
+import shutil
+import argparse
+import tempfile
 import subprocess
 import statistics
+from math import comb
+from queue import Queue
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-dataPath = '../../../Data'
-if len(sys.argv) > 1:
-	dataPath = sys.argv[1]
-print(f'Using data path {dataPath}')
+# lines of the algorithm log the measurements are read from
+METRIC_PATTERNS = {
+	"dps": r"(\d+(?:\.\d+)?)k data points per second",
+	"data-points": r"Processing total of ([\d,]+) data points",
+	"length": r" completed in (\d+(?:\.\d+)?) seconds",
+}
+# the initialize and history timings are logged by the engine when the performance tracking is enabled
+PHASE_PATTERNS = {
+	"initialize": r" initialized in (\d+(?:\.\d+)?) seconds",
+	"history": r"History requests took (\d+(?:\.\d+)?) seconds",
+}
+# the time spent in each data loop phase, by the names of the PerformanceTrackingTool summary.
+# The data loop phase is their total
+SUMMARY_PATTERN = r"PerformanceTrackingTool\.Summary\(\): (.*)"
+SUMMARY_PHASES = {
+	"data-subscription": "DataSubscription",
+	"slice-creation": "SliceCreation",
+	"universe-selection": "Selection",
+	"schedule": "Schedule",
+	"on-data": "OnData",
+	"consolidators": "Consolidators",
+	"securities": "Securities",
+	"transactions": "Transactions",
+	"splits-dividends-delisting": "SplitsDividendsDelisting",
+}
 
-results = {}
-for baseDirectory in ["Algorithm.CSharp/Benchmarks", "Algorithm.Python/Benchmarks"]:
+def parseArguments():
+	parser = argparse.ArgumentParser(description="Runs the Lean benchmark algorithms and writes their statistics to a json file")
+	parser.add_argument("dataPath", nargs="?", default="../../../Data", help="Data folder used by the benchmarks")
+	parser.add_argument("--warmup", type=int, default=1, help="Runs of each benchmark discarded before measuring")
+	parser.add_argument("--iterations", type=int, default=5, help="Measured runs of each benchmark")
+	parser.add_argument("--confidence", type=float, default=0.95, help="Confidence level of the median intervals")
+	parser.add_argument("--languages", nargs="+", default=["CSharp", "Python"], choices=["CSharp", "Python"])
+	parser.add_argument("--filter", default=None, help="Regular expression the benchmark names have to match")
+	parser.add_argument("--launcher-directory", default="./Launcher/bin/Release", help="Directory of QuantConnect.Lean.Launcher.dll")
+	parser.add_argument("--performance-sample-period", default="00:00:00",
+		help="Performance tracking sample period of the algorithms, used to time the phases, e.g. 365.00:00:00. "
+			"Disabled by default, its timers slow down the data loop and bias the data points per second")
+	parser.add_argument("--concurrency", type=int, default=1, help="Maximum number of benchmark runs executed at the same time")
+	parser.add_argument("--cpus-per-run", type=int, default=0,
+		help="Cores each run is pinned to with taskset, so concurrent runs don't compete for them. Zero disables the pinning")
+	parser.add_argument("--work-directory", default=None, help="Directory of the working directories of the runs, a temporary directory by default")
+	parser.add_argument("--keep-work-directories", action="store_true", help="Keep the working directories, with the logs, of the runs")
+	parser.add_argument("--output", default="benchmark_results.json", help="Path of the json results")
+	return parser.parse_args()
 
-	language = baseDirectory[len("Algorithm") + 1:baseDirectory.index("/")]
-	resultsPerLanguage = {}
-
-	for algorithmFile in sorted(os.listdir(baseDirectory)):
-		if algorithmFile.endswith(("py", "cs")):
+def getBenchmarks(args):
+	launcherDirectory = os.path.abspath(args.launcher_directory)
+	for language in args.languages:
+		baseDirectory = f"Algorithm.{language}/Benchmarks"
+		for algorithmFile in sorted(os.listdir(baseDirectory)):
+			if not algorithmFile.endswith(("py", "cs")):
+				continue
 
 			algorithmName = Path(algorithmFile).stem
-
 			if "Fine" in algorithmName:
 				# we skip fundamental benchmarks for now
 				continue
-			algorithmLocation = "QuantConnect.Algorithm.CSharp.dll" if language == "CSharp" else os.path.join("../../../", baseDirectory, algorithmFile)
-			print(f'Start running algorithm {algorithmName} language {language}...')
-
-			dataPointsPerSecond = []
-			benchmarkLengths = []
-			for x in range(1, 3):
-
-				subprocess.run(["dotnet", "./QuantConnect.Lean.Launcher.dll",
-					"--data-folder " + dataPath,
-					"--algorithm-language " + language,
-					"--algorithm-type-name " + algorithmName,
-					"--algorithm-location " + algorithmLocation,
-					"--log-handler ConsoleErrorLogHandler",
-					"--close-automatically true"],
-					cwd="./Launcher/bin/Release",
-					stdout=subprocess.DEVNULL,
-					stderr=subprocess.DEVNULL)
-				if x == 1:
-					# skip first run
-					continue
-
-				algorithmLogs = os.path.join("./Launcher/bin/Release", algorithmName + "-log.txt")
-				file = open(algorithmLogs, 'r')
-				for line in file.readlines():
-					for match in re.findall(r"(\d+)k data points per second", line):
-						dataPointsPerSecond.append(int(match))
-					for match in re.findall(r" completed in (\d+)", line):
-						benchmarkLengths.append(int(match))
-
-			averageDps = statistics.mean(dataPointsPerSecond)
-			averageLength = statistics.mean(benchmarkLengths)
-			resultsPerLanguage[algorithmName] = { "average-dps": averageDps, "samples": dataPointsPerSecond, "average-length": averageLength }
-			print(f'Performance for {algorithmName} language {language} avg dps: {averageDps}k samples: [{",".join(str(x) for x in dataPointsPerSecond)}] avg length {averageLength} sec')
-
-	results[language] = resultsPerLanguage
-
-with open("benchmark_results.json", "w") as outfile:
-	json.dump(results, outfile)
+			if args.filter and not re.search(args.filter, algorithmName):
+				continue
+
+			# absolute paths, the runs don't use the launcher directory as working directory
+			algorithmLocation = os.path.join(launcherDirectory, "QuantConnect.Algorithm.CSharp.dll") if language == "CSharp" \
+				else os.path.abspath(os.path.join(baseDirectory, algorithmFile))
+			yield language, algorithmName, algorithmLocation
+
+def writeConfiguration(args, directory):
+	'''Writes a copy of the launcher configuration storing the results in the given directory, with the performance tracking
+	sample period of the arguments. Unknown keys are ignored by the engine, so the same configuration works for older builds'''
+	launcherDirectory = os.path.abspath(args.launcher_directory)
+	with open(os.path.join(launcherDirectory, "config.json")) as file:
+		configuration = file.read()
+
+	overrides = {
+		"results-destination-folder": os.path.abspath(directory),
+		"object-store-root": os.path.join(os.path.abspath(directory), "storage"),
+		# the python modules of the launcher are found through the working directory by default
+		"python-additional-paths": [launcherDirectory],
+		"performance-sample-period": args.performance_sample_period
+	}
+	# the configuration has comments, so the overrides are appended before its closing brace instead of parsing it.
+	# The engine keeps the last value of a duplicated key, so they replace the keys the configuration already has
+	end = configuration.rindex("}")
+	lines = [line.strip() for line in configuration[:end].splitlines()]
+	last = next((line for line in reversed(lines) if line and not line.startswith("//")), "{")
+	separator = "" if last.endswith((",", "{")) else ","
+	overrides = ",".join(f"\n  {json.dumps(key)}: {json.dumps(value)}" for key, value in overrides.items())
+	configuration = configuration[:end].rstrip() + separator + overrides + "\n" + configuration[end:]
+
+	path = os.path.join(directory, "config.json")
+	with open(path, "w") as file:
+		file.write(configuration)
+	return os.path.abspath(path)
+
+def runBenchmark(args, language, algorithmName, algorithmLocation, directory, cores=None):
+	'''Runs the benchmark once in the given working directory, optionally pinned to the given cores,
+	returning its wall time, peak resident memory and the measurements of its log'''
+	configuration = writeConfiguration(args, directory)
+	command = ["dotnet", os.path.join(os.path.abspath(args.launcher_directory), "QuantConnect.Lean.Launcher.dll"),
+		"--config", configuration,
+		"--data-folder " + os.path.abspath(os.path.join(args.launcher_directory, args.dataPath)),
+		"--algorithm-language " + language,
+		"--algorithm-type-name " + algorithmName,
+		"--algorithm-location " + algorithmLocation,
+		"--log-handler ConsoleErrorLogHandler",
+		"--close-automatically true"]
+	if cores:
+		# taskset execs the launcher, so the process waited for is still the launcher
+		command = ["taskset", "--cpu-list", ",".join(str(core) for core in cores)] + command
+
+	with open(os.path.join(directory, "console.txt"), "w") as console:
+		start = time.perf_counter()
+		process = subprocess.Popen(command, cwd=directory, stdout=console, stderr=subprocess.STDOUT)
+
+		peakRss = None
+		if hasattr(os, "wait4"):
+			_, status, usage = os.wait4(process.pid, 0)
+			process.returncode = os.waitstatus_to_exitcode(status)
+			# kilobytes in linux, bytes in macOS
+			peakRss = usage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+		else:
+			process.wait()
+		wallTime = time.perf_counter() - start
+
+	result = { "wall-time": wallTime, "peak-rss-mb": peakRss, "exit-code": process.returncode, "phases": {} }
+
+	logFile = os.path.join(directory, algorithmName + "-log.txt")
+	if not os.path.exists(logFile):
+		return result
+
+	with open(logFile) as file:
+		log = file.read()
+	for key, pattern in METRIC_PATTERNS.items():
+		match = re.search(pattern, log)
+		if match:
+			result[key] = float(match.group(1).replace(",", ""))
+	for key, pattern in PHASE_PATTERNS.items():
+		match = re.search(pattern, log)
+		if match:
+			result["phases"][key] = float(match.group(1))
+
+	summary = re.search(SUMMARY_PATTERN, log)
+	if summary:
+		dataLoop = 0
+		for key, name in SUMMARY_PHASES.items():
+			match = re.search(rf"(?:^| ){name}: (\d+(?:\.\d+)?)s\.", summary.group(1))
+			if match:
+				result["phases"][key] = float(match.group(1))
+				dataLoop += result["phases"][key]
+		result["phases"]["data-loop"] = dataLoop
+	return result
+
+def medianConfidenceInterval(samples, confidence):
+	'''Distribution free confidence interval of the median, between the order statistics whose
+	binomial coverage is the smallest that reaches the confidence level, or the sample range if none does'''
+	values = sorted(samples)
+	n = len(values)
+	lower = 0
+	for k in range(1, (n + 1) // 2):
+		coverage = sum(comb(n, i) for i in range(k + 1, n - k)) / 2 ** n
+		if coverage < confidence:
+			break
+		lower = k
+	return [values[lower], values[n - 1 - lower]]
+
+def summarize(samples, confidence):
+	samples = [x for x in samples if x is not None]
+	if not samples:
+		return None
+	return {
+		"median": statistics.median(samples),
+		"ci": medianConfidenceInterval(samples, confidence),
+		"mean": statistics.mean(samples),
+		"stdev": statistics.stdev(samples) if len(samples) > 1 else 0,
+		"samples": samples
+	}
+
+def summarizeRuns(runs, confidence):
+	summary = {}
+	for key in ["dps", "wall-time", "peak-rss-mb", "length", "data-points"]:
+		summary[key] = summarize([run.get(key) for run in runs], confidence)
+
+	phases = sorted({ phase for run in runs for phase in run["phases"] })
+	summary["phases"] = { phase: summarize([run["phases"].get(phase) for run in runs], confidence) for phase in phases }
+	return summary
+
+def formatStatistic(statistic, unit="", precision=1):
+	if statistic is None:
+		return "n/a"
+	low, high = statistic["ci"]
+	return f"{statistic['median']:.{precision}f}{unit} [{low:.{precision}f}, {high:.{precision}f}]"
+
+def getCoreSets(args):
+	'''Gets the disjoint sets of cores the concurrent runs are pinned to, or a None set per run when the pinning is disabled'''
+	concurrency = max(1, args.concurrency)
+	if args.cpus_per_run <= 0:
+		return [None] * concurrency
+	if not hasattr(os, "sched_getaffinity") or shutil.which("taskset") is None:
+		print('CPU pinning requires taskset, the runs will not be pinned')
+		return [None] * concurrency
+
+	cores = sorted(os.sched_getaffinity(0))
+	coreSets = [cores[i:i + args.cpus_per_run] for i in range(0, len(cores) - args.cpus_per_run + 1, args.cpus_per_run)]
+	if len(coreSets) < concurrency:
+		print(f'{len(cores)} cores available, running {len(coreSets)} benchmarks at a time with {args.cpus_per_run} cores each')
+	return coreSets[:concurrency] or [None]
+
+def runAll(args, tasks, coreSets, workDirectory):
+	'''Runs the (language, algorithmName, algorithmLocation, iteration) tasks, at most one per set of cores at a time,
+	each in its own working directory'''
+	freeCoreSets = Queue()
+	for cores in coreSets:
+		freeCoreSets.put(cores)
+
+	def run(task):
+		language, algorithmName, algorithmLocation, iteration = task
+		cores = freeCoreSets.get()
+		directory = tempfile.mkdtemp(prefix=f"{algorithmName}-{language}-{iteration}-", dir=workDirectory)
+		try:
+			result = runBenchmark(args, language, algorithmName, algorithmLocation, directory, cores)
+		finally:
+			freeCoreSets.put(cores)
+			if not args.keep_work_directories:
+				shutil.rmtree(directory, ignore_errors=True)
+
+		if result["exit-code"] != 0 or "dps" not in result:
+			print(f'Run {iteration} of {algorithmName} language {language} failed with exit code {result["exit-code"]}')
+		return task, result
+
+	with ThreadPoolExecutor(max_workers=len(coreSets)) as executor:
+		return list(executor.map(run, tasks))
+
+def main():
+	args = parseArguments()
+	print(f'Using data path {args.dataPath}. {args.warmup} warmup and {args.iterations} measured runs per benchmark')
+
+	benchmarks = list(getBenchmarks(args))
+	coreSets = getCoreSets(args)
+	print(f'Running {len(benchmarks)} benchmarks, {len(coreSets)} at a time')
+
+	workDirectory = args.work_directory or tempfile.mkdtemp(prefix="benchmarks-")
+	os.makedirs(workDirectory, exist_ok=True)
+
+	# the warmup runs finish before the measured ones start, which go round robin
+	# through the benchmarks so that a slow period of the machine doesn't affect only one of them
+	runAll(args, [benchmark + (iteration,) for iteration in range(args.warmup) for benchmark in benchmarks], coreSets, workDirectory)
+	measured = runAll(args, [benchmark + (args.warmup + iteration,) for iteration in range(args.iterations) for benchmark in benchmarks],
+		coreSets, workDirectory)
+
+	if not args.work_directory and not args.keep_work_directories:
+		shutil.rmtree(workDirectory, ignore_errors=True)
+
+	results = { language: {} for language in args.languages }
+	for language, algorithmName, algorithmLocation in benchmarks:
+		runs = [result for task, result in measured if task[:2] == (language, algorithmName) and result["exit-code"] == 0 and "dps" in result]
+		if not runs:
+			print(f'Performance for {algorithmName} language {language} unavailable, all the runs failed')
+			continue
+
+		summary = summarizeRuns(runs, args.confidence)
+		# 'average-dps', 'samples' and 'average-length' are kept for the tools reading the previous format
+		results[language][algorithmName] = {
+			"average-dps": summary["dps"]["mean"],
+			"samples": summary["dps"]["samples"],
+			"average-length": summary["length"]["mean"] if summary["length"] else None,
+			"median-dps": summary["dps"]["median"],
+			"confidence": args.confidence,
+			"summary": summary,
+			"runs": runs
+		}
+
+		phases = ", ".join(f"{phase} {formatStatistic(statistic, 's', 2)}" for phase, statistic in summary["phases"].items())
+		# the phases are timed by the performance tracking, which is disabled by default
+		phases = f"Phases: {phases}" if phases else "Phases not collected, set --performance-sample-period to time them"
+		print(f'Performance for {algorithmName} language {language}: dps {formatStatistic(summary["dps"], "k")}'
+			f' wall time {formatStatistic(summary["wall-time"], "s", 2)} peak rss {formatStatistic(summary["peak-rss-mb"], "MB", 0)}'
+			f' {len(runs)} runs. {phases}')
+
+	with open(args.output, "w") as outfile:
+		json.dump(results, outfile, indent=1)
+
+if __name__ == "__main__":
+	main()